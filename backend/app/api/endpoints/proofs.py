@@ -1,14 +1,16 @@
 # [>] ProofBench Backend - Proof API Endpoints
 # RESTful API for proof submission and verification
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 
 from app import schemas, crud
 from app.db.session import get_db_session
 from app.core.security import api_key_auth
-from app.services.verification import run_proof_verification
+from app.services.dedupe import deduplicate
+from app.services.job_queue import notify_workers
+from app.services.revalidation import revalidate
 
 router = APIRouter()
 
@@ -18,11 +20,10 @@ router = APIRouter()
     response_model=schemas.ProofResponse,
     status_code=status.HTTP_202_ACCEPTED,
     summary="Submit a new proof for verification",
-    description="Submit a mathematical proof for verification. Returns immediately with proof ID and 'pending' status. Verification runs in background."
+    description="Submit a mathematical proof for verification. Returns immediately with proof ID and 'pending' status. Verification is queued for a worker."
 )
 async def submit_proof(
     proof_in: schemas.ProofCreate,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db_session),
     api_key: str = Depends(api_key_auth)
 ):
@@ -32,9 +33,13 @@ async def submit_proof(
     **Flow**:
     1. Creates proof record in database with 'pending' status
     2. Returns immediately with proof ID (HTTP 202 Accepted)
-    3. Starts background verification task
+    3. A queue worker claims the pending proof and verifies it
     4. Client can poll GET /proofs/{id} to check status
 
+    A proof identical to an earlier one (same fingerprint) may instead be
+    returned 'completed' with that proof's result, or wait for its
+    verification (settings.DEDUPE_POLICY); duplicate_of names that proof.
+
     **Args**:
     - **domain**: Mathematical domain (algebra, topology, logic)
     - **steps**: List of proof steps with claims and equations
@@ -49,12 +54,13 @@ async def submit_proof(
     # 1. Create proof record in database
     db_proof = await crud.proof.create_with_steps(db=db, obj_in=proof_in)
 
-    # 2. Schedule background verification task
-    background_tasks.add_task(
-        run_proof_verification,
-        proof_id=db_proof.id,
-        db_url=db.bind.url  # Pass DB URL for background task to create its own session
-    )
+    # 2. Identical earlier proof: reuse its result or wait for its verification
+    if await deduplicate(db, db_proof):
+        db.expire_all()
+        return await crud.proof.get(db=db, id=db_proof.id)
+
+    # 3. The pending proof is the queued job; wake the embedded worker
+    notify_workers()
 
     return db_proof
 
@@ -151,6 +157,63 @@ async def list_proofs(
     )
 
 
+@router.post(
+    "/{proof_id}/revalidate",
+    response_model=schemas.ProofResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Re-verify an edited proof",
+    description="Replace the steps of a finished proof and queue it for verification. Only changed steps and the steps depending on them are re-evaluated."
+)
+async def revalidate_proof(
+    proof_id: int,
+    revalidate_in: schemas.ProofRevalidate,
+    db: AsyncSession = Depends(get_db_session),
+    api_key: str = Depends(api_key_auth)
+):
+    """
+    Re-verify a proof with an edited list of steps.
+
+    **Flow**:
+    1. Steps are compared with the stored ones by content fingerprint
+    2. Unchanged steps whose dependencies are unchanged keep their stored
+       outcome; the rest are re-evaluated by a queue worker
+    3. The LII score, confidence interval and coherence are recomputed over
+       all steps when verification completes
+
+    **Args**:
+    - **steps**: Complete replacement list of proof steps
+
+    **Returns**:
+    - Proof entity with the new steps and 'pending' status
+
+    **Errors**:
+    - 404: Proof not found
+    - 409: Proof is still pending or being verified
+    - 403: Invalid API key
+
+    **Authentication**:
+    - Requires valid API key in X-API-Key header
+    """
+    db_proof = await crud.proof.get(db=db, id=proof_id)
+
+    if not db_proof:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Proof with ID {proof_id} not found"
+        )
+
+    if await revalidate(db, db_proof, revalidate_in.steps) is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Proof {proof_id} is still being verified"
+        )
+
+    notify_workers()
+
+    db.expire_all()
+    return await crud.proof.get(db=db, id=proof_id)
+
+
 @router.delete(
     "/{proof_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -204,8 +267,3 @@ async def delete_proof(
 # async def get_proof_feedback(...):
 #     """Get detailed feedback for a proof"""
 #     pass
-
-# @router.post("/{proof_id}/revalidate")
-# async def revalidate_proof(...):
-#     """Re-run verification on existing proof"""
-#     pass
@@ -1,13 +1,20 @@
 # [L] ProofBench Backend - CRUD Operations
 # Database operations for proof entities
 
-from typing import List, Optional
-from sqlalchemy import select, update
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
-from app.models.proof import Proof, ProofStep, ProofResult, ProofStatus
+from app.models.proof import Proof, ProofStep, ProofResult, ProofStatus, ProofStepCheckpoint
 from app.schemas.proof import ProofCreate, ProofStepCreate
+from app.services.fingerprint import proof_fingerprint
+from app.services.scoring import provider_scores
+
+
+# Candidates tried per claim when another worker wins the race for a row
+CLAIM_ATTEMPTS = 5
 
 
 class CRUDProof:
@@ -22,6 +29,8 @@ class CRUDProof:
         """
         Create a new proof with its steps.
 
+        The proof's content fingerprint is stored for duplicate detection.
+
         Args:
             db: Database session
             obj_in: ProofCreate schema with domain and steps
@@ -32,7 +41,8 @@ class CRUDProof:
         # Create proof entity
         db_proof = Proof(
             domain=obj_in.domain,
-            status=ProofStatus.PENDING
+            status=ProofStatus.PENDING,
+            fingerprint=proof_fingerprint(obj_in)
         )
         db.add(db_proof)
         await db.flush()  # Get proof ID without committing
@@ -120,7 +130,8 @@ class CRUDProof:
         db: AsyncSession,
         *,
         proof_id: int,
-        status: str
+        status: str,
+        failure_reason: Optional[str] = None
     ) -> None:
         """
         Update proof status.
@@ -129,14 +140,178 @@ class CRUDProof:
             db: Database session
             proof_id: Proof ID
             status: New status (pending, processing, completed, failed)
+            failure_reason: Reason recorded with a 'failed' status
         """
         await db.execute(
             update(Proof)
             .where(Proof.id == proof_id)
-            .values(status=status)
+            .values(status=status, failure_reason=failure_reason)
         )
         await db.commit()
 
+    async def claim_next(
+        self,
+        db: AsyncSession,
+        *,
+        owner: str,
+        lease_seconds: float
+    ) -> Optional[int]:
+        """
+        Claim the oldest pending proof for a queue worker.
+
+        The claim increments the proof's attempt counter and holds a lease
+        that the worker must renew with heartbeat().
+
+        The candidate row is selected with FOR UPDATE SKIP LOCKED, so
+        PostgreSQL workers never block on or double-claim a row. Dialects
+        without row locks (SQLite) ignore that clause; there the conditional
+        UPDATE acts as a compare-and-swap and a lost race moves on to the
+        next candidate.
+
+        Args:
+            db: Database session
+            owner: Worker ID recorded as the lease owner
+            lease_seconds: Lease duration
+
+        Returns:
+            Optional[int]: Claimed proof ID, or None if the queue is empty
+        """
+        for _ in range(CLAIM_ATTEMPTS):
+            result = await db.execute(
+                select(Proof.id)
+                .where(Proof.status == ProofStatus.PENDING)
+                .order_by(Proof.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            proof_id = result.scalar_one_or_none()
+            if proof_id is None:
+                await db.commit()
+                return None
+
+            claimed = await db.execute(
+                update(Proof)
+                .where(Proof.id == proof_id, Proof.status == ProofStatus.PENDING)
+                .values(
+                    status=ProofStatus.PROCESSING,
+                    lease_owner=owner,
+                    lease_expires_at=datetime.now(timezone.utc) + timedelta(seconds=lease_seconds),
+                    attempts=Proof.attempts + 1
+                )
+            )
+            await db.commit()
+            if claimed.rowcount == 1:
+                return proof_id
+        return None
+
+    async def heartbeat(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int,
+        owner: str,
+        lease_seconds: float
+    ) -> bool:
+        """
+        Renew a worker's lease on a claimed proof.
+
+        Args:
+            db: Database session
+            proof_id: Proof ID
+            owner: Worker ID that claimed the proof
+            lease_seconds: New lease duration from now
+
+        Returns:
+            bool: False if the lease was lost (expired and swept, or reclaimed)
+        """
+        result = await db.execute(
+            update(Proof)
+            .where(
+                Proof.id == proof_id,
+                Proof.lease_owner == owner,
+                Proof.status == ProofStatus.PROCESSING
+            )
+            .values(lease_expires_at=datetime.now(timezone.utc) + timedelta(seconds=lease_seconds))
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+    async def finish(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int,
+        owner: str,
+        status: str,
+        failure_reason: Optional[str] = None
+    ) -> bool:
+        """
+        Set the final status of a claimed proof and release its lease.
+
+        Args:
+            db: Database session
+            proof_id: Proof ID
+            owner: Worker ID that claimed the proof
+            status: Final status (completed, failed)
+            failure_reason: Reason recorded with a 'failed' status
+
+        Returns:
+            bool: False if the proof is no longer leased by owner
+        """
+        result = await db.execute(
+            update(Proof)
+            .where(Proof.id == proof_id, Proof.lease_owner == owner)
+            .values(
+                status=status,
+                failure_reason=failure_reason,
+                lease_owner=None,
+                lease_expires_at=None
+            )
+        )
+        await db.commit()
+        return result.rowcount == 1
+
+    async def requeue_expired(
+        self,
+        db: AsyncSession,
+        *,
+        max_attempts: int
+    ) -> Tuple[int, int]:
+        """
+        Recover proofs whose worker stopped renewing its lease.
+
+        Proofs with attempts left go back to 'pending'; the rest are marked
+        'failed' with a reason.
+
+        Args:
+            db: Database session
+            max_attempts: Claims allowed per proof
+
+        Returns:
+            Tuple[int, int]: (requeued, failed) proof counts
+        """
+        expired = (
+            (Proof.status == ProofStatus.PROCESSING)
+            & (Proof.lease_expires_at < datetime.now(timezone.utc))
+        )
+        requeued = await db.execute(
+            update(Proof)
+            .where(expired, Proof.attempts < max_attempts)
+            .values(status=ProofStatus.PENDING, lease_owner=None, lease_expires_at=None)
+        )
+        failed = await db.execute(
+            update(Proof)
+            .where(expired, Proof.attempts >= max_attempts)
+            .values(
+                status=ProofStatus.FAILED,
+                failure_reason=f"Worker lease expired on each of {max_attempts} attempts",
+                lease_owner=None,
+                lease_expires_at=None
+            )
+        )
+        await db.commit()
+        return requeued.rowcount, failed.rowcount
+
     async def create_result(
         self,
         db: AsyncSession,
@@ -162,13 +337,391 @@ class CRUDProof:
             confidence_interval=obj_in["confidence_interval"],
             coherence_score=obj_in["coherence_score"],
             step_results=obj_in["step_results"],
-            feedback=obj_in["feedback"]
+            feedback=obj_in["feedback"],
+            scoring_version=obj_in.get("scoring_version")
         )
         db.add(db_result)
         await db.commit()
         await db.refresh(db_result)
         return db_result
 
+    async def get_results_batch(
+        self,
+        db: AsyncSession,
+        *,
+        after_id: int,
+        limit: int,
+        exclude_version: Optional[str] = None
+    ) -> List[Tuple[int, bool, list, list]]:
+        """
+        Get one batch of stored results, in ID order (keyset pagination).
+
+        Args:
+            db: Database session
+            after_id: Only results with a higher ID
+            limit: Maximum number of results
+            exclude_version: Skip results scored with this scoring version
+
+        Returns:
+            List[Tuple[int, bool, list, list]]: (result ID, is_valid,
+                step_results, feedback)
+        """
+        query = (
+            select(ProofResult.id, ProofResult.is_valid, ProofResult.step_results, ProofResult.feedback)
+            .where(ProofResult.id > after_id)
+            .order_by(ProofResult.id)
+            .limit(limit)
+        )
+        if exclude_version is not None:
+            query = query.where(
+                (ProofResult.scoring_version != exclude_version) | ProofResult.scoring_version.is_(None)
+            )
+        return [tuple(row) for row in (await db.execute(query)).all()]
+
+    async def update_scores(
+        self,
+        db: AsyncSession,
+        *,
+        scores: List[dict]
+    ) -> None:
+        """
+        Update the scores of many results in one statement.
+
+        Args:
+            db: Database session
+            scores: Dicts with the result id and the new is_valid, lii_score,
+                confidence_interval, coherence_score, step_results, feedback
+                and scoring_version
+        """
+        if scores:
+            await db.execute(update(ProofResult), scores)
+        await db.commit()
+
+    async def find_duplicate(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int,
+        fingerprint: str,
+        max_result_age: float,
+        include_in_flight: bool
+    ) -> Optional[Proof]:
+        """
+        Find an earlier proof with the same fingerprint whose verification can be reused.
+
+        A completed proof with a result newer than max_result_age seconds is
+        preferred (the most recent one); otherwise, if include_in_flight, the
+        oldest pending or processing proof that is verified itself (not
+        linked to another).
+
+        Args:
+            db: Database session
+            proof_id: The new proof (excluded)
+            fingerprint: Its fingerprint
+            max_result_age: Maximum age of a reused result in seconds
+            include_in_flight: Also consider proofs still being verified
+
+        Returns:
+            Optional[Proof]: The earlier proof, or None
+        """
+        same = (Proof.fingerprint == fingerprint) & (Proof.id != proof_id)
+        result = await db.execute(
+            select(Proof)
+            .join(ProofResult, ProofResult.proof_id == Proof.id)
+            .where(
+                same,
+                Proof.status == ProofStatus.COMPLETED,
+                ProofResult.created_at >= datetime.now(timezone.utc) - timedelta(seconds=max_result_age)
+            )
+            .order_by(ProofResult.created_at.desc())
+            .limit(1)
+        )
+        completed = result.scalar_one_or_none()
+        if completed is not None or not include_in_flight:
+            return completed
+
+        result = await db.execute(
+            select(Proof)
+            .where(
+                same,
+                Proof.status.in_([ProofStatus.PENDING, ProofStatus.PROCESSING]),
+                Proof.duplicate_of.is_(None)
+            )
+            .order_by(Proof.id)
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def copy_result(
+        self,
+        db: AsyncSession,
+        *,
+        source_id: int,
+        target_id: int
+    ) -> bool:
+        """
+        Complete a duplicate proof with a copy of another proof's result.
+
+        Step IDs in the copied step results are mapped to the target's steps
+        (by step index).
+
+        Args:
+            db: Database session
+            source_id: Proof whose result is copied
+            target_id: Duplicate proof to complete
+
+        Returns:
+            bool: False if the source has no result
+        """
+        source = await db.execute(select(ProofResult).where(ProofResult.proof_id == source_id))
+        source_result = source.scalar_one_or_none()
+        if source_result is None:
+            return False
+
+        steps = await db.execute(
+            select(ProofStep.step_index, ProofStep.id).where(ProofStep.proof_id == target_id)
+        )
+        step_ids = dict(steps.all())
+        db.add(ProofResult(
+            proof_id=target_id,
+            is_valid=source_result.is_valid,
+            lii_score=source_result.lii_score,
+            confidence_interval=source_result.confidence_interval,
+            coherence_score=source_result.coherence_score,
+            step_results=[
+                {**step_result, "step_id": step_ids.get(step_result.get("step_index"), step_result.get("step_id"))}
+                for step_result in source_result.step_results
+            ],
+            feedback=source_result.feedback,
+            scoring_version=source_result.scoring_version
+        ))
+        await db.execute(
+            update(Proof)
+            .where(Proof.id == target_id)
+            .values(status=ProofStatus.COMPLETED, duplicate_of=source_id, failure_reason=None)
+        )
+        await db.commit()
+        return True
+
+    async def link_duplicate(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int,
+        original_id: int
+    ) -> None:
+        """
+        Make a duplicate proof wait for the verification of an identical one.
+
+        The duplicate is marked 'processing' without a lease, so workers
+        never claim it; resolve_duplicates() completes or re-queues it.
+
+        Args:
+            db: Database session
+            proof_id: Duplicate proof
+            original_id: Proof being verified
+        """
+        await db.execute(
+            update(Proof)
+            .where(Proof.id == proof_id)
+            .values(status=ProofStatus.PROCESSING, duplicate_of=original_id)
+        )
+        await db.commit()
+
+    async def resolve_duplicates(
+        self,
+        db: AsyncSession,
+        *,
+        original_id: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """
+        Settle linked duplicates whose original proof has finished.
+
+        Duplicates of a completed original get a copy of its result;
+        duplicates of a failed (or deleted) original go back to 'pending' to
+        be verified on their own.
+
+        Args:
+            db: Database session
+            original_id: Only settle duplicates of this proof (None = all)
+
+        Returns:
+            Tuple[int, int]: (completed, requeued) duplicate counts
+        """
+        Original = aliased(Proof)
+        query = (
+            select(Proof.id, Proof.duplicate_of, Original.status)
+            .outerjoin(Original, Original.id == Proof.duplicate_of)
+            .where(Proof.status == ProofStatus.PROCESSING, Proof.lease_owner.is_(None))
+        )
+        if original_id is None:
+            query = query.where(Proof.duplicate_of.is_not(None))
+        else:
+            query = query.where(Proof.duplicate_of == original_id)
+        linked = (await db.execute(query)).all()
+
+        completed = requeued = 0
+        for proof_id, duplicate_of, original_status in linked:
+            if original_status == ProofStatus.COMPLETED:
+                if await self.copy_result(db, source_id=duplicate_of, target_id=proof_id):
+                    completed += 1
+                    continue
+            elif original_status in (ProofStatus.PENDING, ProofStatus.PROCESSING):
+                continue
+            await db.execute(
+                update(Proof)
+                .where(Proof.id == proof_id)
+                .values(status=ProofStatus.PENDING, duplicate_of=None)
+            )
+            await db.commit()
+            requeued += 1
+        return completed, requeued
+
+    async def replace_steps(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int,
+        steps: List[ProofStep],
+        fingerprint: str,
+        reused: Dict[int, tuple]
+    ) -> bool:
+        """
+        Replace the steps of a finished proof and put it back in the queue.
+
+        The old steps, result and checkpoints are deleted; reused step
+        outcomes become checkpoints of the new steps, so the next
+        verification skips them.
+
+        Args:
+            db: Database session
+            proof_id: Proof ID
+            steps: New (unsaved) steps
+            fingerprint: Content fingerprint of the edited proof
+            reused: Step index -> ((symbolic_pass, symbolic_status), semantic_score)
+
+        Returns:
+            bool: False if the proof is missing or not 'completed'/'failed'
+        """
+        # Conditional update: a proof claimed or queued meanwhile is left alone
+        requeued = await db.execute(
+            update(Proof)
+            .where(
+                Proof.id == proof_id,
+                Proof.status.in_([ProofStatus.COMPLETED, ProofStatus.FAILED])
+            )
+            .values(
+                status=ProofStatus.PENDING,
+                fingerprint=fingerprint,
+                duplicate_of=None,
+                failure_reason=None,
+                attempts=0
+            )
+        )
+        if requeued.rowcount == 0:
+            await db.rollback()
+            return False
+
+        await db.execute(delete(ProofStepCheckpoint).where(ProofStepCheckpoint.proof_id == proof_id))
+        await db.execute(delete(ProofResult).where(ProofResult.proof_id == proof_id))
+        await db.execute(delete(ProofStep).where(ProofStep.proof_id == proof_id))
+
+        for step in steps:
+            step.proof_id = proof_id
+        db.add_all(steps)
+        await db.flush()  # Get step IDs for the checkpoints
+
+        db.add_all(
+            ProofStepCheckpoint(
+                proof_id=proof_id,
+                step_id=step.id,
+                step_index=step.step_index,
+                symbolic_pass=reused[step.step_index][0][0],
+                symbolic_status=reused[step.step_index][0][1],
+                semantic_score=reused[step.step_index][1],
+                provider_scores=provider_scores(reused[step.step_index][1])
+            )
+            for step in steps
+            if step.step_index in reused
+        )
+        await db.commit()
+        return True
+
+    async def get_step_checkpoints(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int
+    ) -> List[ProofStepCheckpoint]:
+        """
+        Get the step outcomes saved by earlier attempts at a proof.
+
+        Args:
+            db: Database session
+            proof_id: Proof ID
+
+        Returns:
+            List[ProofStepCheckpoint]: Checkpoints ordered by step index
+        """
+        result = await db.execute(
+            select(ProofStepCheckpoint)
+            .where(ProofStepCheckpoint.proof_id == proof_id)
+            .order_by(ProofStepCheckpoint.step_index)
+        )
+        return list(result.scalars().all())
+
+    async def save_step_checkpoints(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int,
+        outcomes: List[dict]
+    ) -> int:
+        """
+        Save a batch of step outcomes for a proof in progress.
+
+        Steps that already have a checkpoint are left unchanged.
+
+        Args:
+            db: Database session
+            proof_id: Proof ID
+            outcomes: Dicts with step_id, step_index, symbolic_pass,
+                symbolic_status, semantic_score and provider_scores
+
+        Returns:
+            int: Number of checkpoints written
+        """
+        existing = await db.execute(
+            select(ProofStepCheckpoint.step_index)
+            .where(
+                ProofStepCheckpoint.proof_id == proof_id,
+                ProofStepCheckpoint.step_index.in_([o["step_index"] for o in outcomes])
+            )
+        )
+        saved = set(existing.scalars().all())
+        new = [o for o in outcomes if o["step_index"] not in saved]
+        db.add_all(ProofStepCheckpoint(proof_id=proof_id, **o) for o in new)
+        await db.commit()
+        return len(new)
+
+    async def clear_step_checkpoints(
+        self,
+        db: AsyncSession,
+        *,
+        proof_id: int
+    ) -> None:
+        """
+        Delete the step checkpoints of a proof (once its result is stored).
+
+        Args:
+            db: Database session
+            proof_id: Proof ID
+        """
+        await db.execute(
+            delete(ProofStepCheckpoint).where(ProofStepCheckpoint.proof_id == proof_id)
+        )
+        await db.commit()
+
     async def delete(
         self,
         db: AsyncSession,
@@ -6,12 +6,15 @@ from sqlalchemy.orm import DeclarativeBase
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core.config import settings
+
 class Base(DeclarativeBase):
     """Base class for all database models"""
     pass
 
 
-# Global engine and session maker (will be initialized in session.py)
+# Global engine and session maker (initialized by init_db(); read them through
+# this module, e.g. `base.async_session_maker`, not via `from ... import`)
 async_engine: AsyncEngine | None = None
 async_session_maker: async_sessionmaker[AsyncSession] | None = None
 
@@ -30,8 +33,8 @@ async def init_db(database_url: str) -> None:
         database_url,
         echo=False,  # Set to True for SQL query logging during development
         future=True,
-        pool_size=10,
-        max_overflow=20,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
     )
 
     async_session_maker = async_sessionmaker(
@@ -43,6 +46,26 @@ async def init_db(database_url: str) -> None:
     )
 
 
+def get_pool_stats() -> dict:
+    """
+    Get connection pool usage of the shared engine.
+
+    Returns:
+        dict: Pool class and, where the pool supports them, its size,
+            checked-in/checked-out connections and current overflow
+    """
+    if async_engine is None:
+        return {"initialized": False}
+
+    pool = async_engine.pool
+    stats = {"initialized": True, "pool_class": type(pool).__name__}
+    for counter in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, counter, None)
+        if callable(method):
+            stats[counter] = method()
+    return stats
+
+
 async def create_tables() -> None:
     """Create all tables defined in models (for development/testing)"""
     if async_engine is None:
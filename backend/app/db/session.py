@@ -3,7 +3,7 @@
 
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.base import async_session_maker
+from app.db import base
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -16,10 +16,10 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             # Use db here
             pass
     """
-    if async_session_maker is None:
+    if base.async_session_maker is None:
         raise RuntimeError("Database not initialized. Call init_db() in startup event.")
 
-    async with async_session_maker() as session:
+    async with base.async_session_maker() as session:
         try:
             yield session
             await session.commit()
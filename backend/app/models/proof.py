@@ -4,7 +4,9 @@
 import enum
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import String, Float, DateTime, Text, ForeignKey, JSON, Boolean, Integer, Enum
+from sqlalchemy import (
+    String, Float, DateTime, Text, ForeignKey, JSON, Boolean, Integer, Enum, UniqueConstraint
+)
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
 from app.db.base import Base
@@ -27,8 +29,15 @@ class Proof(Base):
         created_at: Timestamp of proof submission
         domain: Mathematical domain (algebra, topology, logic, etc.)
         status: Current processing status
+        lease_owner: ID of the queue worker that claimed the proof
+        lease_expires_at: When the worker's claim lapses unless renewed by a heartbeat
+        attempts: Number of times a worker has claimed the proof
+        failure_reason: Why verification failed (when status is 'failed')
+        fingerprint: Content hash of the submission (see app.services.fingerprint)
+        duplicate_of: Proof whose verification this identical submission reuses
         steps: List of proof steps (one-to-many relationship)
         result: Verification result (one-to-one relationship)
+        step_checkpoints: Step outcomes saved while verification is in progress
     """
     __tablename__ = "proofs"
 
@@ -42,9 +51,22 @@ class Proof(Base):
     status: Mapped[ProofStatus] = mapped_column(
         Enum(ProofStatus),
         default=ProofStatus.PENDING,
-        nullable=False
+        nullable=False,
+        index=True
     )
 
+    # Job queue lease (set while a worker owns the proof)
+    lease_owner: Mapped[Optional[str]] = mapped_column(String(128), nullable=True)
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    failure_reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Duplicate submissions (same fingerprint) reuse an earlier verification.
+    # No foreign key: a duplicate waiting on a deleted original must still
+    # see the dangling ID to be re-queued.
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)
+    duplicate_of: Mapped[Optional[int]] = mapped_column(Integer, nullable=True, index=True)
+
     # Relationships
     steps: Mapped[List["ProofStep"]] = relationship(
         back_populates="proof",
@@ -56,6 +78,10 @@ class Proof(Base):
         uselist=False,
         cascade="all, delete-orphan"
     )
+    step_checkpoints: Mapped[List["ProofStepCheckpoint"]] = relationship(
+        back_populates="proof",
+        cascade="all, delete-orphan"
+    )
 
     def __repr__(self) -> str:
         return f"<Proof(id={self.id}, domain='{self.domain}', status='{self.status}')>"
@@ -104,8 +130,12 @@ class ProofResult(Base):
         lii_score: Logic Integrity Index (0-100)
         confidence_interval: 95% confidence interval [lower, upper]
         coherence_score: Multi-LLM consensus coherence (0-100)
-        step_results: Detailed results for each step (JSON array)
+        step_results: Detailed results for each step (JSON array), with the
+            symbolic verdict and per-provider semantic scores of each step
         feedback: Natural language feedback (JSON array)
+        scoring_version: Scoring configuration the scores were computed with
+            (see app.services.scoring.scoring_version)
+        created_at: When the result was stored
     """
     __tablename__ = "proof_results"
 
@@ -126,9 +156,64 @@ class ProofResult(Base):
     # Detailed results (stored as JSON)
     step_results: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
     feedback: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    scoring_version: Mapped[Optional[str]] = mapped_column(String(16), nullable=True, index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
 
     # Relationship
     proof: Mapped["Proof"] = relationship(back_populates="result")
 
     def __repr__(self) -> str:
         return f"<ProofResult(proof_id={self.proof_id}, valid={self.is_valid}, lii={self.lii_score:.1f})>"
+
+
+class ProofStepCheckpoint(Base):
+    """
+    Outcome of one step, saved as soon as the step is evaluated.
+
+    A retried verification skips steps that already have a checkpoint.
+    Checkpoints are cleared once the final ProofResult is stored.
+
+    Attributes:
+        id: Primary key
+        proof_id: Foreign key to parent proof
+        step_id: Foreign key to the evaluated step
+        step_index: Index of the evaluated step
+        symbolic_pass: Whether the symbolic check passed
+        symbolic_status: Symbolic outcome (passed, failed, timeout, resource_limit, error, no_equation)
+        semantic_score: Semantic score (0-100)
+        provider_scores: Semantic score of each LLM provider (None if not known)
+        created_at: When the step was evaluated
+    """
+    __tablename__ = "proof_step_checkpoints"
+    __table_args__ = (UniqueConstraint("proof_id", "step_index", name="uq_checkpoint_step"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    proof_id: Mapped[int] = mapped_column(
+        ForeignKey("proofs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    step_id: Mapped[int] = mapped_column(
+        ForeignKey("proof_steps.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    step_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    symbolic_pass: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    symbolic_status: Mapped[str] = mapped_column(String(32), nullable=False)
+    semantic_score: Mapped[float] = mapped_column(Float, nullable=False)
+    provider_scores: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+
+    # Relationship
+    proof: Mapped["Proof"] = relationship(back_populates="step_checkpoints")
+
+    def __repr__(self) -> str:
+        return f"<ProofStepCheckpoint(proof_id={self.proof_id}, index={self.step_index})>"
@@ -50,6 +50,29 @@ class ProofCreate(BaseModel):
     )
 
 
+class ProofRevalidate(BaseModel):
+    """Schema for re-verifying an existing proof with edited steps"""
+    steps: List[ProofStepCreate] = Field(..., min_items=1, description="Complete replacement list of proof steps")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "steps": [
+                    {
+                        "claim": "Start with the equation x + 5 = 10",
+                        "equation": {"lhs": "x + 5", "rhs": "10"}
+                    },
+                    {
+                        "claim": "Subtract 5 from both sides",
+                        "equation": {"lhs": "x", "rhs": "5"},
+                        "dependencies": ["0"]
+                    }
+                ]
+            }
+        }
+    )
+
+
 # [=] Response Schemas (Output to client)
 
 class ProofStepResponse(ProofStepCreate):
@@ -96,6 +119,9 @@ class ProofResponse(BaseModel):
     created_at: datetime
     domain: str
     status: str = Field(..., description="Processing status (pending, processing, completed, failed)")
+    attempts: int = Field(0, description="Number of times a worker has claimed the proof")
+    failure_reason: Optional[str] = Field(None, description="Why verification failed (when status is 'failed')")
+    duplicate_of: Optional[int] = Field(None, description="Earlier identical proof whose verification this proof reuses")
     steps: List[ProofStepResponse]
     result: Optional[ProofResultResponse] = Field(None, description="Available when status is 'completed'")
 
@@ -0,0 +1,107 @@
+# [B] ProofBench Backend - Step Checkpoints
+# Incremental persistence of step outcomes so interrupted proofs resume
+
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
+
+from app import crud
+from app.core.config import settings
+from app.models.proof import ProofStep, ProofStepCheckpoint
+from app.services.scoring import SemanticScore, provider_scores
+
+
+# Outcome of one step as produced by BackendProofEngine:
+# ((symbolic_pass, symbolic_status), semantic_score)
+StepOutcome = Tuple[Tuple[bool, str], float]
+
+
+def completed_outcomes(
+    steps: List[ProofStep],
+    checkpoints: List[ProofStepCheckpoint]
+) -> Dict[int, StepOutcome]:
+    """
+    Map step index to the outcome saved by an earlier attempt.
+
+    Checkpoints are only reused for the step row they were saved for.
+    Semantic scores keep the provider scores they were saved with.
+
+    Args:
+        steps: Steps of the proof
+        checkpoints: Saved checkpoints of the proof
+
+    Returns:
+        dict: Step index -> StepOutcome
+    """
+    step_ids = {step.step_index: step.id for step in steps}
+    return {
+        checkpoint.step_index: (
+            (checkpoint.symbolic_pass, checkpoint.symbolic_status),
+            SemanticScore(checkpoint.semantic_score, checkpoint.provider_scores),
+        )
+        for checkpoint in checkpoints
+        if step_ids.get(checkpoint.step_index) == checkpoint.step_id
+    }
+
+
+class StepCheckpointWriter:
+    """
+    Buffer step outcomes and save them in batches.
+
+    add() is passed to BackendProofEngine.evaluate() as its on_step
+    callback; outcomes are written every `batch_size` steps, and flush()
+    writes the remainder (also when the verification is interrupted).
+
+    Writes run in their own tasks, one at a time, so cancelling the step
+    that filled a batch does not lose the batch.
+    """
+
+    def __init__(self, session_maker, proof_id: int, batch_size: Optional[int] = None):
+        """
+        Args:
+            session_maker: Async session factory
+            proof_id: Proof being verified
+            batch_size: Outcomes per write (default: settings.CHECKPOINT_BATCH_SIZE)
+        """
+        self.session_maker = session_maker
+        self.proof_id = proof_id
+        self.batch_size = batch_size or settings.CHECKPOINT_BATCH_SIZE
+        self._pending: List[dict] = []
+        self._writes: Set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+
+    async def add(self, step: ProofStep, outcome: StepOutcome) -> None:
+        """Buffer one evaluated step, starting a write when the batch is full"""
+        (symbolic_pass, symbolic_status), semantic_score = outcome
+        self._pending.append({
+            "step_id": step.id,
+            "step_index": step.step_index,
+            "symbolic_pass": symbolic_pass,
+            "symbolic_status": symbolic_status,
+            "semantic_score": semantic_score,
+            "provider_scores": provider_scores(semantic_score),
+        })
+        if len(self._pending) >= self.batch_size:
+            batch, self._pending = self._pending, []
+            task = asyncio.create_task(self._write(batch))
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+
+    async def flush(self) -> None:
+        """Wait for batch writes in progress, then write the remaining outcomes"""
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+        batch, self._pending = self._pending, []
+        if batch:
+            await self._write(batch)
+
+    async def _write(self, batch: List[dict]) -> None:
+        """Save one batch (kept for the next flush if the write fails)"""
+        async with self._lock:
+            try:
+                async with self.session_maker() as db:
+                    await crud.proof.save_step_checkpoints(
+                        db, proof_id=self.proof_id, outcomes=batch
+                    )
+            except Exception as e:
+                print(f"[W] Failed to checkpoint {len(batch)} steps of proof {self.proof_id}: {e}")
+                self._pending = batch + self._pending
@@ -0,0 +1,56 @@
+# [B] ProofBench Backend - Verification Deadlines
+# Wall-clock budget of one verification, shared by its symbolic and LLM calls
+
+import time
+from typing import Optional
+
+
+# Smallest timeout cap() hands out (0 means "unlimited" to several callees)
+MIN_TIMEOUT = 0.01
+
+
+class Deadline:
+    """
+    Absolute point in time by which a verification must finish.
+
+    Calls made on behalf of the verification take their timeout from
+    cap(), so the closer the deadline, the shorter their own limits.
+
+    Attributes:
+        expires_at: time.monotonic() value of the deadline (None = unbounded)
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        Args:
+            seconds: Budget from now (None = no deadline)
+        """
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None without a deadline"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Whether the deadline has passed"""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def cap(self, timeout: Optional[float]) -> Optional[float]:
+        """
+        Shrink a call's own timeout to the time left.
+
+        Args:
+            timeout: The call's configured timeout (None = unbounded)
+
+        Returns:
+            Optional[float]: min(timeout, remaining()) but at least MIN_TIMEOUT,
+                None if both are unbounded
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return max(MIN_TIMEOUT, remaining)
+        return max(MIN_TIMEOUT, min(timeout, remaining))
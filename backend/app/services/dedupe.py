@@ -0,0 +1,56 @@
+# [B] ProofBench Backend - Duplicate Submission Handling
+# Reuse the verification of an identical earlier proof (same fingerprint)
+
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.core.config import settings
+from app.models.proof import Proof, ProofStatus
+
+
+async def deduplicate(db: AsyncSession, proof: Proof) -> Optional[str]:
+    """
+    Apply settings.DEDUPE_POLICY to a newly submitted proof.
+
+    Policies:
+    - "off": every proof is verified
+    - "reuse": a proof identical to one completed within
+      settings.DEDUPE_RESULT_TTL seconds gets a copy of its result at once
+    - "reuse_or_link": additionally, a proof identical to one still being
+      verified waits for that verification instead of running its own
+
+    Args:
+        db: Database session
+        proof: Proof just created by crud.proof.create_with_steps()
+
+    Returns:
+        Optional[str]: "reused" or "linked", None if the proof is to be
+            verified (left pending)
+    """
+    policy = settings.DEDUPE_POLICY
+    if policy == "off" or proof.fingerprint is None:
+        return None
+
+    original = await crud.proof.find_duplicate(
+        db,
+        proof_id=proof.id,
+        fingerprint=proof.fingerprint,
+        max_result_age=settings.DEDUPE_RESULT_TTL,
+        include_in_flight=policy == "reuse_or_link"
+    )
+    if original is None:
+        return None
+
+    if original.status == ProofStatus.COMPLETED:
+        if not await crud.proof.copy_result(db, source_id=original.id, target_id=proof.id):
+            return None
+        print(f"[+] Proof {proof.id} reuses the result of identical proof {original.id}")
+        return "reused"
+
+    await crud.proof.link_duplicate(db, proof_id=proof.id, original_id=original.id)
+    # The original may have finished between the lookup and the link
+    await crud.proof.resolve_duplicates(db, original_id=original.id)
+    print(f"[+] Proof {proof.id} linked to identical proof {original.id} in verification")
+    return "linked"
@@ -0,0 +1,75 @@
+# [B] ProofBench Backend - Proof Fingerprints
+# Canonical content hash of a proof submission, used to detect duplicates
+
+import hashlib
+import json
+
+from app.schemas.proof import ProofCreate
+
+
+# Bump when the canonical form changes (old fingerprints stop matching)
+FINGERPRINT_VERSION = "1"
+
+
+def _canonical_text(text) -> str:
+    """Collapse whitespace runs (formatting differences do not change a proof)"""
+    return " ".join(str(text).split())
+
+
+def _canonical_content(step) -> dict:
+    """Claim and equation of a step, formatting removed"""
+    return {
+        "claim": _canonical_text(step.claim),
+        "equation": (
+            {key: _canonical_text(value) for key, value in step.equation.items()}
+            if step.equation else None
+        ),
+    }
+
+
+def step_fingerprint(step) -> str:
+    """
+    Fingerprint the content of one step.
+
+    Covers the claim and equation only: dependencies name steps by index,
+    so they are compared on the resolved dependency graph instead (see
+    app.services.revalidation).
+
+    Args:
+        step: ProofStep entity or ProofStepCreate
+
+    Returns:
+        str: SHA-256 hex digest (64 characters)
+    """
+    canonical = {"version": FINGERPRINT_VERSION, **_canonical_content(step)}
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def proof_fingerprint(obj_in: ProofCreate) -> str:
+    """
+    Fingerprint a proof submission.
+
+    Covers the domain and, in order, every step's claim, equation and
+    dependencies. Whitespace runs are collapsed and equation keys sorted,
+    so only formatting differences map to the same fingerprint.
+
+    Args:
+        obj_in: Submitted proof
+
+    Returns:
+        str: SHA-256 hex digest (64 characters)
+    """
+    canonical = {
+        "version": FINGERPRINT_VERSION,
+        "domain": _canonical_text(obj_in.domain),
+        "steps": [
+            {
+                **_canonical_content(step),
+                "dependencies": [_canonical_text(reference) for reference in step.dependencies or []],
+            }
+            for step in obj_in.steps
+        ],
+    }
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,210 @@
+# [B] ProofBench Backend - Verification Job Queue
+# Database-backed queue: workers claim pending proofs under a lease
+
+import asyncio
+import os
+import socket
+import uuid
+from typing import Optional, Set
+
+from app import crud
+from app.core.config import settings
+from app.db import base as db_base
+from app.services.verification import run_proof_verification, set_final_status
+
+
+# Time past WORKER_TIMEOUT allowed for storing the partial result of a
+# verification that reached its deadline, before the worker cancels it
+FINALIZE_GRACE = 30.0
+
+
+def default_worker_id() -> str:
+    """Unique worker ID: host, process and a random suffix"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class VerificationWorker:
+    """
+    Queue worker running proof verifications claimed from the database.
+
+    Submitted proofs are stored as 'pending'; any number of workers, in
+    any number of processes or nodes, claim them with
+    crud.proof.claim_next() and verify them with run_proof_verification().
+    Each worker runs at most `concurrency` verifications at once.
+    Verifications finalize themselves at settings.WORKER_TIMEOUT; those still
+    running FINALIZE_GRACE seconds later are cancelled and marked failed.
+
+    While a proof is verified its lease is renewed every
+    settings.WORKER_HEARTBEAT_INTERVAL seconds; if a renewal finds the lease
+    lost, the verification is abandoned. Every worker also sweeps the queue
+    periodically, re-queueing proofs whose worker died (expired lease) up to
+    settings.WORKER_MAX_ATTEMPTS claims, after which they are marked failed.
+
+    Attributes:
+        worker_id: Lease owner ID written to claimed proofs
+        concurrency: Maximum verifications in flight
+        poll_interval: Seconds to wait between claims when the queue is empty
+    """
+
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None
+    ):
+        self.worker_id = worker_id or settings.WORKER_ID or default_worker_id()
+        self.concurrency = concurrency or settings.MAX_CONCURRENT_VERIFICATIONS
+        self.poll_interval = poll_interval if poll_interval is not None else settings.WORKER_POLL_INTERVAL
+        self._tasks: Set[asyncio.Task] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    def notify(self) -> None:
+        """Wake the claim loop early (a proof was just submitted)"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def stop(self) -> None:
+        """Stop claiming new proofs; run() returns once in-flight ones finish"""
+        self._stopping = True
+        self.notify()
+
+    async def claim(self) -> Optional[int]:
+        """Claim the next pending proof (None if the queue is empty)"""
+        if db_base.async_session_maker is None:
+            await db_base.init_db(settings.DATABASE_URL)
+        async with db_base.async_session_maker() as db:
+            return await crud.proof.claim_next(
+                db, owner=self.worker_id, lease_seconds=settings.WORKER_LEASE_SECONDS
+            )
+
+    async def process(self, proof_id: int) -> None:
+        """Verify a claimed proof, renewing its lease and enforcing the hard time limit"""
+        verification = asyncio.create_task(run_proof_verification(proof_id, owner=self.worker_id))
+        heartbeat = asyncio.create_task(self._heartbeat(proof_id))
+        try:
+            done, _ = await asyncio.wait(
+                {verification, heartbeat},
+                timeout=settings.WORKER_TIMEOUT + FINALIZE_GRACE,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+        except asyncio.CancelledError:
+            verification.cancel()
+            raise
+        finally:
+            heartbeat.cancel()
+        if verification in done:
+            return
+
+        verification.cancel()
+        await asyncio.gather(verification, return_exceptions=True)
+        if heartbeat in done:
+            print(f"[W] Lease on proof {proof_id} lost; verification abandoned")
+            return
+
+        print(f"[-] Proof {proof_id} exceeded WORKER_TIMEOUT ({settings.WORKER_TIMEOUT}s)")
+        async with db_base.async_session_maker() as db:
+            await set_final_status(
+                db, proof_id, self.worker_id, "failed",
+                failure_reason=f"Verification exceeded WORKER_TIMEOUT ({settings.WORKER_TIMEOUT}s)"
+            )
+
+    async def _heartbeat(self, proof_id: int) -> None:
+        """Renew the lease on proof_id until cancelled; returns when the lease is lost"""
+        while True:
+            await asyncio.sleep(settings.WORKER_HEARTBEAT_INTERVAL)
+            try:
+                async with db_base.async_session_maker() as db:
+                    alive = await crud.proof.heartbeat(
+                        db, proof_id=proof_id, owner=self.worker_id,
+                        lease_seconds=settings.WORKER_LEASE_SECONDS
+                    )
+            except Exception as e:
+                # Transient database error: retry on the next beat while the lease lasts
+                print(f"[W] Heartbeat for proof {proof_id} failed: {e}")
+                continue
+            if not alive:
+                return
+
+    async def sweep(self) -> None:
+        """Re-queue (or fail) proofs whose lease expired, and settle waiting duplicates"""
+        if db_base.async_session_maker is None:
+            await db_base.init_db(settings.DATABASE_URL)
+        async with db_base.async_session_maker() as db:
+            requeued, failed = await crud.proof.requeue_expired(
+                db, max_attempts=settings.WORKER_MAX_ATTEMPTS
+            )
+            # Duplicates of proofs failed above (or deleted) are verified on their own
+            _, released = await crud.proof.resolve_duplicates(db)
+        if requeued or failed:
+            print(f"[*] Sweeper re-queued {requeued} and failed {failed} proofs with expired leases")
+        if released:
+            print(f"[*] Sweeper re-queued {released} duplicate proofs whose original failed")
+        if requeued or released:
+            self.notify()
+
+    async def _sweep_loop(self) -> None:
+        """Run sweep() every settings.WORKER_SWEEP_INTERVAL seconds"""
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                print(f"[-] Worker {self.worker_id} sweep failed: {e}")
+            await asyncio.sleep(settings.WORKER_SWEEP_INTERVAL)
+
+    async def run_once(self) -> Optional[int]:
+        """Claim and verify a single proof; returns its ID (None if none was pending)"""
+        proof_id = await self.claim()
+        if proof_id is not None:
+            await self.process(proof_id)
+        return proof_id
+
+    async def run(self) -> None:
+        """Claim and verify proofs until stop() is called"""
+        self._wakeup = asyncio.Event()
+        slots = asyncio.Semaphore(self.concurrency)
+        sweeper = asyncio.create_task(self._sweep_loop())
+        print(f"[+] Verification worker {self.worker_id} started (concurrency={self.concurrency})")
+
+        while not self._stopping:
+            await slots.acquire()
+            try:
+                proof_id = await self.claim()
+            except Exception as e:
+                slots.release()
+                print(f"[-] Worker {self.worker_id} failed to claim a proof: {e}")
+                await self._idle()
+                continue
+
+            if proof_id is None:
+                slots.release()
+                await self._idle()
+                continue
+
+            task = asyncio.create_task(self.process(proof_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(lambda _: slots.release())
+
+        sweeper.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        print(f"[-] Verification worker {self.worker_id} stopped")
+
+    async def _idle(self) -> None:
+        """Sleep for poll_interval or until notify()"""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+
+# Worker running inside the API process (settings.EMBEDDED_WORKER)
+embedded_worker: Optional[VerificationWorker] = None
+
+
+def notify_workers() -> None:
+    """Tell the embedded worker, if any, that a proof was submitted"""
+    if embedded_worker is not None:
+        embedded_worker.notify()
@@ -0,0 +1,183 @@
+# [B] ProofBench Backend - Justification Graph
+# Step dependency graph: reference validation, cycle detection and depth
+
+import re
+from typing import Dict, List, Optional, Sequence
+
+
+# Accepted forms of a step reference: 3, "3", "step_3", "step 3", "Step-3"
+_STEP_REFERENCE = re.compile(r"^(?:step[\s_-]?)?(\d+)$", re.IGNORECASE)
+
+
+def _resolve_reference(reference) -> Optional[int]:
+    """Step index named by a dependency reference (None if malformed)"""
+    if isinstance(reference, bool):
+        return None
+    if isinstance(reference, int):
+        return reference
+    if isinstance(reference, str):
+        match = _STEP_REFERENCE.match(reference.strip())
+        if match:
+            return int(match[1])
+    return None
+
+
+def strongly_connected_components(edges: Sequence[Sequence[int]]) -> List[List[int]]:
+    """
+    Tarjan's strongly connected components, with an explicit stack.
+
+    Components are returned in reverse topological order of the edges: a
+    component comes after every component it has an edge to.
+
+    Args:
+        edges: Node -> nodes it has an edge to (nodes are 0..len(edges)-1)
+
+    Returns:
+        List[List[int]]: Components (each a list of nodes)
+    """
+    count = len(edges)
+    index = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    stack: List[int] = []
+    components: List[List[int]] = []
+    counter = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        # (node, position of the next edge to follow)
+        work = [(root, 0)]
+
+        while work:
+            node, position = work[-1]
+            if position < len(edges[node]):
+                work[-1] = (node, position + 1)
+                child = edges[node][position]
+                if index[child] == -1:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, 0))
+                elif on_stack[child]:
+                    low[node] = min(low[node], index[child])
+                continue
+
+            work.pop()
+            if work:
+                caller = work[-1][0]
+                low[caller] = min(low[caller], low[node])
+            if low[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+class JustificationGraph:
+    """
+    Dependency graph of the steps of one proof.
+
+    Steps reference the steps they depend on by step index, given as a
+    number or a string ("3", "step_3"). Nodes are positions in the step
+    list. Every traversal is iterative, so proofs with tens of thousands of
+    steps stay clear of the recursion limit.
+
+    Attributes:
+        parents: Position -> positions of the steps it depends on
+        invalid_references: Position -> references naming no step of the proof
+        cycles: Groups of positions depending on each other (circular
+            justification), each sorted
+        schedule_parents: parents without edges inside a cycle; always
+            acyclic, so steps can be evaluated after these parents
+        depth: Position -> longest dependency chain below the step (0 without
+            dependencies), None for steps in or depending on a cycle
+    """
+
+    def __init__(self, steps: Sequence):
+        """
+        Args:
+            steps: ProofStep entities (step_index, dependencies) in proof order
+        """
+        positions = {step.step_index: position for position, step in enumerate(steps)}
+        self.parents: List[List[int]] = []
+        self.invalid_references: Dict[int, List[str]] = {}
+
+        for position, step in enumerate(steps):
+            parents: List[int] = []
+            for reference in getattr(step, "dependencies", None) or []:
+                parent = positions.get(_resolve_reference(reference))
+                if parent is None:
+                    self.invalid_references.setdefault(position, []).append(str(reference))
+                elif parent not in parents:
+                    parents.append(parent)
+            self.parents.append(parents)
+
+        components = strongly_connected_components(self.parents)
+        component_of = [0] * len(steps)
+        for number, component in enumerate(components):
+            for position in component:
+                component_of[position] = number
+
+        self.cycles: List[List[int]] = [
+            sorted(component) for component in components
+            if len(component) > 1 or component[0] in self.parents[component[0]]
+        ]
+        cyclic = {position for cycle in self.cycles for position in cycle}
+        self.schedule_parents: List[List[int]] = [
+            [parent for parent in parents if component_of[parent] != component_of[position]]
+            for position, parents in enumerate(self.parents)
+        ]
+
+        # Components come parents first, so one pass settles every depth
+        self.depth: List[Optional[int]] = [None] * len(steps)
+        for component in components:
+            for position in component:
+                if position in cyclic:
+                    continue
+                parent_depths = [self.depth[parent] for parent in self.parents[position]]
+                if None not in parent_depths:
+                    self.depth[position] = 1 + max(parent_depths) if parent_depths else 0
+
+        self._cyclic = cyclic
+
+    def dependencies_valid(self, position: int) -> bool:
+        """Whether every reference of a step names another step and none is circular"""
+        return position not in self.invalid_references and position not in self._cyclic
+
+    @property
+    def max_depth(self) -> Optional[int]:
+        """Longest dependency chain of the proof (None if it has a cycle)"""
+        if self.cycles or not self.depth:
+            return None
+        return max(self.depth)
+
+    def summary(self, steps: Sequence) -> dict:
+        """
+        Report the graph by step index.
+
+        Args:
+            steps: The steps the graph was built from
+
+        Returns:
+            dict: cycles, invalid_references and max_depth
+        """
+        return {
+            "cycles": [[steps[position].step_index for position in cycle] for cycle in self.cycles],
+            "invalid_references": {
+                steps[position].step_index: references
+                for position, references in self.invalid_references.items()
+            },
+            "max_depth": self.max_depth,
+        }
@@ -33,6 +33,8 @@ class EvaluationOptions(BaseModel):
     temperature: float = Field(0.3, ge=0, le=2, description="Sampling temperature")
     max_tokens: int = Field(500, ge=1, le=4096, description="Maximum completion tokens")
     json_mode: bool = Field(True, description="Request JSON format response")
+    timeout: Optional[float] = Field(None, gt=0, description="Per-request time limit in seconds (caps the client's LLM_TIMEOUT)")
+    system_message: Optional[str] = Field(None, description="Override the provider's single-step system message")
 
 
 class ParsedResponse(BaseModel):
@@ -66,6 +68,15 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """
+        Release network resources (HTTP connection pools).
+
+        Providers holding long-lived clients override this; it is called once
+        on application shutdown.
+        """
+        return None
+
     @abstractmethod
     def _parse_response(self, response: str) -> ParsedResponse:
         """
@@ -81,7 +81,7 @@ class GoogleAIProvider(BaseLLMProvider):
             )
 
             # System instruction (prepend to prompt for Gemini)
-            system_instruction = (
+            system_instruction = options.system_message or (
                 "You are a mathematical proof evaluator. Analyze the provided proof step "
                 "and provide a score from 0-100 based on logical soundness and correctness. "
                 "Respond in JSON format with 'score' (integer 0-100) and 'reasoning' (string) fields."
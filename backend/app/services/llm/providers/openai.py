@@ -54,6 +54,10 @@ class OpenAIProvider(BaseLLMProvider):
         self.cost_tracker = CostTracker(provider="openai")
         self.default_model = "gpt-4o-2024-05-13"
 
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its connection pool"""
+        await self.client.close()
+
     async def evaluate(self, prompt: str, options: EvaluationOptions) -> LLMResponse:
         """
         Evaluate proof with OpenAI GPT model.
@@ -73,7 +77,7 @@ class OpenAIProvider(BaseLLMProvider):
 
         try:
             # System message for consistent evaluation
-            system_message = (
+            system_message = options.system_message or (
                 "You are a mathematical proof evaluator. Analyze the provided proof step "
                 "and provide a score from 0-100 based on logical soundness and correctness. "
                 "Respond in JSON format with 'score' (integer 0-100) and 'reasoning' (string) fields."
@@ -188,7 +188,7 @@ class LLMAdapter:
             service = self.services[provider_name]
             try:
                 print(f"[>] Attempting evaluation with {provider_name}...")
-                response = await service.evaluate(prompt, options)
+                response = await self._call(service, prompt, options)
                 print(f"[+] Evaluation with {provider_name} succeeded")
                 return response
 
@@ -219,11 +219,26 @@ class LLMAdapter:
             LLMResponse or Exception
         """
         try:
-            return await service.evaluate(prompt, options)
+            return await self._call(service, prompt, options)
         except Exception as e:
             print(f"[-] {provider_name} evaluation failed: {e}")
             raise
 
+    async def _call(self, service, prompt: str, options: EvaluationOptions) -> LLMResponse:
+        """
+        Call one provider, bounded by options.timeout.
+
+        Raises:
+            ConnectionError: If the call exceeds options.timeout (handled like
+                any other provider failure)
+        """
+        if options.timeout is None:
+            return await service.evaluate(prompt, options)
+        try:
+            return await asyncio.wait_for(service.evaluate(prompt, options), options.timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionError(f"Timed out after {options.timeout:.1f}s")
+
     def calculate_consensus(self, responses: List[LLMResponse]) -> ConsensusResult:
         """
         Calculate consensus from multiple LLM responses.
@@ -250,6 +265,16 @@ class LLMAdapter:
         """Check if any providers are available"""
         return len(self.services) > 0
 
+    async def aclose(self) -> None:
+        """Close every provider's client (errors are logged, not raised)"""
+        results = await asyncio.gather(
+            *(service.aclose() for service in self.services.values()),
+            return_exceptions=True
+        )
+        for name, result in zip(self.services, results):
+            if isinstance(result, Exception):
+                print(f"[W] Failed to close {name} provider: {result}")
+
 
 # [T] Global singleton instance (optional)
 # llm_adapter = LLMAdapter()
@@ -0,0 +1,85 @@
+# [B] ProofBench Backend - Bulk Rescoring
+# Recompute stored results under the current scoring configuration, without LLM calls
+
+from typing import Optional
+
+from app import crud
+from app.core.config import settings
+from app.services.scoring import overall_assessment, rescorable, rescore, scoring_version
+
+
+# Results loaded, rescored and written per database round trip
+RESCORE_BATCH_SIZE = 500
+
+
+async def rescore_results(
+    session_maker,
+    batch_size: int = RESCORE_BATCH_SIZE,
+    force: bool = False,
+    dry_run: bool = False,
+    limit: Optional[int] = None
+) -> dict:
+    """
+    Rescore stored results with the current weights and pass threshold.
+
+    Results are streamed in ID order, batch by batch. Each batch is
+    rescored with one vectorized pass (app.services.scoring.rescore) over
+    the stored symbolic verdicts and per-provider semantic scores, and
+    written back in one statement. Results with steps skipped by decide-fast
+    are left as they are (their LII score is a bound; re-verify them).
+
+    Args:
+        session_maker: Async session factory
+        batch_size: Results per batch
+        force: Also rescore results already at the current scoring version
+        dry_run: Compute without writing
+        limit: Stop after this many results (None = all)
+
+    Returns:
+        dict: Counts of results scanned, rescored, changed verdicts and
+            skipped, and the scoring version applied
+    """
+    symbolic_weight = settings.SYMBOLIC_WEIGHT
+    semantic_weight = settings.SEMANTIC_WEIGHT
+    pass_threshold = settings.PASS_THRESHOLD
+    version = scoring_version(symbolic_weight, semantic_weight, pass_threshold)
+    stats = {"scanned": 0, "rescored": 0, "verdicts_changed": 0, "skipped": 0, "scoring_version": version}
+
+    after_id = 0
+    while limit is None or stats["scanned"] < limit:
+        size = batch_size if limit is None else min(batch_size, limit - stats["scanned"])
+        async with session_maker() as db:
+            batch = await crud.proof.get_results_batch(
+                db, after_id=after_id, limit=size, exclude_version=None if force else version
+            )
+        if not batch:
+            break
+        after_id = batch[-1][0]
+        stats["scanned"] += len(batch)
+
+        eligible = [row for row in batch if rescorable(row[2])]
+        stats["skipped"] += len(batch) - len(eligible)
+        rescored = rescore([row[2] for row in eligible], symbolic_weight, semantic_weight, pass_threshold)
+
+        scores = []
+        for (result_id, was_valid, _, feedback), scored in zip(eligible, rescored):
+            if scored["is_valid"] != was_valid:
+                stats["verdicts_changed"] += 1
+            # The overall assessment always comes first (see _generate_feedback)
+            scores.append({
+                "id": result_id,
+                **scored,
+                "feedback": [
+                    overall_assessment(scored["is_valid"], scored["lii_score"], pass_threshold),
+                    *(feedback or [])[1:]
+                ],
+                "scoring_version": version,
+            })
+        stats["rescored"] += len(scores)
+
+        if not dry_run:
+            async with session_maker() as db:
+                await crud.proof.update_scores(db, scores=scores)
+        print(f"[*] Rescored {stats['rescored']} of {stats['scanned']} results (up to ID {after_id})")
+
+    return stats
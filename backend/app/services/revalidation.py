@@ -0,0 +1,132 @@
+# [B] ProofBench Backend - Incremental Re-verification
+# Re-verify an edited proof, reusing the outcomes of unchanged steps
+
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud
+from app.models.proof import Proof, ProofStep
+from app.schemas.proof import ProofCreate, ProofStepCreate
+from app.services.checkpoints import StepOutcome
+from app.services.fingerprint import proof_fingerprint, step_fingerprint
+from app.services.justification_graph import JustificationGraph, strongly_connected_components
+from app.services.scoring import SemanticScore
+
+
+# Stored step results whose semantic score is a real outcome of the step
+REUSABLE_SEMANTIC_STATUSES = ("evaluated", "default")
+
+
+def reusable_outcomes(
+    old_steps: Sequence[ProofStep],
+    step_results: Optional[List[dict]],
+    new_steps: Sequence[ProofStep]
+) -> Dict[int, StepOutcome]:
+    """
+    Find the steps of an edited proof whose stored outcome still holds.
+
+    A new step reuses the outcome of an old step with the same content
+    (step_fingerprint) whose dependencies are the reused old steps its own
+    dependencies were matched to. Matching runs parents first, so a changed
+    step invalidates every step that depends on it, directly or not. Steps
+    in a cycle or with invalid references are always re-run, as are old
+    steps that were not evaluated or skipped. Steps that moved keep their
+    outcome; the old step at the same index is preferred among equal ones.
+
+    Args:
+        old_steps: Stored steps, in proof order
+        step_results: Stored result's step_results (None = no result)
+        new_steps: Replacement steps, in proof order (step_index = position)
+
+    Returns:
+        dict: Step index of a new step -> StepOutcome to reuse
+    """
+    stored = {
+        step_result["step_index"]: (
+            (step_result["symbolic_pass"], step_result["symbolic_status"]),
+            SemanticScore(step_result["semantic_score"], step_result.get("provider_scores")),
+        )
+        for step_result in step_results or []
+        if step_result.get("semantic_status") in REUSABLE_SEMANTIC_STATUSES
+        and step_result.get("semantic_score") is not None
+    }
+    old_graph = JustificationGraph(old_steps)
+    candidates: Dict[str, List[int]] = {}
+    for position, step in enumerate(old_steps):
+        if step.step_index in stored and old_graph.dependencies_valid(position):
+            candidates.setdefault(step_fingerprint(step), []).append(position)
+
+    new_graph = JustificationGraph(new_steps)
+    matched: Dict[int, int] = {}  # New position -> old position
+    used = set()
+    # Components come parents first; a component of several steps is a cycle
+    for component in strongly_connected_components(new_graph.parents):
+        position = component[0]
+        if len(component) > 1 or not new_graph.dependencies_valid(position):
+            continue
+        parents = [matched.get(parent) for parent in new_graph.parents[position]]
+        if None in parents:
+            continue  # A dependency changed
+        options = [
+            old for old in candidates.get(step_fingerprint(new_steps[position]), [])
+            if old not in used and old_graph.parents[old] == parents
+        ]
+        if options:
+            old = position if position in options else options[0]
+            matched[position] = old
+            used.add(old)
+
+    return {
+        new_steps[position].step_index: stored[old_steps[old].step_index]
+        for position, old in matched.items()
+    }
+
+
+async def revalidate(
+    db: AsyncSession,
+    proof: Proof,
+    steps_in: List[ProofStepCreate]
+) -> Optional[int]:
+    """
+    Replace the steps of a finished proof and queue it for re-verification.
+
+    Outcomes of unchanged steps (see reusable_outcomes) are saved as step
+    checkpoints, so the worker only evaluates the changed steps and those
+    depending on them, then recomputes the LII score, confidence interval
+    and coherence over all steps.
+
+    Args:
+        db: Database session
+        proof: Proof with its steps and result loaded
+        steps_in: Replacement steps
+
+    Returns:
+        Optional[int]: Number of reused steps, None if the proof is being
+            verified (status pending or processing)
+    """
+    new_steps = [
+        ProofStep(
+            step_index=idx,
+            claim=step_data.claim,
+            equation=step_data.equation,
+            dependencies=step_data.dependencies or []
+        )
+        for idx, step_data in enumerate(steps_in)
+    ]
+    reused = reusable_outcomes(
+        proof.steps,
+        proof.result.step_results if proof.result else None,
+        new_steps
+    )
+    replaced = await crud.proof.replace_steps(
+        db,
+        proof_id=proof.id,
+        steps=new_steps,
+        fingerprint=proof_fingerprint(ProofCreate(domain=proof.domain, steps=steps_in)),
+        reused=reused
+    )
+    if not replaced:
+        return None
+    print(f"[*] Proof {proof.id} re-queued: {len(reused)} of {len(new_steps)} steps reused")
+    return len(reused)
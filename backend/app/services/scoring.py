@@ -0,0 +1,197 @@
+# [B] ProofBench Backend - Result Scoring
+# Aggregate scores of a proof (LII, confidence interval, coherence) and their versioning
+
+import hashlib
+import json
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+# Bump when the aggregation formulas below or in BackendProofEngine change
+SCORING_FORMULA_VERSION = "1"
+
+
+class SemanticScore(float):
+    """
+    Semantic score of a step that also carries the per-provider scores it
+    is the mean of.
+
+    Behaves as a plain float everywhere else; neutral fallback scores (no
+    provider answered) are plain floats.
+    """
+
+    providers: Dict[str, float]
+
+    def __new__(cls, value, providers: Optional[Dict[str, float]] = None):
+        score = super().__new__(cls, value)
+        score.providers = dict(providers or {})
+        return score
+
+    @classmethod
+    def from_providers(cls, providers: Dict[str, float]) -> "SemanticScore":
+        """Mean of the given per-provider scores"""
+        return cls(sum(providers.values()) / len(providers), providers)
+
+
+def provider_scores(semantic_score) -> Optional[Dict[str, float]]:
+    """Per-provider scores behind a semantic score (None if not known)"""
+    providers = getattr(semantic_score, "providers", None)
+    return dict(providers) if providers else None
+
+
+def scoring_version(symbolic_weight: float, semantic_weight: float, pass_threshold: float) -> str:
+    """
+    Version of the configuration a result was scored with.
+
+    Args:
+        symbolic_weight: Weight of symbolic scores in the LII score
+        semantic_weight: Weight of semantic scores in the LII score
+        pass_threshold: Minimum LII score of a valid proof
+
+    Returns:
+        str: Short digest (changes with the weights, threshold or formulas)
+    """
+    payload = json.dumps([
+        SCORING_FORMULA_VERSION,
+        float(symbolic_weight),
+        float(semantic_weight),
+        float(pass_threshold),
+    ])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def overall_assessment(is_valid: bool, lii_score: float, pass_threshold: float) -> dict:
+    """First feedback entry of a result: the verdict and its LII score"""
+    if is_valid:
+        return {
+            "type": "success",
+            "summary": "Proof is logically sound",
+            "detail": f"LII score of {lii_score:.1f} exceeds threshold of {pass_threshold}"
+        }
+    return {
+        "type": "warning",
+        "summary": "Proof has potential issues",
+        "detail": f"LII score of {lii_score:.1f} is below threshold of {pass_threshold}"
+    }
+
+
+def rescorable(step_results: Sequence[dict]) -> bool:
+    """
+    Whether a result can be rescored from its stored step results.
+
+    Results of decide-fast verifications with skipped steps report an LII
+    bound, which new weights may no longer decide; they need re-verifying.
+    """
+    return not any(step_result.get("semantic_status") == "skipped" for step_result in step_results)
+
+
+def rescore(
+    results: Sequence[Sequence[dict]],
+    symbolic_weight: float,
+    semantic_weight: float,
+    pass_threshold: float
+) -> List[dict]:
+    """
+    Recompute the scores of many results from their stored step results.
+
+    Uses the same formulas as BackendProofEngine.evaluate(): a step's
+    semantic score is the mean of its stored provider scores (the stored
+    semantic score when there are none), the LII score is the weighted mean
+    of symbolic and semantic scores, and the confidence interval and
+    coherence follow from the variance of the semantic scores. All steps
+    of all results are processed as flat arrays, one pass per quantity.
+
+    Args:
+        results: step_results of each result (see rescorable())
+        symbolic_weight: Weight of symbolic scores in the LII score
+        semantic_weight: Weight of semantic scores in the LII score
+        pass_threshold: Minimum LII score of a valid proof
+
+    Returns:
+        List[dict]: Per result, is_valid, lii_score, confidence_interval,
+            coherence_score and the updated step_results
+    """
+    count = len(results)
+    if count == 0:
+        return []
+
+    # Flatten: one entry per step, and one per provider score of a step
+    owner, evaluated, symbolic, has_semantic, stored_semantic, valid_dependencies = [], [], [], [], [], []
+    provider_step, provider_value = [], []
+    for position, step_results in enumerate(results):
+        for step_result in step_results:
+            step = len(owner)
+            owner.append(position)
+            evaluated.append(step_result.get("symbolic_status") != "not_evaluated")
+            symbolic.append(100.0 if step_result.get("symbolic_pass") else 0.0)
+            semantic_score = step_result.get("semantic_score")
+            has_semantic.append(semantic_score is not None)
+            stored_semantic.append(semantic_score if semantic_score is not None else 0.0)
+            valid_dependencies.append(step_result.get("dependencies_valid") is not False)
+            for value in (step_result.get("provider_scores") or {}).values():
+                provider_step.append(step)
+                provider_value.append(value)
+
+    owner = np.asarray(owner, dtype=np.intp)
+    evaluated = np.asarray(evaluated, dtype=bool)
+    symbolic = np.asarray(symbolic, dtype=float)
+    has_semantic = np.asarray(has_semantic, dtype=bool) & evaluated
+    steps = len(owner)
+
+    # Consensus: mean of the provider scores, else the stored score
+    provider_step = np.asarray(provider_step, dtype=np.intp)
+    provider_value = np.asarray(provider_value, dtype=float)
+    provider_sum = np.bincount(provider_step, weights=provider_value, minlength=steps)
+    provider_count = np.bincount(provider_step, minlength=steps)
+    semantic = np.where(
+        provider_count > 0,
+        provider_sum / np.maximum(provider_count, 1),
+        np.asarray(stored_semantic, dtype=float)
+    )
+
+    # Per-result means over evaluated steps (0 without any)
+    symbolic_count = np.bincount(owner, weights=evaluated, minlength=count)
+    symbolic_mean = np.bincount(owner, weights=symbolic * evaluated, minlength=count) / np.maximum(symbolic_count, 1)
+    semantic_count = np.bincount(owner, weights=has_semantic, minlength=count)
+    semantic_mean = np.bincount(owner, weights=semantic * has_semantic, minlength=count) / np.maximum(semantic_count, 1)
+    lii = symbolic_mean * symbolic_weight + semantic_mean * semantic_weight
+
+    # Sample variance of the semantic scores (two-pass)
+    deviation = (semantic - semantic_mean[owner]) * has_semantic
+    squares = np.bincount(owner, weights=deviation ** 2, minlength=count)
+    spread = semantic_count > 1
+    variance = np.where(spread, squares / np.maximum(semantic_count - 1, 1), 0.0)
+    std_dev = np.sqrt(variance)
+    lower = np.where(spread, np.maximum(0.0, lii - std_dev * 1.96), lii - 5)
+    upper = np.where(spread, np.minimum(100.0, lii + std_dev * 1.96), lii + 5)
+    coherence = np.where(spread, np.maximum(0.0, 100 - variance / 10), 100.0)
+
+    # Unevaluated steps and circular or dangling justifications invalidate a proof
+    incomplete = np.bincount(owner, weights=~evaluated, minlength=count) > 0
+    broken = np.bincount(owner, weights=~np.asarray(valid_dependencies, dtype=bool), minlength=count) > 0
+    is_valid = (lii >= pass_threshold) & ~incomplete & ~broken
+
+    hybrid = np.round(symbolic * symbolic_weight + semantic * semantic_weight, 2)
+    semantic = np.round(semantic, 2)
+    rescored = []
+    step = 0
+    for position, step_results in enumerate(results):
+        updated = []
+        for step_result in step_results:
+            if has_semantic[step]:
+                step_result = {
+                    **step_result,
+                    "semantic_score": float(semantic[step]),
+                    "hybrid_score": float(hybrid[step]),
+                }
+            updated.append(step_result)
+            step += 1
+        rescored.append({
+            "is_valid": bool(is_valid[position]),
+            "lii_score": round(float(lii[position]), 2),
+            "confidence_interval": [round(float(lower[position]), 2), round(float(upper[position]), 2)],
+            "coherence_score": round(float(coherence[position]), 2),
+            "step_results": updated,
+        })
+    return rescored
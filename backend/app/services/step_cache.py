@@ -0,0 +1,211 @@
+# [B] ProofBench Backend - Step Result Cache
+# Bounded, expiring cache of step verdicts and LLM scores shared across proofs
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence, Tuple
+
+from app.services.symbolic.parse_cache import normalize_source
+from app.services.symbolic.results import DECISIVE_STEP_STATUSES
+
+
+# Bump when the key layout or the stored values change
+STEP_CACHE_VERSION = "1"
+
+
+def _canonical_text(text) -> str:
+    """Whitespace-collapsed, case-folded text"""
+    return " ".join(str(text).split()).casefold()
+
+
+def _canonical_equation(equation):
+    """Equation with each side tokenizer-normalized (see normalize_source)"""
+    if isinstance(equation, dict):
+        return {str(key): normalize_source(str(value)) for key, value in sorted(equation.items())}
+    if isinstance(equation, str):
+        return [normalize_source(side) for side in equation.split("=")]
+    return None
+
+
+def scoring_config_version(providers: Sequence[str]) -> str:
+    """
+    Version of everything besides the step that cached values depend on.
+
+    Args:
+        providers: Names of the LLM providers scoring steps
+
+    Returns:
+        str: Short digest (changes when the provider set or cache format does)
+    """
+    payload = json.dumps([STEP_CACHE_VERSION, sorted(providers)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def symbolic_cache_key(equation_key: str) -> str:
+    """
+    Symbolic-tier cache key of an equation.
+
+    A symbolic verdict depends only on the equation and domain, so the key
+    is their structural key (hashing.equation_hash, computed in the
+    symbolic pool): steps with different claims, or with commutative or
+    swapped-side variants of the same equation, share the verdict.
+
+    Args:
+        equation_key: See BackendSymbolicVerifier.equation_key()
+
+    Returns:
+        str: "symbolic:" followed by the equation key
+    """
+    return f"symbolic:{equation_key}"
+
+
+def step_cache_key(step, domain: str, config_version: str) -> str:
+    """
+    Semantic-tier cache key of a step: domain, normalized claim (and
+    reasoning), canonical equation and scoring config version.
+
+    Args:
+        step: ProofStep entity
+        domain: Mathematical domain
+        config_version: See scoring_config_version()
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    reasoning = getattr(step, "reasoning", None)
+    payload = json.dumps({
+        "domain": _canonical_text(domain),
+        "claim": _canonical_text(step.claim),
+        "reasoning": _canonical_text(reasoning) if isinstance(reasoning, str) else None,
+        "equation": _canonical_equation(getattr(step, "equation", None)),
+        "config": config_version,
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class StepResultCache:
+    """
+    Thread-safe LRU cache of step outcomes, with a time to live.
+
+    Symbolic verdicts are stored under symbolic_cache_key() and
+    per-provider semantic scores under step_cache_key(); the two key spaces
+    never overlap. Lives in the
+    process's shared BackendProofEngine, so it serves every proof verified
+    by that process.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 86400.0):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached steps (0 disables caching)
+            ttl: Seconds an entry stays valid after it was created
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.symbolic_hits = 0
+        self.symbolic_misses = 0
+        self.semantic_hits = 0
+        self.semantic_misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are kept at all"""
+        return self.maxsize > 0
+
+    def get_symbolic(self, key: str) -> Optional[Tuple[bool, str]]:
+        """Cached (symbolic_pass, symbolic_status) of a step, or None"""
+        if not self.enabled:
+            return None
+        value = self._get(key, "symbolic")
+        with self._lock:
+            if value is None:
+                self.symbolic_misses += 1
+            else:
+                self.symbolic_hits += 1
+        return value
+
+    def get_semantic(self, key: str) -> Optional[Dict[str, float]]:
+        """Cached per-provider semantic scores of a step, or None"""
+        if not self.enabled:
+            return None
+        value = self._get(key, "semantic")
+        with self._lock:
+            if value is None:
+                self.semantic_misses += 1
+            else:
+                self.semantic_hits += 1
+        return value
+
+    def put_symbolic(self, key: str, symbolic: Tuple[bool, str]) -> None:
+        """Cache a symbolic verdict (statuses not in DECISIVE_STEP_STATUSES are skipped)"""
+        if symbolic[1] in DECISIVE_STEP_STATUSES:
+            self._put(key, "symbolic", tuple(symbolic))
+
+    def put_semantic(self, key: str, provider_scores: Dict[str, float]) -> None:
+        """Cache per-provider semantic scores (empty results are skipped)"""
+        if provider_scores:
+            self._put(key, "semantic", dict(provider_scores))
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.symbolic_hits = self.symbolic_misses = 0
+            self.semantic_hits = self.semantic_misses = 0
+            self.evictions = self.expirations = 0
+
+    def get_stats(self) -> dict:
+        """Get cache statistics (hit rates per tier)"""
+        symbolic_lookups = self.symbolic_hits + self.symbolic_misses
+        semantic_lookups = self.semantic_hits + self.semantic_misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "symbolic_hits": self.symbolic_hits,
+            "symbolic_misses": self.symbolic_misses,
+            "symbolic_hit_rate": round(self.symbolic_hits / symbolic_lookups, 4) if symbolic_lookups else 0.0,
+            "semantic_hits": self.semantic_hits,
+            "semantic_misses": self.semantic_misses,
+            "semantic_hit_rate": round(self.semantic_hits / semantic_lookups, 4) if semantic_lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _get(self, key: str, field: str):
+        """Look up one field of an entry, dropping the entry if it expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["expires_at"] <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry[field]
+
+    def _put(self, key: str, field: str, value) -> None:
+        """Set one field of an entry, creating it (and evicting the oldest) if needed"""
+        if not self.enabled:
+            return
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["expires_at"] <= time.monotonic():
+                entry = {"symbolic": None, "semantic": None, "expires_at": time.monotonic() + self.ttl}
+                self._entries[key] = entry
+            entry[field] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
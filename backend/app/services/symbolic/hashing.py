@@ -0,0 +1,134 @@
+# [B] ProofBench Backend - Structural Expression Hashing
+# Commutativity-invariant hashes of parsed SymPy trees, used as cache keys
+
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+import sympy
+from sympy.parsing.sympy_parser import parse_expr
+
+from app.services.symbolic.parse_cache import TRANSFORMATIONS, expression_cache, normalize_source
+
+
+# Bump when the digest layout changes (invalidates persisted keys)
+HASH_VERSION = "1"
+
+DIGEST_SIZE = 16
+
+# Operators whose operands may be reordered (and regrouped) freely
+COMMUTATIVE_OPERATORS = (sympy.Add, sympy.Mul, sympy.And, sympy.Or, sympy.Xor, sympy.Max, sympy.Min)
+
+
+def parse_unevaluated(expression: str) -> sympy.Expr:
+    """
+    Parse an expression without evaluating it (cached).
+
+    evaluate=False only keeps operators such as "2**(10**10)" unevaluated;
+    function calls in the input (e.g. "expand((x + 1)**1500)") still run,
+    so untrusted input must only be parsed in a symbolic pool worker, under
+    its limits (see worker.equation_keys).
+
+    Raises:
+        Exception: Any parse error
+    """
+    return expression_cache.get_or_parse(expression, _parse_unevaluated, mode="unevaluated")
+
+
+def _parse_unevaluated(source: str) -> sympy.Expr:
+    """Parser used on parse-cache misses"""
+    return parse_expr(source, transformations=TRANSFORMATIONS, evaluate=False)
+
+
+def structural_hash(expr: sympy.Basic) -> str:
+    """
+    Compute a stable structural hash of a SymPy tree.
+
+    Operands of commutative operators are hashed as a sorted multiset and
+    nested applications of the same operator are flattened, so "x + 5" and
+    "5 + x", "2*x" and "x*2", or "(a + b) + c" and "a + (b + c)" hash
+    equally. No algebra is performed: "x - x" and "0" hash differently.
+
+    The traversal is iterative (deep trees cannot hit the recursion limit)
+    and shared subtrees are hashed once.
+
+    Args:
+        expr: Parsed expression
+
+    Returns:
+        str: Hex BLAKE2b digest
+    """
+    # Per node: (digest, operand digests when it is a commutative operator)
+    done: Dict[int, Tuple[bytes, Optional[List[bytes]]]] = {}
+    stack = [(expr, False)]
+
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in done:
+            continue
+        if node.args and not expanded:
+            stack.append((node, True))
+            stack.extend((arg, False) for arg in node.args)
+            continue
+
+        head = getattr(node.func, "__name__", type(node).__name__)
+        digest = hashlib.blake2b(head.encode("utf-8"), digest_size=DIGEST_SIZE)
+
+        if not node.args:
+            digest.update(b"\x00" + str(node).encode("utf-8"))
+            done[id(node)] = (digest.digest(), None)
+            continue
+
+        operands: Optional[List[bytes]] = None
+        if isinstance(node, COMMUTATIVE_OPERATORS) and node.is_commutative is not False:
+            operands = []
+            for arg in node.args:
+                arg_digest, arg_operands = done[id(arg)]
+                if arg_operands is not None and arg.func is node.func:
+                    operands.extend(arg_operands)  # Associativity: flatten
+                else:
+                    operands.append(arg_digest)
+            children = sorted(operands)
+        else:
+            children = [done[id(arg)][0] for arg in node.args]
+
+        digest.update(b"\x01")
+        for child in children:
+            digest.update(child)
+        done[id(node)] = (digest.digest(), operands)
+
+    return done[id(expr)][0].hex()
+
+
+def equation_hash(lhs: str, rhs: str, domain: str) -> str:
+    """
+    Compute the canonical key of an equation "lhs = rhs" in a domain.
+
+    Each side is reduced to its structural hash and the two are sorted, so
+    "a = b" and "b = a" share a key. Sides that do not parse fall back to
+    their normalized source text.
+
+    Parses both sides: call it in a symbolic pool worker (see
+    SymbolicExecutionPool.equation_keys), never on untrusted input in the
+    API process.
+
+    Args:
+        lhs: Left-hand side expression string
+        rhs: Right-hand side expression string
+        domain: Mathematical domain of the proof
+
+    Returns:
+        str: Hex BLAKE2b digest
+    """
+    sides = sorted(_side_key(side) for side in (lhs, rhs))
+    payload = "\x1f".join((HASH_VERSION, domain.strip().lower(), *sides))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=DIGEST_SIZE).hexdigest()
+
+
+def _side_key(expression: str) -> str:
+    """Structural hash of one side, or its normalized text if it does not parse"""
+    try:
+        return "h:" + structural_hash(parse_unevaluated(expression))
+    except (MemoryError, RecursionError):
+        raise
+    except Exception:
+        return "s:" + normalize_source(expression)
@@ -0,0 +1,92 @@
+# [B] ProofBench Backend - Staged Simplification Ladder
+# Cheap canonicalizers first, full sympy.simplify only as the last resort
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import sympy
+
+from app.services.symbolic.limits import SymbolicTimeoutError, time_limit
+
+
+# Canonicalizers in default order, cheapest first
+STAGES: Dict[str, Callable[[sympy.Expr], sympy.Expr]] = {
+    "expand": sympy.expand,
+    "cancel": sympy.cancel,
+    "together": sympy.together,
+    "ratsimp": sympy.ratsimp,
+    "trigsimp": sympy.trigsimp,
+    "simplify": sympy.simplify,
+}
+
+DEFAULT_LADDER: Tuple[str, ...] = tuple(STAGES)
+
+# Per-stage time budgets in seconds (still capped by the job deadline)
+DEFAULT_STAGE_BUDGETS: Dict[str, float] = {
+    "expand": 1.0,
+    "cancel": 1.0,
+    "together": 0.5,
+    "ratsimp": 1.0,
+    "trigsimp": 2.0,
+    "simplify": 5.0,
+}
+
+
+class LadderOutcome:
+    """Result of running the ladder on an expression"""
+
+    def __init__(self, is_zero: Optional[bool], stage: Optional[str], timed_out: List[str]):
+        # True: reduced to zero; False: last stage finished with a non-zero
+        # result; None: last stage ran out of budget
+        self.is_zero = is_zero
+        self.stage = stage
+        self.timed_out = timed_out
+
+
+def run_ladder(
+    difference: sympy.Expr,
+    stages: Sequence[str],
+    budgets: Dict[str, float]
+) -> LadderOutcome:
+    """
+    Apply canonicalizers in order until the difference reduces to zero.
+
+    Every stage is applied to the original difference, so a stage that
+    blows an expression up (e.g. expand on a trig identity) does not slow
+    down the stages after it.
+
+    Args:
+        difference: lhs - rhs
+        stages: Ordered stage names (keys of STAGES)
+        budgets: Per-stage time budgets in seconds (missing = no stage budget)
+
+    Returns:
+        LadderOutcome: Deciding stage and the stages that ran out of budget
+
+    Raises:
+        SymbolicTimeoutError: If the job-level deadline (not a stage budget) expired
+    """
+    if difference == 0:
+        return LadderOutcome(True, "identity", [])
+
+    timed_out: List[str] = []
+    last_stage: Optional[str] = None
+    last_zero: Optional[bool] = None
+
+    for stage in stages:
+        last_stage = stage
+        limit = None
+        try:
+            with time_limit(budgets.get(stage)) as limit:
+                reduced = STAGES[stage](difference)
+        except SymbolicTimeoutError as e:
+            if limit is None or e.limit is not limit:
+                raise  # Job deadline, not this stage's budget
+            timed_out.append(stage)
+            last_zero = None
+            continue
+
+        if reduced == 0:
+            return LadderOutcome(True, stage, timed_out)
+        last_zero = False
+
+    return LadderOutcome(last_zero, last_stage, timed_out)
@@ -0,0 +1,96 @@
+# [B] ProofBench Backend - Symbolic Worker Limits
+# Wall-clock deadlines and memory caps applied inside pool worker processes
+
+import os
+import signal
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows: memory caps are not available
+    resource = None
+
+
+# Re-fire interval for deadline alarms whose exception was swallowed
+# (signal handlers that run inside __del__ or GC callbacks cannot propagate)
+ALARM_RETRY_INTERVAL = 0.05
+
+
+class SymbolicTimeoutError(BaseException):
+    """
+    Raised inside a worker when a job or stage exceeds its wall-clock limit.
+
+    Derives from BaseException so that SymPy's internal `except Exception`
+    blocks cannot swallow it. `limit` identifies the time_limit() block
+    whose timer fired.
+    """
+
+    def __init__(self, message: str, limit: object = None):
+        super().__init__(message)
+        self.limit = limit
+
+
+def limit_address_space(extra_bytes: int) -> None:
+    """Set RLIMIT_AS to the current virtual size plus extra_bytes (POSIX only)"""
+    if resource is None:
+        return
+    try:
+        with open("/proc/self/statm") as statm:
+            current = int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        current = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    limit = current + extra_bytes
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+@contextmanager
+def time_limit(seconds: Optional[float]) -> Iterator[Optional[object]]:
+    """
+    Raise SymbolicTimeoutError if the block runs longer than `seconds`.
+
+    Uses SIGALRM, which interrupts pure-Python SymPy code between bytecodes.
+    Where SIGALRM is unavailable the pool's hard timeout still applies.
+
+    Blocks nest: an inner block never extends an outer deadline, and the
+    outer timer is re-armed with its remaining time when the inner block
+    exits. A fired timer keeps re-firing every ALARM_RETRY_INTERVAL until
+    the block exits, in case the first exception was raised inside a
+    finalizer and discarded by the interpreter.
+
+    Yields:
+        A token matching SymbolicTimeoutError.limit when this block's timer
+        fires, or None if no timer was installed (an outer deadline is sooner)
+    """
+    if not seconds or not hasattr(signal, "setitimer"):
+        yield None
+        return
+
+    outer_remaining = signal.getitimer(signal.ITIMER_REAL)[0]
+    if outer_remaining and outer_remaining <= seconds:
+        yield None
+        return
+
+    token = object()
+
+    def _on_alarm(signum, frame):
+        raise SymbolicTimeoutError(f"Symbolic check exceeded {seconds:.2f}s", token)
+
+    started = time.monotonic()
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds, ALARM_RETRY_INTERVAL)
+    try:
+        yield token
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+        if outer_remaining:
+            # Re-arm the enclosing deadline (fires almost at once if already due)
+            elapsed = time.monotonic() - started
+            signal.setitimer(
+                signal.ITIMER_REAL, max(outer_remaining - elapsed, 1e-3), ALARM_RETRY_INTERVAL
+            )
@@ -0,0 +1,323 @@
+# [B] ProofBench Backend - Propositional Logic Equivalence
+# Bitset truth tables over all assignments, with a SAT fallback for wide formulas
+
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import sympy
+from sympy.logic import boolalg
+from sympy.logic.inference import satisfiable
+from sympy.parsing.sympy_parser import parse_expr
+
+from app.services.symbolic.parse_cache import expression_cache
+
+
+# Default variable count up to which truth tables are enumerated (2^24 rows = 2 MB per column)
+DEFAULT_MAX_VARS = 24
+
+# Names that keep their SymPy meaning inside logic formulas; every other
+# identifier is a propositional variable (so "Q", "E", "S" are not SymPy objects)
+LOGIC_NAMES = {
+    "And", "Or", "Not", "Xor", "Nand", "Nor", "Xnor", "Implies", "Equivalent", "ITE",
+    "true", "false", "True", "False",
+}
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+_ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+# Bit patterns of the six variables that vary inside a single 64-bit word
+_LOW_PATTERNS = [
+    np.uint64(0xAAAAAAAAAAAAAAAA),
+    np.uint64(0xCCCCCCCCCCCCCCCC),
+    np.uint64(0xF0F0F0F0F0F0F0F0),
+    np.uint64(0xFF00FF00FF00FF00),
+    np.uint64(0xFFFF0000FFFF0000),
+    np.uint64(0xFFFFFFFF00000000),
+]
+
+
+def parse_formula(expression: str) -> sympy.Basic:
+    """
+    Parse a propositional formula (cached).
+
+    Uses Python operator syntax: & (and), | (or), ~ (not), >> (implies),
+    ^ (xor), plus the SymPy functions listed in LOGIC_NAMES.
+
+    Raises:
+        Exception: Any parse error
+    """
+    return expression_cache.get_or_parse(expression, _parse_formula_uncached, mode="logic")
+
+
+def _parse_formula_uncached(source: str) -> sympy.Basic:
+    """Parser used on parse-cache misses"""
+    local_dict = {
+        name: sympy.Symbol(name)
+        for name in set(_IDENTIFIER.findall(source)) if name not in LOGIC_NAMES
+    }
+    return parse_expr(source, local_dict=local_dict)
+
+
+def is_formula(expr: sympy.Basic) -> bool:
+    """Whether expr is a propositional formula (boolean connectives over symbols)"""
+    if isinstance(expr, sympy.Symbol):
+        return True
+    if not isinstance(expr, boolalg.Boolean):
+        return False
+    return all(
+        isinstance(node, (sympy.Symbol, boolalg.BooleanFunction, boolalg.BooleanAtom))
+        for node in sympy.preorder_traversal(expr)
+    )
+
+
+def _variable_columns(variables: List[sympy.Symbol]) -> Tuple[Dict[sympy.Symbol, np.ndarray], int]:
+    """
+    Build the packed truth-table column of every variable.
+
+    Row k of the table assigns bit i of k to variable i; rows are packed 64
+    to a uint64 word.
+
+    Returns:
+        (columns by variable, number of words)
+    """
+    words = max(1, (1 << len(variables)) // 64)
+    word_index = np.arange(words, dtype=np.uint64)
+    columns = {}
+    for i, variable in enumerate(variables):
+        if i < 6:
+            columns[variable] = np.full(words, _LOW_PATTERNS[i], dtype=np.uint64)
+        else:
+            selected = ((word_index >> np.uint64(i - 6)) & np.uint64(1)).astype(bool)
+            columns[variable] = np.where(selected, _ALL_ONES, np.uint64(0))
+    return columns, words
+
+
+def _reduce(op, operands: List[np.ndarray]) -> np.ndarray:
+    """Fold a bitwise ufunc over operand columns"""
+    result = operands[0].copy()
+    for operand in operands[1:]:
+        op(result, operand, out=result)
+    return result
+
+
+def _apply(node: sympy.Basic, operands: List[np.ndarray]) -> np.ndarray:
+    """Evaluate one connective on packed columns"""
+    if isinstance(node, boolalg.And):
+        return _reduce(np.bitwise_and, operands)
+    if isinstance(node, boolalg.Or):
+        return _reduce(np.bitwise_or, operands)
+    if isinstance(node, boolalg.Not):
+        return ~operands[0]
+    if isinstance(node, boolalg.Xor):
+        return _reduce(np.bitwise_xor, operands)
+    if isinstance(node, boolalg.Nand):
+        return ~_reduce(np.bitwise_and, operands)
+    if isinstance(node, boolalg.Nor):
+        return ~_reduce(np.bitwise_or, operands)
+    if isinstance(node, boolalg.Xnor):
+        return ~_reduce(np.bitwise_xor, operands)
+    if isinstance(node, boolalg.Implies):
+        return ~operands[0] | operands[1]
+    if isinstance(node, boolalg.Equivalent):
+        return _reduce(np.bitwise_and, operands) | ~_reduce(np.bitwise_or, operands)
+    if isinstance(node, boolalg.ITE):
+        condition, then, otherwise = operands
+        return (condition & then) | (~condition & otherwise)
+    raise ValueError(f"Unsupported connective: {type(node).__name__}")
+
+
+def truth_table(
+    expr: sympy.Basic,
+    columns: Dict[sympy.Symbol, np.ndarray],
+    words: int
+) -> np.ndarray:
+    """
+    Evaluate a formula on every assignment at once.
+
+    The tree is walked iteratively in post-order; intermediate columns are
+    released as soon as their last parent has consumed them.
+
+    Args:
+        expr: Propositional formula
+        columns: Packed column per variable (see _variable_columns)
+        words: Column length in uint64 words
+
+    Returns:
+        np.ndarray: Packed truth table of expr
+    """
+    # How many parents still need each node's column
+    pending = Counter(id(arg) for node in sympy.preorder_traversal(expr) for arg in node.args)
+    values: Dict[int, np.ndarray] = {}
+    stack = [(expr, False)]
+
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in values:
+            continue
+
+        if isinstance(node, sympy.Symbol):
+            values[id(node)] = columns[node]
+            continue
+        if isinstance(node, boolalg.BooleanTrue):
+            values[id(node)] = np.full(words, _ALL_ONES, dtype=np.uint64)
+            continue
+        if isinstance(node, boolalg.BooleanFalse):
+            values[id(node)] = np.zeros(words, dtype=np.uint64)
+            continue
+
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((arg, False) for arg in node.args)
+            continue
+
+        values[id(node)] = _apply(node, [values[id(arg)] for arg in node.args])
+        for arg in node.args:
+            pending[id(arg)] -= 1
+            if pending[id(arg)] <= 0:
+                values.pop(id(arg), None)
+
+    return values[id(expr)]
+
+
+class _TseitinEncoder:
+    """
+    Equisatisfiable CNF encoding with one auxiliary variable per connective.
+
+    Converting Xor(lhs, rhs) to CNF by distribution is exponential; the
+    Tseitin encoding is linear in the formula size.
+    """
+
+    def __init__(self):
+        self.clauses: List[sympy.Basic] = []
+
+    def _gate(self, kind: str, literals: List[sympy.Basic]) -> sympy.Basic:
+        """Return a fresh variable constrained to equal the gate output"""
+        out = sympy.Dummy("t")
+        if kind == "and":
+            self.clauses.extend(boolalg.Or(~out, literal) for literal in literals)
+            self.clauses.append(boolalg.Or(out, *(~literal for literal in literals)))
+        elif kind == "or":
+            self.clauses.extend(boolalg.Or(out, ~literal) for literal in literals)
+            self.clauses.append(boolalg.Or(~out, *literals))
+        else:  # Binary xor
+            a, b = literals
+            self.clauses.extend((
+                boolalg.Or(~out, a, b), boolalg.Or(~out, ~a, ~b),
+                boolalg.Or(out, ~a, b), boolalg.Or(out, a, ~b),
+            ))
+        return out
+
+    def xor(self, literals: List[sympy.Basic]) -> sympy.Basic:
+        result = literals[0]
+        for literal in literals[1:]:
+            result = self._gate("xor", [result, literal])
+        return result
+
+    def _connective(self, node: sympy.Basic, args: List[sympy.Basic]) -> sympy.Basic:
+        """Literal for one connective, given the literals of its arguments"""
+        if isinstance(node, boolalg.And):
+            return self._gate("and", args)
+        if isinstance(node, boolalg.Or):
+            return self._gate("or", args)
+        if isinstance(node, boolalg.Not):
+            return ~args[0]
+        if isinstance(node, boolalg.Xor):
+            return self.xor(args)
+        if isinstance(node, boolalg.Nand):
+            return ~self._gate("and", args)
+        if isinstance(node, boolalg.Nor):
+            return ~self._gate("or", args)
+        if isinstance(node, boolalg.Xnor):
+            return ~self.xor(args)
+        if isinstance(node, boolalg.Implies):
+            return self._gate("or", [~args[0], args[1]])
+        if isinstance(node, boolalg.Equivalent):
+            all_true = self._gate("and", args)
+            all_false = self._gate("and", [~arg for arg in args])
+            return self._gate("or", [all_true, all_false])
+        if isinstance(node, boolalg.ITE):
+            condition, then, otherwise = args
+            return self._gate("or", [
+                self._gate("and", [condition, then]),
+                self._gate("and", [~condition, otherwise]),
+            ])
+        raise ValueError(f"Unsupported connective: {type(node).__name__}")
+
+    def encode(self, expr: sympy.Basic) -> sympy.Basic:
+        """Add the clauses of expr (iteratively) and return its output literal"""
+        literals: Dict[int, sympy.Basic] = {}
+        stack = [(expr, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in literals:
+                continue
+            if isinstance(node, (sympy.Symbol, boolalg.BooleanAtom)):
+                literals[id(node)] = node
+                continue
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((arg, False) for arg in node.args)
+                continue
+            literals[id(node)] = self._connective(node, [literals[id(arg)] for arg in node.args])
+        return literals[id(expr)]
+
+
+def _sat_difference(lhs_expr: sympy.Basic, rhs_expr: sympy.Basic):
+    """Search for an assignment where the formulas differ (False if none exists)"""
+    encoder = _TseitinEncoder()
+    difference = encoder.xor([encoder.encode(lhs_expr), encoder.encode(rhs_expr)])
+    return satisfiable(boolalg.And(difference, *encoder.clauses))
+
+
+def _counterexample(difference: np.ndarray, variables: List[sympy.Symbol]) -> Dict[str, bool]:
+    """Decode the first row where the two truth tables differ"""
+    word = int(np.flatnonzero(difference)[0])
+    bits = int(difference[word])
+    row = word * 64 + ((bits & -bits).bit_length() - 1)
+    return {str(variable): bool((row >> i) & 1) for i, variable in enumerate(variables)}
+
+
+def logic_equivalence_check(
+    lhs_expr: sympy.Basic,
+    rhs_expr: sympy.Basic,
+    max_vars: int = DEFAULT_MAX_VARS
+) -> Tuple[bool, str, Optional[Dict[str, bool]]]:
+    """
+    Decide whether two propositional formulas are equivalent.
+
+    Formulas over at most max_vars variables are compared on their full
+    truth tables, packed into uint64 bitsets and evaluated with NumPy.
+    Wider formulas are decided by a SAT search (DPLL on a Tseitin encoding)
+    for an assignment where the two sides differ.
+
+    Args:
+        lhs_expr: Parsed left-hand side formula
+        rhs_expr: Parsed right-hand side formula
+        max_vars: Largest variable count for truth-table enumeration
+
+    Returns:
+        (equivalent, method, counterexample): method is "truth_table" or
+        "sat"; counterexample is an assignment where the sides differ
+        (None when equivalent)
+    """
+    variables = sorted(lhs_expr.free_symbols | rhs_expr.free_symbols, key=str)
+
+    if len(variables) > max_vars:
+        model = _sat_difference(lhs_expr, rhs_expr)
+        if model is False:
+            return True, "sat", None
+        counterexample = {str(variable): bool(model.get(variable, False)) for variable in variables}
+        return False, "sat", counterexample
+
+    columns, words = _variable_columns(variables)
+    difference = truth_table(lhs_expr, columns, words) ^ truth_table(rhs_expr, columns, words)
+    if len(variables) < 6:
+        # Rows beyond 2^n in the single word are padding
+        difference &= np.uint64((1 << (1 << len(variables))) - 1)
+
+    if not difference.any():
+        return True, "truth_table", None
+    return False, "truth_table", _counterexample(difference, variables)
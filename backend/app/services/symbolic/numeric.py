@@ -0,0 +1,69 @@
+# [B] ProofBench Backend - Numeric Identity Pre-check
+# Randomized floating-point evaluation used before exact simplification
+
+from typing import Optional
+
+import numpy as np
+import sympy
+
+
+def numeric_identity_check(
+    lhs_expr: sympy.Expr,
+    rhs_expr: sympy.Expr,
+    points: int = 8,
+    tolerance: float = 1e-9,
+    rng: Optional[np.random.Generator] = None
+) -> Optional[bool]:
+    """
+    Compare two expressions numerically at random complex points.
+
+    Both sides are lambdified with NumPy and evaluated on the same batch of
+    points z = r * e^(i*theta), r in [0.5, 1.5]. Complex points avoid false
+    agreement for branch-dependent identities (sqrt, log) and keep
+    magnitudes moderate so that round-off stays small.
+
+    Args:
+        lhs_expr: Parsed left-hand side
+        rhs_expr: Parsed right-hand side
+        points: Number of random evaluation points
+        tolerance: Relative/absolute tolerance for np.isclose
+        rng: Random generator (default: fresh np.random.default_rng())
+
+    Returns:
+        False: Clear mismatch (a majority of valid points disagree)
+        True: Agreement at every valid point ("probably equal")
+        None: Inconclusive (unsupported functions, overflow, mixed results)
+    """
+    if not isinstance(lhs_expr, sympy.Expr) or not isinstance(rhs_expr, sympy.Expr):
+        return None
+
+    rng = rng or np.random.default_rng()
+    symbols = sorted(lhs_expr.free_symbols | rhs_expr.free_symbols, key=str)
+
+    radius = rng.uniform(0.5, 1.5, size=(len(symbols), points))
+    angle = rng.uniform(0.0, 2 * np.pi, size=(len(symbols), points))
+    samples = radius * np.exp(1j * angle)
+
+    try:
+        lhs_fn = sympy.lambdify(symbols, lhs_expr, modules="numpy")
+        rhs_fn = sympy.lambdify(symbols, rhs_expr, modules="numpy")
+        with np.errstate(all="ignore"):
+            lhs_values = np.broadcast_to(np.asarray(lhs_fn(*samples), dtype=complex), (points,))
+            rhs_values = np.broadcast_to(np.asarray(rhs_fn(*samples), dtype=complex), (points,))
+    except MemoryError:
+        raise
+    except Exception:
+        # Functions without a NumPy equivalent, non-numeric results, etc.
+        return None
+
+    valid = np.isfinite(lhs_values) & np.isfinite(rhs_values)
+    valid_count = int(valid.sum())
+    if valid_count * 2 < points:
+        return None
+
+    close = np.isclose(lhs_values[valid], rhs_values[valid], rtol=tolerance, atol=tolerance)
+    if close.all():
+        return True
+    if (~close).sum() * 2 > valid_count:
+        return False
+    return None
@@ -0,0 +1,133 @@
+# [B] ProofBench Backend - Parsed Expression Cache
+# Bounded LRU cache of SymPy parse results keyed by normalized source text
+
+import io
+import threading
+import tokenize
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from sympy.parsing.sympy_parser import standard_transformations, implicit_multiplication_application
+
+from app.core.config import settings
+
+
+# Standard transformations for parsing (shared by pool workers, hashing and BackendSymbolicVerifier)
+TRANSFORMATIONS = standard_transformations + (implicit_multiplication_application,)
+
+# Token types that carry no meaning for expression parsing
+_SKIPPED_TOKENS = {
+    tokenize.NEWLINE, tokenize.NL, tokenize.ENDMARKER,
+    tokenize.INDENT, tokenize.DEDENT, tokenize.COMMENT,
+}
+
+
+def normalize_source(expression: str) -> str:
+    """
+    Normalize expression text for use as a cache key.
+
+    The text is tokenized the same way parse_expr tokenizes it and the
+    tokens are re-joined with single spaces, so "x+5", "x + 5" and
+    " x  +5 " share one key while token boundaries ("x y" vs "xy") are kept.
+
+    Args:
+        expression: Raw expression string
+
+    Returns:
+        str: Normalized source (whitespace-collapsed text if tokenizing fails)
+    """
+    try:
+        tokens = [
+            token.string
+            for token in tokenize.generate_tokens(io.StringIO(expression.strip()).readline)
+            if token.type not in _SKIPPED_TOKENS
+        ]
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        return " ".join(expression.split())
+    return " ".join(tokens)
+
+
+class ExpressionCache:
+    """
+    Thread-safe LRU cache of parsed expressions.
+
+    Parsed SymPy expressions are immutable, so cached objects can be shared
+    freely between callers. Parse failures are not cached.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of cached expressions (0 disables caching)
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_parse(self, expression: str, parser: Callable[[str], Any], mode: str = "default") -> Any:
+        """
+        Return the cached parse of expression, parsing it on a miss.
+
+        The normalized source is only the key: the stripped original text is
+        parsed, since re-joined tokens change the meaning of some notations
+        (postfix factorial "n!" would become "n !").
+
+        Args:
+            expression: Raw expression string
+            parser: Function that parses the source
+            mode: Parser variant, part of the key (e.g. "default", "unevaluated")
+
+        Returns:
+            Parsed expression
+
+        Raises:
+            Exception: Whatever parser raises (failures are not cached)
+        """
+        source = normalize_source(expression)
+        key = (mode, source)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        parsed = parser(expression.strip())
+
+        if self.maxsize > 0:
+            with self._lock:
+                self._entries[key] = parsed
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+
+        return parsed
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# [+] Global expression cache (one per process: API server and each pool worker)
+expression_cache = ExpressionCache(settings.SYMBOLIC_PARSE_CACHE_SIZE)
@@ -0,0 +1,265 @@
+# [B] ProofBench Backend - Polynomial Identity Fast Path
+# Exact evaluation of rational-function identities over a prime field
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+import sympy
+
+try:
+    import flint  # python-flint: optional C-backed modular arithmetic
+except ImportError:
+    flint = None
+
+
+# Mersenne prime 2^61 - 1
+PRIME = (1 << 61) - 1
+
+# Identities whose degree bound exceeds this are left to the general path,
+# keeping the per-trial false-agreement probability below degree / PRIME
+# (about 2^-29 here)
+MAX_DEGREE = 1 << 32
+
+# Evaluation points tried per trial before giving up on vanishing denominators
+MAX_POINT_RETRIES = 4
+
+
+class _IntField:
+    """Arithmetic modulo PRIME using Python integers"""
+
+    name = "python"
+
+    def lift(self, value: int) -> int:
+        return value % PRIME
+
+    def add(self, a: int, b: int) -> int:
+        return (a + b) % PRIME
+
+    def mul(self, a: int, b: int) -> int:
+        return (a * b) % PRIME
+
+    def inverse(self, value: int) -> int:
+        if value == 0:
+            raise ZeroDivisionError("inverse of zero")
+        return pow(value, -1, PRIME)
+
+    def power(self, base: int, exponent: int) -> int:
+        if exponent < 0:
+            return pow(self.inverse(base), -exponent, PRIME)
+        return pow(base, exponent, PRIME)
+
+    def to_int(self, value: int) -> int:
+        return value
+
+
+class _FlintField(_IntField):
+    """Arithmetic modulo PRIME using python-flint nmod values"""
+
+    name = "flint"
+
+    def lift(self, value: int):
+        return flint.nmod(value % PRIME, PRIME)
+
+    def add(self, a, b):
+        return a + b
+
+    def mul(self, a, b):
+        return a * b
+
+    def inverse(self, value):
+        if int(value) == 0:
+            raise ZeroDivisionError("inverse of zero")
+        return 1 / value
+
+    def power(self, base, exponent: int):
+        if exponent < 0:
+            return self.inverse(base) ** -exponent
+        return base ** exponent
+
+    def to_int(self, value) -> int:
+        return int(value)
+
+
+def get_field(backend: str = "auto") -> _IntField:
+    """
+    Select the modular arithmetic backend.
+
+    Args:
+        backend: "auto" (flint when installed), "flint" or "python"
+    """
+    if backend == "flint" or (backend == "auto" and flint is not None):
+        if flint is None:
+            raise ImportError("python-flint is not installed")
+        return _FlintField()
+    return _IntField()
+
+
+def rational_degree_bound(expr: sympy.Basic) -> Optional[Tuple[int, int]]:
+    """
+    Detect rational functions with rational coefficients and bound their degree.
+
+    Accepted nodes: symbols, rational numbers, sums, products and integer
+    powers. Anything else (floats, functions, symbolic or fractional
+    exponents, I, infinities) is rejected.
+
+    Args:
+        expr: Parsed expression
+
+    Returns:
+        (numerator degree, denominator degree) upper bounds, or None if expr
+        is not a rational function
+    """
+    bounds: Dict[int, Tuple[int, int]] = {}
+    stack = [(expr, False)]
+
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in bounds:
+            continue
+
+        if isinstance(node, sympy.Symbol):
+            bounds[id(node)] = (1, 0)
+            continue
+        if isinstance(node, sympy.Rational):
+            bounds[id(node)] = (0, 0)
+            continue
+
+        if isinstance(node, sympy.Pow):
+            if not isinstance(node.exp, sympy.Integer):
+                return None
+            children = [node.base]
+        elif isinstance(node, (sympy.Add, sympy.Mul)):
+            children = list(node.args)
+        else:
+            return None
+
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((child, False) for child in children)
+            continue
+
+        child_bounds = [bounds[id(child)] for child in children]
+        if isinstance(node, sympy.Pow):
+            num, den = child_bounds[0]
+            exponent = int(node.exp)
+            if exponent >= 0:
+                bound = (num * exponent, den * exponent)
+            else:
+                bound = (den * -exponent, num * -exponent)
+        elif isinstance(node, sympy.Mul):
+            bound = (sum(b[0] for b in child_bounds), sum(b[1] for b in child_bounds))
+        else:
+            # Common denominator of a sum
+            den_total = sum(b[1] for b in child_bounds)
+            bound = (max(b[0] + den_total - b[1] for b in child_bounds), den_total)
+        bounds[id(node)] = bound
+
+    return bounds[id(expr)]
+
+
+def _evaluate(expr: sympy.Basic, point: Dict[sympy.Symbol, object], field: _IntField):
+    """
+    Evaluate a rational function at a point modulo PRIME.
+
+    Raises:
+        ZeroDivisionError: If a denominator vanishes at the point
+    """
+    values: Dict[int, object] = {}
+    stack = [(expr, False)]
+
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in values:
+            continue
+
+        if isinstance(node, sympy.Symbol):
+            values[id(node)] = point[node]
+            continue
+        if isinstance(node, sympy.Rational):
+            values[id(node)] = field.mul(field.lift(node.p), field.inverse(field.lift(node.q)))
+            continue
+
+        children = [node.base] if isinstance(node, sympy.Pow) else list(node.args)
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((child, False) for child in children)
+            continue
+
+        if isinstance(node, sympy.Pow):
+            value = field.power(values[id(node.base)], int(node.exp))
+        elif isinstance(node, sympy.Mul):
+            value = field.lift(1)
+            for child in children:
+                value = field.mul(value, values[id(child)])
+        else:
+            value = field.lift(0)
+            for child in children:
+                value = field.add(value, values[id(child)])
+        values[id(node)] = value
+
+    return values[id(expr)]
+
+
+def modular_identity_check(
+    lhs_expr: sympy.Expr,
+    rhs_expr: sympy.Expr,
+    trials: int = 3,
+    rng: Optional[random.Random] = None,
+    backend: str = "auto"
+) -> Optional[bool]:
+    """
+    Decide a rational-function identity by evaluation modulo a large prime.
+
+    By the Schwartz-Zippel lemma two different rational functions of total
+    degree at most d agree at a uniformly random point of GF(p) with
+    probability at most d / p, so agreement at `trials` independent points
+    proves equality up to an error of (d / p) ** trials. A disagreement is
+    always a proof of inequality.
+
+    Args:
+        lhs_expr: Parsed left-hand side
+        rhs_expr: Parsed right-hand side
+        trials: Number of random evaluation points
+        rng: Random generator (default: fresh random.SystemRandom())
+        backend: Arithmetic backend (see get_field)
+
+    Returns:
+        True: Equal as rational functions
+        False: Not equal
+        None: Not a rational-function identity, degree too high, or every
+            sampled point hit a vanishing denominator
+    """
+    lhs_bound = rational_degree_bound(lhs_expr)
+    rhs_bound = rational_degree_bound(rhs_expr) if lhs_bound is not None else None
+    if lhs_bound is None or rhs_bound is None:
+        return None
+
+    # Degree of lhs_num * rhs_den - rhs_num * lhs_den
+    degree = max(lhs_bound[0] + rhs_bound[1], rhs_bound[0] + lhs_bound[1])
+    if degree > MAX_DEGREE:
+        return None
+
+    for constant in (lhs_expr.atoms(sympy.Rational) | rhs_expr.atoms(sympy.Rational)):
+        if constant.q % PRIME == 0:
+            return None
+
+    rng = rng or random.SystemRandom()
+    field = get_field(backend)
+    symbols: List[sympy.Symbol] = sorted(lhs_expr.free_symbols | rhs_expr.free_symbols, key=str)
+
+    for _ in range(trials):
+        for _ in range(MAX_POINT_RETRIES):
+            point = {symbol: field.lift(rng.randrange(PRIME)) for symbol in symbols}
+            try:
+                lhs_value = field.to_int(_evaluate(lhs_expr, point, field))
+                rhs_value = field.to_int(_evaluate(rhs_expr, point, field))
+            except ZeroDivisionError:
+                continue
+            break
+        else:
+            return None
+
+        if lhs_value != rhs_value:
+            return False
+
+    return True
@@ -0,0 +1,265 @@
+# [B] ProofBench Backend - Symbolic Execution Pool
+# Warm process pool that keeps SymPy work off the FastAPI event loop
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import sympy
+
+from app.core.config import settings
+from app.services.symbolic import worker
+from app.services.symbolic import polynomial
+from app.services.symbolic.ladder import STAGES
+from app.services.symbolic.results import SymbolicOutcome
+
+
+# Extra time granted to the in-worker SIGALRM deadline before the pool
+# kills the worker process from the outside
+HARD_TIMEOUT_GRACE = 2.0
+
+
+class SymbolicExecutionPool:
+    """
+    Process pool for CPU-bound SymPy jobs.
+
+    Workers pre-import SymPy on start-up, receive (lhs, rhs, domain) jobs and
+    return plain-dict results. The pool is started lazily on first use and
+    can be warmed explicitly from the FastAPI lifespan.
+
+    Limits:
+    - Each job runs under a wall-clock deadline enforced inside the worker
+      (SIGALRM) and, as a backstop, by killing the worker processes.
+    - Each worker caps its address space, so runaway allocations fail with
+      MemoryError instead of exhausting the node.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        memory_limit_mb: Optional[int] = None
+    ):
+        """
+        Initialize pool configuration (no processes are started yet).
+
+        Args:
+            max_workers: Number of worker processes (default: settings.SYMBOLIC_POOL_SIZE)
+            timeout: Default per-job deadline in seconds (default: settings.SYMBOLIC_TIMEOUT)
+            memory_limit_mb: Per-worker memory cap (default: settings.SYMBOLIC_MEMORY_LIMIT_MB)
+        """
+        self.max_workers = max_workers or settings.SYMBOLIC_POOL_SIZE
+        self.timeout = timeout or settings.SYMBOLIC_TIMEOUT
+        self.memory_limit_mb = (
+            settings.SYMBOLIC_MEMORY_LIMIT_MB if memory_limit_mb is None else memory_limit_mb
+        )
+        # Tier configuration sent with every equation job
+        self.options: Dict = {
+            "polynomial_fastpath": settings.SYMBOLIC_POLYNOMIAL_FASTPATH,
+            "polynomial_trials": settings.SYMBOLIC_POLYNOMIAL_TRIALS,
+            "polynomial_backend": settings.SYMBOLIC_POLYNOMIAL_BACKEND,
+            "numeric_precheck": settings.SYMBOLIC_NUMERIC_PRECHECK,
+            "numeric_points": settings.SYMBOLIC_NUMERIC_POINTS,
+            "numeric_tolerance": settings.SYMBOLIC_NUMERIC_TOLERANCE,
+            "numeric_policy": settings.SYMBOLIC_NUMERIC_POLICY,
+            "logic_max_vars": settings.SYMBOLIC_LOGIC_MAX_VARS,
+            "ladder": list(settings.SYMBOLIC_LADDER),
+            "stage_budgets": dict(settings.SYMBOLIC_STAGE_BUDGETS),
+        }
+        unknown = [stage for stage in self.options["ladder"] if stage not in STAGES]
+        if unknown:
+            raise ValueError(f"Unknown simplification stages in SYMBOLIC_LADDER: {unknown}")
+        if self.options["polynomial_backend"] == "flint" and polynomial.flint is None:
+            raise ValueError("SYMBOLIC_POLYNOMIAL_BACKEND=flint requires python-flint")
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Incremented whenever workers are killed, so collateral failures can be retried
+        self._generation = 0
+
+    def start(self) -> None:
+        """Create the underlying executor if it is not running"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                # spawn: workers never inherit the event loop or DB connections
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=worker.init_worker,
+                initargs=(self.memory_limit_mb,),
+            )
+
+    async def warm_up(self) -> None:
+        """Start all worker processes so the first requests do not pay for SymPy imports"""
+        self.start()
+        await asyncio.gather(*(self.run(worker.ping) for _ in range(self.max_workers)))
+        print(f"[+] Symbolic pool ready ({self.max_workers} workers)")
+
+    async def run(self, fn: Callable, *args, timeout: Optional[float] = None):
+        """
+        Run a picklable job in a worker process without blocking the event loop.
+
+        Args:
+            fn: Module-level function from app.services.symbolic.worker
+            *args: Positional arguments for fn
+            timeout: Hard limit in seconds; on expiry the workers are killed
+
+        Returns:
+            Whatever fn returns
+
+        Raises:
+            asyncio.TimeoutError: If the hard limit expired
+            BrokenProcessPool: If a worker died (e.g. OOM-killed)
+        """
+        for _ in range(2):
+            self.start()
+            generation = self._generation
+            future = asyncio.wrap_future(self._executor.submit(fn, *args))
+            try:
+                return await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                self._kill_workers()
+                raise
+            except BrokenProcessPool:
+                if generation != self._generation:
+                    # Collateral damage from killing another job's worker: retry once
+                    continue
+                self._kill_workers()
+                raise
+        raise BrokenProcessPool("Symbolic pool was restarted while the job was queued")
+
+    async def check_equation(
+        self,
+        lhs: str,
+        rhs: str,
+        domain: str,
+        timeout: Optional[float] = None
+    ) -> Dict:
+        """
+        Check symbolic equivalence of lhs and rhs in a worker process.
+
+        Args:
+            lhs: Left-hand side expression string
+            rhs: Right-hand side expression string
+            domain: Mathematical domain of the proof
+            timeout: Per-job deadline in seconds (default: pool timeout)
+
+        Returns:
+            dict: Result payload with "status", "method", "duration_ms", "detail"
+        """
+        timeout = timeout or self.timeout
+        try:
+            return await self.run(
+                worker.check_equation, lhs, rhs, domain, timeout, self.options,
+                timeout=timeout + HARD_TIMEOUT_GRACE
+            )
+        except asyncio.TimeoutError:
+            return self._failure(
+                SymbolicOutcome.TIMEOUT, timeout,
+                f"Symbolic worker killed after {timeout:.2f}s"
+            )
+        except BrokenProcessPool as e:
+            return self._failure(
+                SymbolicOutcome.RESOURCE_LIMIT, 0.0,
+                f"Symbolic worker died (likely out of memory): {e}"
+            )
+
+    async def equation_keys(
+        self,
+        equations: Sequence[Tuple[str, str]],
+        domain: str,
+        timeout: Optional[float] = None
+    ) -> List[Optional[str]]:
+        """
+        Compute structural equation keys (hashing.equation_hash) in a worker process.
+
+        Args:
+            equations: (lhs, rhs) pairs
+            domain: Mathematical domain of the proof
+            timeout: Deadline in seconds for the whole batch (default: pool timeout)
+
+        Returns:
+            list: Key per equation, None where hashing hit a limit or the
+                worker died (such equations are checked without a key)
+        """
+        if not equations:
+            return []
+        timeout = timeout or self.timeout
+        try:
+            return await self.run(
+                worker.equation_keys, list(equations), domain, timeout,
+                timeout=timeout + HARD_TIMEOUT_GRACE
+            )
+        except (asyncio.TimeoutError, BrokenProcessPool) as e:
+            print(f"[W] Equation hashing failed: {type(e).__name__}: {e}")
+            return [None] * len(equations)
+
+    async def parse(self, expression: str, timeout: Optional[float] = None) -> sympy.Expr:
+        """
+        Parse an expression in a worker process.
+
+        Raises:
+            Exception: Parse errors, SymbolicTimeoutError, MemoryError,
+                asyncio.TimeoutError or BrokenProcessPool
+        """
+        timeout = timeout or self.timeout
+        return await self.run(
+            worker.parse_expression, expression, timeout,
+            timeout=timeout + HARD_TIMEOUT_GRACE
+        )
+
+    async def simplify(self, expression: str, timeout: Optional[float] = None) -> str:
+        """
+        Simplify an expression in a worker process.
+
+        Raises:
+            Exception: Parse errors, SymbolicTimeoutError, MemoryError,
+                asyncio.TimeoutError or BrokenProcessPool
+        """
+        timeout = timeout or self.timeout
+        return await self.run(
+            worker.simplify_expression, expression, timeout,
+            timeout=timeout + HARD_TIMEOUT_GRACE
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop all worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def _kill_workers(self) -> None:
+        """
+        Terminate every worker process and drop the executor.
+
+        ProcessPoolExecutor cannot cancel a running job, so a stuck job is
+        stopped by killing the processes; a fresh executor is created on the
+        next job.
+        """
+        executor, self._executor = self._executor, None
+        self._generation += 1
+        if executor is None:
+            return
+        # Python 3.14+ exposes kill_workers(); older versions need the process map
+        kill_workers = getattr(executor, "kill_workers", None)
+        if kill_workers is not None:
+            kill_workers()
+        else:
+            for process in list((getattr(executor, "_processes", None) or {}).values()):
+                if process.is_alive():
+                    process.kill()
+        executor.shutdown(wait=False, cancel_futures=True)
+        print("[W] Symbolic pool workers restarted after a limit violation")
+
+    @staticmethod
+    def _failure(status: SymbolicOutcome, elapsed: float, detail: str) -> Dict:
+        """Build a result for jobs that never returned from the worker"""
+        return {
+            "status": status,
+            "method": "pool",
+            "duration_ms": round(elapsed * 1000, 3),
+            "detail": detail,
+        }
+
+
+# [+] Global symbolic pool instance (shared by all verifiers in this process)
+symbolic_pool = SymbolicExecutionPool()
@@ -0,0 +1,77 @@
+# [B] ProofBench Backend - Symbolic Check Results
+# Outcome codes and result payloads shared by the pool and its workers
+
+import enum
+from typing import Dict, Optional
+
+
+class SymbolicOutcome(str, enum.Enum):
+    """Outcome of a single symbolic equivalence check"""
+    EQUAL = "equal"
+    PROBABLY_EQUAL = "probably_equal"  # Numeric agreement accepted without exact proof
+    NOT_EQUAL = "not_equal"
+    INVALID = "invalid"                # Expression could not be parsed
+    ERROR = "error"                    # Unexpected failure inside SymPy or the pool
+    TIMEOUT = "timeout"                # Wall-clock limit exceeded
+    RESOURCE_LIMIT = "resource_limit"  # Memory/recursion limit exceeded or worker killed
+
+
+# Outcomes that count as a passing symbolic check
+PASSING_OUTCOMES = (SymbolicOutcome.EQUAL, SymbolicOutcome.PROBABLY_EQUAL)
+
+# Outcomes caused by configured limits rather than by the input itself
+LIMIT_OUTCOMES = (SymbolicOutcome.TIMEOUT, SymbolicOutcome.RESOURCE_LIMIT)
+
+# Outcomes decided by the equation under a given symbolic configuration; limit
+# hits and errors depend on load and infrastructure, so only these are cached
+# (as outcomes by the equivalence store, as step statuses by the step cache)
+DECISIVE_OUTCOMES = (
+    SymbolicOutcome.EQUAL,
+    SymbolicOutcome.PROBABLY_EQUAL,
+    SymbolicOutcome.NOT_EQUAL,
+    SymbolicOutcome.INVALID,
+)
+DECISIVE_STEP_STATUSES = ("passed", "failed", "no_equation")
+
+
+class SymbolicCheckError(Exception):
+    """Raised when a symbolic check ended without a verdict (e.g. a SymPy or pool error)"""
+
+    def __init__(self, outcome: SymbolicOutcome, detail: Optional[str] = None):
+        super().__init__(detail or outcome.value)
+        self.outcome = outcome
+        self.detail = detail
+
+
+class SymbolicLimitExceeded(SymbolicCheckError):
+    """Raised when a symbolic check hits its time or memory limit"""
+
+
+def make_result(
+    status: SymbolicOutcome,
+    method: str,
+    started: float,
+    finished: float,
+    detail: Optional[str] = None
+) -> Dict:
+    """
+    Build the plain-dict result returned by symbolic jobs.
+
+    Results cross process boundaries, so they are kept as picklable dicts.
+
+    Args:
+        status: Outcome of the check
+        method: Tier that decided the outcome (e.g. "parse", "numeric", "simplify")
+        started: perf_counter() value when the check started
+        finished: perf_counter() value when the check finished
+        detail: Optional error message or diagnostic
+
+    Returns:
+        dict: {"status", "method", "duration_ms", "detail"}
+    """
+    return {
+        "status": status,
+        "method": method,
+        "duration_ms": round((finished - started) * 1000, 3),
+        "detail": detail,
+    }
@@ -0,0 +1,121 @@
+# [B] ProofBench Backend - Symbolic Verification Statistics
+# Counters for which tier decided each symbolic check and how long it took
+
+from collections import defaultdict
+from typing import Dict
+
+from app.core.config import settings
+from app.services.symbolic.parse_cache import expression_cache
+from app.services.symbolic.store import equivalence_store
+
+
+# Methods that record failures rather than decisions by a verification tier
+NON_DECIDING_METHODS = ("parse", "pool", "deadline", "resource", "ladder")
+
+
+class SymbolicStats:
+    """
+    Aggregate statistics for symbolic checks in this process.
+
+    Tracks, per deciding tier ("numeric", "simplify", ...), how many checks
+    it decided and the time they took, so that the time saved by cheap
+    tiers can be estimated against the cost of full simplification.
+    """
+
+    def __init__(self):
+        """Initialize empty counters"""
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all counters"""
+        self.total_checks = 0
+        self.by_status: Dict[str, int] = defaultdict(int)
+        self.by_method: Dict[str, int] = defaultdict(int)
+        self.duration_ms_by_method: Dict[str, float] = defaultdict(float)
+        self.stage_timeouts: Dict[str, int] = defaultdict(int)
+        # Latest parse-cache snapshot reported by each worker process (by PID)
+        self.worker_parse_caches: Dict[int, dict] = {}
+        # Worker time that store hits avoided (sum of the stored durations)
+        self.store_ms_saved = 0.0
+
+    def record(self, result: Dict) -> None:
+        """
+        Record a symbolic check result.
+
+        Args:
+            result: Result payload with "status", "method" and "duration_ms"
+        """
+        status = getattr(result["status"], "value", result["status"])
+        method = result.get("method") or "unknown"
+        self.total_checks += 1
+        self.by_status[status] += 1
+        self.by_method[method] += 1
+        self.duration_ms_by_method[method] += result.get("duration_ms") or 0.0
+        for stage in result.get("stage_timeouts") or ():
+            self.stage_timeouts[stage] += 1
+        if result.get("stored_duration_ms"):
+            self.store_ms_saved += result["stored_duration_ms"]
+        if result.get("parse_cache") is not None:
+            self.worker_parse_caches[result.get("worker")] = result["parse_cache"]
+
+    def get_stats(self) -> dict:
+        """
+        Get statistics snapshot.
+
+        Returns:
+            dict: Counts and mean durations per tier, per-stage ladder hits
+                and budget overruns, parse-cache and equivalence-store
+                counters, plus an estimate of the simplification time avoided
+                by cheaper tiers
+        """
+        mean_ms = {
+            method: round(self.duration_ms_by_method[method] / count, 3)
+            for method, count in self.by_method.items() if count
+        }
+
+        # Every check decided before full simplification would otherwise have
+        # paid (on average) one simplify call; store hits are accounted for
+        # separately with their original durations
+        simplify_mean = mean_ms.get("simplify", 0.0)
+        saved_ms = sum(
+            count * simplify_mean - self.duration_ms_by_method[method]
+            for method, count in self.by_method.items()
+            if method not in ("simplify", "store") and method not in NON_DECIDING_METHODS
+        )
+
+        return {
+            "total_checks": self.total_checks,
+            "by_status": dict(self.by_status),
+            "by_method": dict(self.by_method),
+            "mean_duration_ms_by_method": mean_ms,
+            "estimated_simplify_ms_saved": round(saved_ms, 3),
+            "ladder": {
+                "stage_hits": {
+                    stage: self.by_method.get(stage, 0) for stage in settings.SYMBOLIC_LADDER
+                },
+                "stage_timeouts": dict(self.stage_timeouts),
+            },
+            "parse_cache": self._parse_cache_stats(),
+            "store": {
+                **equivalence_store.get_stats(),
+                "worker_ms_saved": round(self.store_ms_saved, 3),
+            },
+        }
+
+    def _parse_cache_stats(self) -> dict:
+        """Combine the API-process cache with the latest snapshot of every worker"""
+        worker_totals = {
+            counter: sum(snapshot[counter] for snapshot in self.worker_parse_caches.values())
+            for counter in ("hits", "misses", "evictions")
+        }
+        lookups = worker_totals["hits"] + worker_totals["misses"]
+        worker_totals["hit_rate"] = round(worker_totals["hits"] / lookups, 4) if lookups else 0.0
+        worker_totals["workers_reporting"] = len(self.worker_parse_caches)
+        return {
+            "api_process": expression_cache.get_stats(),
+            "workers": worker_totals,
+        }
+
+
+# [+] Global symbolic statistics instance
+symbolic_stats = SymbolicStats()
@@ -0,0 +1,188 @@
+# [B] ProofBench Backend - Persistent Equivalence Store
+# Node-local SQLite store of symbolic verdicts shared by all processes
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.services.symbolic.results import DECISIVE_OUTCOMES, SymbolicOutcome
+
+# Run the size check every N writes instead of on every insert
+EVICTION_CHECK_INTERVAL = 256
+
+
+def store_key(equation_key: str, options: Dict) -> str:
+    """
+    Store key of an equation checked under a symbolic configuration.
+
+    Verdicts depend on the tier options (ladder stages, numeric policy,
+    polynomial trials, ...), so a verdict is only served to checks that run
+    with the same options.
+
+    Args:
+        equation_key: Structural key (see hashing.equation_hash)
+        options: Tier configuration sent to the workers (SymbolicExecutionPool.options)
+
+    Returns:
+        str: "<config digest>:<equation key>"
+    """
+    payload = json.dumps(options, sort_keys=True, default=str)
+    return f"{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]}:{equation_key}"
+
+
+class EquivalenceStore:
+    """
+    Content-addressed store mapping canonical equation keys to verdicts.
+
+    Keys are produced by store_key(), from the structural equation key and
+    the symbolic configuration.
+
+    Backed by a SQLite file in WAL mode, so the API process and every
+    worker process on a node can read and write it concurrently, and
+    verdicts survive restarts. The store is bounded: once it grows past
+    max_entries, the least recently used verdicts are evicted.
+
+    A store created with path=None is disabled and never touches disk.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = 1_000_000):
+        """
+        Initialize store configuration (the file is opened lazily).
+
+        Args:
+            path: SQLite file path (None disables the store)
+            max_entries: Maximum number of stored verdicts
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes_since_check = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a backing file is configured"""
+        return bool(self.path)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a stored verdict and mark it as recently used.
+
+        Returns:
+            dict: {"status", "method", "duration_ms"} or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            db = self._connect()
+            row = db.execute(
+                "SELECT status, method, duration_ms FROM symbolic_verdicts WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            db.execute(
+                "UPDATE symbolic_verdicts SET last_used = ?, hits = hits + 1 WHERE key = ?",
+                (time.time(), key)
+            )
+            self.hits += 1
+
+        return {"status": SymbolicOutcome(row[0]), "method": row[1], "duration_ms": row[2]}
+
+    def put(self, key: str, result: Dict) -> None:
+        """
+        Store a verdict (only outcomes in DECISIVE_OUTCOMES are kept).
+
+        Args:
+            key: Store key (see store_key)
+            result: Worker result payload
+        """
+        if not self.enabled or result["status"] not in DECISIVE_OUTCOMES:
+            return
+
+        now = time.time()
+        with self._lock:
+            db = self._connect()
+            db.execute(
+                "INSERT OR REPLACE INTO symbolic_verdicts "
+                "(key, status, method, duration_ms, created_at, last_used, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, SymbolicOutcome(result["status"]).value, result.get("method"),
+                 result.get("duration_ms") or 0.0, now, now)
+            )
+            self.writes += 1
+            self._writes_since_check += 1
+            if self._writes_since_check >= EVICTION_CHECK_INTERVAL:
+                self._writes_since_check = 0
+                self._evict(db)
+
+    def close(self) -> None:
+        """Close the underlying connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get_stats(self) -> dict:
+        """Get store statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite file and create the schema on first use (caller holds the lock)"""
+        if self._connection is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS symbolic_verdicts ("
+                " key TEXT PRIMARY KEY,"
+                " status TEXT NOT NULL,"
+                " method TEXT,"
+                " duration_ms REAL,"
+                " created_at REAL NOT NULL,"
+                " last_used REAL NOT NULL,"
+                " hits INTEGER NOT NULL DEFAULT 0)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS ix_symbolic_verdicts_last_used "
+                "ON symbolic_verdicts (last_used)"
+            )
+            self._connection = db
+        return self._connection
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        """Delete least recently used verdicts beyond max_entries (caller holds the lock)"""
+        (count,) = db.execute("SELECT COUNT(*) FROM symbolic_verdicts").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            db.execute(
+                "DELETE FROM symbolic_verdicts WHERE key IN ("
+                " SELECT key FROM symbolic_verdicts ORDER BY last_used ASC LIMIT ?)",
+                (excess,)
+            )
+            self.evictions += excess
+
+
+# [+] Global equivalence store (disabled unless SYMBOLIC_STORE_PATH is set)
+equivalence_store = EquivalenceStore(settings.SYMBOLIC_STORE_PATH, settings.SYMBOLIC_STORE_MAX_ENTRIES)
@@ -0,0 +1,254 @@
+# [B] ProofBench Backend - Symbolic Pool Worker Jobs
+# SymPy jobs executed inside symbolic execution pool worker processes
+
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import sympy
+from sympy.parsing.sympy_parser import parse_expr
+
+from app.services.symbolic.hashing import equation_hash
+from app.services.symbolic.ladder import DEFAULT_LADDER, DEFAULT_STAGE_BUDGETS, run_ladder
+from app.services.symbolic.limits import SymbolicTimeoutError, limit_address_space, time_limit
+from app.services.symbolic.logic import is_formula, logic_equivalence_check, parse_formula
+from app.services.symbolic.numeric import numeric_identity_check
+from app.services.symbolic.parse_cache import TRANSFORMATIONS, expression_cache
+from app.services.symbolic.polynomial import modular_identity_check
+from app.services.symbolic.results import SymbolicOutcome, make_result
+
+# Domains whose equations are propositional formulas
+LOGIC_DOMAINS = ("logic",)
+
+
+def init_worker(memory_limit_mb: int = 0) -> None:
+    """
+    Pool initializer: pre-import and warm up SymPy, then cap memory.
+
+    SymPy imports many submodules lazily on first use; running a trivial
+    parse/simplify here moves that cost out of the first real job. The
+    memory cap is applied afterwards, on top of the warmed-up footprint,
+    so allocations beyond it raise MemoryError inside the job.
+
+    Args:
+        memory_limit_mb: Extra address space allowed per worker (0 = unlimited)
+    """
+    x = sympy.Symbol("x")
+    warm = parse_expr("(x + 1)**2 - x**2", transformations=TRANSFORMATIONS)
+    sympy.simplify(warm - 2 * x)
+    numeric_identity_check(warm, 2 * x + 1)
+    modular_identity_check(warm, 2 * x + 1)
+    logic_equivalence_check(parse_formula("a >> b"), parse_formula("~a | b"))
+
+    if memory_limit_mb > 0:
+        limit_address_space(memory_limit_mb * 1024 * 1024)
+
+
+def ping() -> int:
+    """No-op job used to spawn and warm workers; returns the worker PID"""
+    return os.getpid()
+
+
+def parse(expression: str) -> sympy.Expr:
+    """Parse an expression string with the standard ProofBench transformations (cached)"""
+    return expression_cache.get_or_parse(expression, _parse_uncached)
+
+
+def _parse_uncached(source: str) -> sympy.Expr:
+    """Parser used on parse-cache misses"""
+    return parse_expr(source, transformations=TRANSFORMATIONS)
+
+
+def check_equation(
+    lhs: str,
+    rhs: str,
+    domain: str,
+    timeout: Optional[float] = None,
+    options: Optional[Dict] = None
+) -> Dict:
+    """
+    Decide whether lhs and rhs are symbolically equivalent.
+
+    In logic domains, propositional formulas are decided exactly by truth
+    tables (or SAT for wide formulas); other equations take the algebraic
+    tiers, cheapest first:
+    1. Polynomial fast path: rational-function identities are decided
+       exactly by evaluation modulo a large prime; other equations fall through
+    2. Numeric pre-check at random complex points (clear mismatch => not equal;
+       agreement => probably equal or escalate, per options["numeric_policy"])
+    3. Simplification ladder on lhs - rhs (expand, cancel, ..., simplify),
+       each stage under its own time budget
+
+    Args:
+        lhs: Left-hand side expression string
+        rhs: Right-hand side expression string
+        domain: Mathematical domain of the proof
+        timeout: Wall-clock limit in seconds (None = unlimited)
+        options: Tier configuration built by the pool from Settings
+
+    Returns:
+        dict: Result payload (see results.make_result); "method" names the deciding tier
+    """
+    started = time.perf_counter()
+    options = options or {}
+
+    try:
+        with time_limit(timeout):
+            result = _check_equation(lhs, rhs, domain, started, options)
+    except SymbolicTimeoutError as e:
+        result = make_result(SymbolicOutcome.TIMEOUT, "deadline", started, time.perf_counter(), str(e))
+    except (MemoryError, RecursionError) as e:
+        result = make_result(
+            SymbolicOutcome.RESOURCE_LIMIT, "resource", started, time.perf_counter(),
+            f"{type(e).__name__}: {e}"
+        )
+
+    # Per-worker cache counters, aggregated by SymbolicStats in the API process
+    result["worker"] = os.getpid()
+    result["parse_cache"] = expression_cache.get_stats()
+    return result
+
+
+def _check_equation(lhs: str, rhs: str, domain: str, started: float, options: Dict) -> Dict:
+    """Equivalence check body; limit handling lives in check_equation()"""
+    if domain.strip().lower() in LOGIC_DOMAINS:
+        result = _check_logic(lhs, rhs, started, options)
+        if result is not None:
+            return result
+
+    try:
+        lhs_expr = parse(lhs)
+        rhs_expr = parse(rhs)
+    except (MemoryError, RecursionError):
+        raise
+    except Exception as e:
+        # Invalid syntax or unparseable expression
+        return make_result(SymbolicOutcome.INVALID, "parse", started, time.perf_counter(), str(e))
+
+    difference = lhs_expr - rhs_expr
+    if difference == 0:
+        # Sides are identical after SymPy's automatic canonicalization
+        return make_result(SymbolicOutcome.EQUAL, "identity", started, time.perf_counter())
+
+    if options.get("polynomial_fastpath", True):
+        identical = modular_identity_check(
+            lhs_expr, rhs_expr,
+            trials=options.get("polynomial_trials", 3),
+            backend=options.get("polynomial_backend", "auto"),
+        )
+        if identical is not None:
+            status = SymbolicOutcome.EQUAL if identical else SymbolicOutcome.NOT_EQUAL
+            return make_result(status, "polynomial", started, time.perf_counter())
+
+    if options.get("numeric_precheck", True):
+        agrees = numeric_identity_check(
+            lhs_expr, rhs_expr,
+            points=options.get("numeric_points", 8),
+            tolerance=options.get("numeric_tolerance", 1e-9),
+        )
+        if agrees is False:
+            return make_result(SymbolicOutcome.NOT_EQUAL, "numeric", started, time.perf_counter())
+        if agrees and options.get("numeric_policy") == "accept":
+            return make_result(SymbolicOutcome.PROBABLY_EQUAL, "numeric", started, time.perf_counter())
+
+    try:
+        ladder = run_ladder(
+            difference,
+            options.get("ladder", DEFAULT_LADDER),
+            options.get("stage_budgets", DEFAULT_STAGE_BUDGETS),
+        )
+    except (MemoryError, RecursionError):
+        raise
+    except Exception as e:
+        return make_result(SymbolicOutcome.ERROR, "ladder", started, time.perf_counter(), str(e))
+
+    if ladder.is_zero:
+        status = SymbolicOutcome.EQUAL
+    elif ladder.is_zero is False:
+        status = SymbolicOutcome.NOT_EQUAL
+    else:
+        status = SymbolicOutcome.TIMEOUT
+    result = make_result(
+        status, ladder.stage, started, time.perf_counter(),
+        f"Stage budget exceeded: {ladder.timed_out}" if status == SymbolicOutcome.TIMEOUT else None
+    )
+    result["stage_timeouts"] = ladder.timed_out
+    return result
+
+
+def _check_logic(lhs: str, rhs: str, started: float, options: Dict) -> Optional[Dict]:
+    """Decide propositional equivalence; None if either side is not a formula"""
+    try:
+        lhs_expr = parse_formula(lhs)
+        rhs_expr = parse_formula(rhs)
+    except (MemoryError, RecursionError):
+        raise
+    except Exception:
+        return None  # Let the algebraic parser report the error
+    if not (is_formula(lhs_expr) and is_formula(rhs_expr)):
+        return None
+
+    equivalent, method, counterexample = logic_equivalence_check(
+        lhs_expr, rhs_expr, max_vars=options.get("logic_max_vars", 24)
+    )
+    if equivalent:
+        return make_result(SymbolicOutcome.EQUAL, method, started, time.perf_counter())
+    return make_result(
+        SymbolicOutcome.NOT_EQUAL, method, started, time.perf_counter(),
+        f"Counterexample: {counterexample}"
+    )
+
+
+def equation_keys(
+    equations: List[Tuple[str, str]],
+    domain: str,
+    timeout: Optional[float] = None
+) -> List[Optional[str]]:
+    """
+    Compute the structural key (hashing.equation_hash) of each equation.
+
+    Hashing parses the input, and parsing runs any function calls in it
+    (e.g. "expand((x + 1)**1500)"), so keys are computed here, under the
+    same limits as checks. Equations not hashed before a limit was hit get
+    None and are checked without a key.
+
+    Args:
+        equations: (lhs, rhs) pairs
+        domain: Mathematical domain of the proof
+        timeout: Wall-clock limit in seconds for the whole batch (None = unlimited)
+
+    Returns:
+        list: Hex key per equation (None if not computed), in input order
+    """
+    keys: List[Optional[str]] = []
+    try:
+        with time_limit(timeout):
+            for lhs, rhs in equations:
+                keys.append(equation_hash(lhs, rhs, domain))
+    except (SymbolicTimeoutError, MemoryError, RecursionError):
+        pass
+    return keys + [None] * (len(equations) - len(keys))
+
+
+def parse_expression(expression: str, timeout: Optional[float] = None) -> sympy.Expr:
+    """
+    Parse an expression (pickled back to the caller).
+
+    Raises:
+        Exception: Any parse error, including SymbolicTimeoutError and
+            MemoryError (reported by the caller)
+    """
+    with time_limit(timeout):
+        return parse(expression)
+
+
+def simplify_expression(expression: str, timeout: Optional[float] = None) -> str:
+    """
+    Simplify an expression and return its string form.
+
+    Raises:
+        Exception: Any parse or simplification error, including
+            SymbolicTimeoutError and MemoryError (reported by the caller)
+    """
+    with time_limit(timeout):
+        return str(sympy.simplify(parse(expression)))
@@ -2,9 +2,22 @@
 # SymPy-based equation verification
 
 import asyncio
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 import sympy
-from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
+
+from app.core.config import settings
+from app.services.symbolic import worker
+from app.services.symbolic.pool import SymbolicExecutionPool, symbolic_pool
+from app.services.symbolic.results import (
+    SymbolicOutcome,
+    SymbolicCheckError,
+    SymbolicLimitExceeded,
+    LIMIT_OUTCOMES,
+    PASSING_OUTCOMES,
+)
+from app.services.symbolic.stats import symbolic_stats
+from app.services.symbolic.store import EquivalenceStore, equivalence_store, store_key
 
 
 class BackendSymbolicVerifier:
@@ -13,26 +26,154 @@ class BackendSymbolicVerifier:
     
     Verifies mathematical equations for symbolic correctness by parsing
     and comparing left-hand side (LHS) and right-hand side (RHS) expressions.
+
+    CAS work runs in the shared symbolic execution pool, so the event loop
+    is never blocked by parsing or simplification. Every check runs under
+    the pool's wall-clock and memory limits.
+
+    Decisive verdicts are persisted in the node-local equivalence store,
+    keyed by equation and tier configuration, and answered from it on
+    repeat checks under the same configuration.
     """
     
-    def __init__(self):
-        """Initialize symbolic verifier with SymPy transformations"""
+    def __init__(
+        self,
+        pool: Optional[SymbolicExecutionPool] = None,
+        store: Optional[EquivalenceStore] = None
+    ):
+        """
+        Initialize symbolic verifier.
+
+        Args:
+            pool: Symbolic execution pool (default: process-wide shared pool)
+            store: Equivalence store (default: process-wide store from settings)
+        """
         # Standard transformations for parsing
-        self.transformations = (
-            standard_transformations + 
-            (implicit_multiplication_application,)
-        )
+        self.transformations = worker.TRANSFORMATIONS
+        self.pool = pool or symbolic_pool
+        self.store = store or equivalence_store
+
+    async def check_equation(
+        self,
+        lhs: str,
+        rhs: str,
+        domain: str = "algebra",
+        timeout: Optional[float] = None
+    ) -> Dict:
+        """
+        Check symbolic equivalence and return the structured worker result.
+
+        Args:
+            lhs: Left-hand side expression string
+            rhs: Right-hand side expression string
+            domain: Mathematical domain (algebra, calculus, logic, etc.)
+            timeout: Wall-clock limit in seconds (default: settings.SYMBOLIC_TIMEOUT)
+
+        Returns:
+            dict: {"status": SymbolicOutcome, "method": str, "duration_ms": float, "detail": str}
+                  "method" names the tier that decided (numeric, simplify, ...),
+                  or "store" when the verdict came from the equivalence store
+        """
+        key = await self.equation_key(lhs, rhs, domain, timeout=timeout) if self.store.enabled else None
+        if key is not None:
+            key = store_key(key, self.pool.options)
+            stored = await self._lookup_stored(key)
+            if stored is not None:
+                symbolic_stats.record(stored)
+                return stored
+
+        result = await self.pool.check_equation(lhs, rhs, domain, timeout=timeout)
+        symbolic_stats.record(result)
+
+        if key is not None:
+            await self._persist(key, result)
+
+        if result["status"] == SymbolicOutcome.INVALID:
+            print(f"[W] Equation parsing failed: {result['detail']}")
+        elif result["status"] == SymbolicOutcome.ERROR:
+            print(f"[-] Symbolic verification error: {result['detail']}")
+        elif result["status"] in LIMIT_OUTCOMES:
+            print(f"[W] Symbolic check hit {result['status'].value} limit: {result['detail']}")
+
+        return result
+
+    async def equation_key(
+        self,
+        lhs: str,
+        rhs: str,
+        domain: str = "algebra",
+        timeout: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Structural key of an equation, computed in the symbolic pool.
+
+        "x + 5 = 2*x" and "5 + x = x*2" share a key (see hashing.equation_hash).
+
+        Returns:
+            str: Hex key, or None if hashing hit a limit
+        """
+        [key] = await self.pool.equation_keys([(lhs, rhs)], domain, timeout=timeout)
+        return key
+
+    async def _lookup_stored(self, key: str) -> Optional[Dict]:
+        """
+        Fetch a stored verdict (keys carry the configuration, see store_key).
+
+        Store errors are logged and treated as a miss.
+
+        Returns:
+            dict: Result payload with method "store", or None
+        """
+        started = time.perf_counter()
+        try:
+            stored = await asyncio.to_thread(self.store.get, key)
+        except Exception as e:
+            print(f"[W] Equivalence store lookup failed: {e}")
+            return None
+
+        if stored is None:
+            return None
+
+        return {
+            "status": stored["status"],
+            "method": "store",
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+            "detail": None,
+            "stored_method": stored["method"],
+            "stored_duration_ms": stored["duration_ms"],
+        }
+
+    async def _persist(self, key: str, result: Dict) -> None:
+        """Write a verdict to the equivalence store (errors are logged, not raised)"""
+        try:
+            await asyncio.to_thread(self.store.put, key, result)
+        except Exception as e:
+            print(f"[W] Equivalence store write failed: {e}")
     
-    async def verify_equation(self, lhs: str, rhs: str) -> bool:
+    async def verify_equation(
+        self,
+        lhs: str,
+        rhs: str,
+        domain: str = "algebra",
+        timeout: Optional[float] = None
+    ) -> bool:
         """
         Verify if two mathematical expressions are symbolically equivalent.
         
         Args:
             lhs: Left-hand side expression string
             rhs: Right-hand side expression string
+            domain: Mathematical domain (algebra, calculus, logic, etc.)
+            timeout: Wall-clock limit in seconds (default: settings.SYMBOLIC_TIMEOUT)
         
         Returns:
-            bool: True if expressions are symbolically equivalent
+            bool: True if expressions are symbolically equivalent (or probably
+                equal, when the numeric policy accepts numeric agreement)
+
+        Raises:
+            SymbolicLimitExceeded: If the check hit its time or memory limit
+            SymbolicCheckError: If the check failed without a verdict (SymPy
+                error, broken pool, ...); never reported as not equivalent
         
         Examples:
             >>> verifier = BackendSymbolicVerifier()
@@ -44,74 +185,82 @@ class BackendSymbolicVerifier:
             True
         """
         try:
-            # Parse expressions
-            lhs_expr = parse_expr(lhs, transformations=self.transformations)
-            rhs_expr = parse_expr(rhs, transformations=self.transformations)
-            
-            # Simplify difference and check if zero
-            difference = sympy.simplify(lhs_expr - rhs_expr)
-            is_equal = difference == 0
-            
-            return bool(is_equal)
-            
-        except (sympy.SympifyError, ValueError, TypeError) as e:
-            # Invalid syntax or unparseable expression
-            print(f"[W] Equation parsing failed: {e}")
-            return False
+            result = await self.check_equation(lhs, rhs, domain, timeout=timeout)
         except Exception as e:
             # Unexpected error
             print(f"[-] Symbolic verification error: {e}")
-            return False
+            raise SymbolicCheckError(SymbolicOutcome.ERROR, str(e)) from e
+
+        # Neither valid nor invalid: let the caller record the outcome explicitly
+        if result["status"] in LIMIT_OUTCOMES:
+            raise SymbolicLimitExceeded(result["status"], result["detail"])
+        if result["status"] == SymbolicOutcome.ERROR:
+            raise SymbolicCheckError(result["status"], result["detail"])
+
+        return result["status"] in PASSING_OUTCOMES
     
-    async def verify_steps(self, steps: List) -> Dict:
+    async def verify_steps(
+        self,
+        steps: List,
+        domain: str = "algebra",
+        concurrency: Optional[int] = None
+    ) -> Dict:
         """
         Verify symbolic correctness of multiple proof steps.
+
+        Identical equations (by structural hash) are checked once, and the
+        distinct ones are fanned out across the symbolic pool with at most
+        `concurrency` checks in flight.
         
         Args:
             steps: List of ProofStep entities with equations
+            domain: Mathematical domain of the proof
+            concurrency: Maximum concurrent checks (default: settings.SYMBOLIC_BATCH_CONCURRENCY)
         
         Returns:
-            dict: Verification results with score and details
+            dict: Verification results with score and details (in step order)
             {
                 "score": float,  # 0-100 percentage of valid steps
                 "details": [
-                    {"step_id": int, "symbolically_valid": bool},
+                    {"step_id": int, "symbolically_valid": bool, "symbolic_status": str},
                     ...
                 ]
             }
         """
+        sides = [self._equation_sides(step) for step in steps]
+        equations = [pair for pair in sides if pair is not None]
+
+        # Dedupe: equal keys share one check; equations that could not be
+        # hashed within the limits are checked on their own
+        keys = [
+            key if key is not None else f"#{index}"
+            for index, key in enumerate(await self.pool.equation_keys(equations, domain))
+        ]
+        unique = dict(zip(keys, equations))
+
+        semaphore = asyncio.Semaphore(concurrency or settings.SYMBOLIC_BATCH_CONCURRENCY)
+
+        async def check(lhs: str, rhs: str):
+            async with semaphore:
+                try:
+                    return await self.verify_equation(lhs, rhs, domain), None
+                except SymbolicCheckError as e:
+                    return False, e.outcome.value
+
+        outcomes = dict(zip(unique, await asyncio.gather(
+            *(check(lhs, rhs) for lhs, rhs in unique.values())
+        )))
+        key_iter = iter(keys)
+
         results = []
         valid_steps = 0
         
-        for step in steps:
-            step_valid = True
-            
-            # Check if step has an equation to verify
-            if hasattr(step, 'equation') and step.equation:
-                # Handle different equation formats
-                if isinstance(step.equation, dict):
-                    lhs = step.equation.get('lhs', '')
-                    rhs = step.equation.get('rhs', '')
-                elif isinstance(step.equation, str):
-                    # Parse equation string (format: "lhs = rhs")
-                    parts = step.equation.split('=')
-                    if len(parts) == 2:
-                        lhs, rhs = parts[0].strip(), parts[1].strip()
-                    else:
-                        # Invalid format, skip verification
-                        lhs, rhs = '', ''
-                else:
-                    lhs, rhs = '', ''
-                
-                # Verify if both sides exist
-                if lhs and rhs:
-                    step_valid = await self.verify_equation(lhs, rhs)
-                else:
-                    # No equation to verify, consider valid
-                    step_valid = True
+        for step, pair in zip(steps, sides):
+            if pair is None:
+                # No equation to verify, consider valid
+                step_valid, symbolic_status = True, None
             else:
-                # No equation field, consider valid
-                step_valid = True
+                step_valid, symbolic_status = outcomes[next(key_iter)]
             
             if step_valid:
                 valid_steps += 1
@@ -119,7 +268,8 @@ class BackendSymbolicVerifier:
             results.append({
                 "step_id": step.id if hasattr(step, 'id') else None,
                 "step_index": step.step_index if hasattr(step, 'step_index') else None,
-                "symbolically_valid": step_valid
+                "symbolically_valid": step_valid,
+                "symbolic_status": symbolic_status or ("passed" if step_valid else "failed")
             })
         
         # Calculate percentage score
@@ -131,10 +281,40 @@ class BackendSymbolicVerifier:
             "total_count": len(steps),
             "details": results
         }
+
+    @staticmethod
+    def _equation_sides(step) -> Optional[Tuple[str, str]]:
+        """
+        Extract (lhs, rhs) from a step's equation.
+
+        Accepts {"lhs": ..., "rhs": ...} dicts and "lhs = rhs" strings.
+
+        Returns:
+            tuple: (lhs, rhs), or None if the step has no checkable equation
+        """
+        equation = getattr(step, 'equation', None)
+        if not equation:
+            return None
+
+        # Handle different equation formats
+        if isinstance(equation, dict):
+            lhs = equation.get('lhs', '')
+            rhs = equation.get('rhs', '')
+        elif isinstance(equation, str):
+            # Parse equation string (format: "lhs = rhs")
+            parts = equation.split('=')
+            if len(parts) != 2:
+                # Invalid format, skip verification
+                return None
+            lhs, rhs = parts[0].strip(), parts[1].strip()
+        else:
+            return None
+
+        return (lhs, rhs) if lhs and rhs else None
     
     async def parse_and_validate(self, expression: str) -> Optional[sympy.Expr]:
         """
-        Parse and validate a mathematical expression.
+        Parse and validate a mathematical expression in a worker process.
         
         Args:
             expression: Mathematical expression string
@@ -143,7 +323,7 @@ class BackendSymbolicVerifier:
             sympy.Expr: Parsed expression, or None if invalid
         """
         try:
-            return parse_expr(expression, transformations=self.transformations)
+            return await self.pool.parse(expression)
         except Exception as e:
             print(f"[W] Expression validation failed: {e}")
             return None
@@ -159,9 +339,7 @@ class BackendSymbolicVerifier:
             str: Simplified expression, or None if invalid
         """
         try:
-            expr = parse_expr(expression, transformations=self.transformations)
-            simplified = sympy.simplify(expr)
-            return str(simplified)
+            return await self.pool.simplify(expression)
         except Exception as e:
             print(f"[W] Expression simplification failed: {e}")
             return None
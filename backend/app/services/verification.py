@@ -2,15 +2,143 @@
 # Background service for proof evaluation
 
 import asyncio
-from typing import Optional, List
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import json
+import random
+import re
+import weakref
+from typing import Awaitable, Callable, Dict, Optional, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud
 from app.core.config import settings
+from app.db import base as db_base
 from app.models.proof import Proof
 from app.services.llm_adapter import LLMAdapter, EvaluationOptions, ConsensusResult
 from app.services.llm.base import LLMResponse
+from app.services.checkpoints import StepCheckpointWriter, StepOutcome, completed_outcomes
+from app.services.deadline import Deadline
+from app.services.justification_graph import JustificationGraph
+from app.services.scoring import SemanticScore, overall_assessment, provider_scores, scoring_version
+from app.services.step_cache import StepResultCache, scoring_config_version, step_cache_key, symbolic_cache_key
 from app.services.symbolic_verifier import BackendSymbolicVerifier
+from app.services.symbolic.results import SymbolicCheckError
+
+
+# One semaphore per event loop (asyncio primitives cannot be shared across loops)
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """
+    Get the process-wide semaphore limiting concurrent LLM evaluations.
+
+    Shared by every proof evaluated in this process, so pipelined proofs
+    cannot exceed provider rate limits together.
+
+    Returns:
+        asyncio.Semaphore: Limit of settings.LLM_GLOBAL_CONCURRENCY
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _llm_semaphores[loop] = asyncio.Semaphore(settings.LLM_GLOBAL_CONCURRENCY)
+    return semaphore
+
+
+_verification_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Background verification counters, exposed by /metrics
+_verification_stats = {"active": 0, "waiting": 0, "completed": 0, "failed": 0}
+
+
+def get_verification_semaphore() -> asyncio.Semaphore:
+    """
+    Get the process-wide semaphore limiting concurrent background verifications.
+
+    Keeps background tasks from holding more database connections than the
+    shared pool provides.
+
+    Returns:
+        asyncio.Semaphore: Limit of settings.MAX_CONCURRENT_VERIFICATIONS
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _verification_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _verification_semaphores[loop] = asyncio.Semaphore(
+            settings.MAX_CONCURRENT_VERIFICATIONS
+        )
+    return semaphore
+
+
+def get_verification_stats() -> dict:
+    """Get background verification counters (active, waiting, completed, failed)"""
+    return dict(_verification_stats)
+
+
+async def _gather_or_cancel(tasks: List[asyncio.Future]) -> list:
+    """Gather tasks; if one fails, cancel the rest (no orphaned LLM calls) and re-raise"""
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+# Dependencies listed in a step's LLM prompt
+MAX_CONTEXT_STEPS = 10
+
+# Completion tokens budgeted per step of a batched prompt
+BATCH_TOKENS_PER_STEP = 100
+
+# System message of batched prompts (the providers' default asks for one score)
+BATCH_SYSTEM_MESSAGE = (
+    "You are a mathematical proof evaluator. Analyze each provided proof step "
+    "and score it from 0-100 based on logical soundness and correctness. "
+    "Respond in JSON format with a 'steps' array of objects with 'step' (integer), "
+    "'score' (integer 0-100) and 'reasoning' (string) fields."
+)
+
+
+def _parse_batch_scores(raw_response: str, count: int) -> Dict[int, float]:
+    """
+    Extract per-step scores from a batched evaluation response.
+
+    Malformed entries (unknown step number, score outside 0-100 or not a
+    number, duplicates) are dropped so the caller can retry those steps.
+
+    Args:
+        raw_response: Provider response text
+        count: Number of steps in the batch
+
+    Returns:
+        dict: Position in the batch (0-based) -> score
+    """
+    text = re.sub(r"^\s*```(?:json)?\s*|\s*```\s*$", "", raw_response or "")
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        return {}
+    entries = data.get("steps") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return {}
+
+    scores: Dict[int, float] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        number, score = entry.get("step"), entry.get("score")
+        if not isinstance(number, int) or isinstance(number, bool) or not 1 <= number <= count:
+            continue
+        if not isinstance(score, (int, float)) or isinstance(score, bool) or not 0 <= score <= 100:
+            continue
+        scores.setdefault(number - 1, float(score))
+    return scores
 
 
 class BackendProofEngine:
@@ -28,6 +156,13 @@ class BackendProofEngine:
         self.symbolic_weight = settings.SYMBOLIC_WEIGHT
         self.semantic_weight = settings.SEMANTIC_WEIGHT
         self.pass_threshold = settings.PASS_THRESHOLD
+        self.step_concurrency = settings.PROOF_STEP_CONCURRENCY
+        self.decide_fast = settings.DECIDE_FAST
+        self.semantic_policy = settings.SEMANTIC_POLICY
+        self.semantic_sample_rate = settings.SEMANTIC_SAMPLE_RATE
+        self.semantic_default_score = settings.SEMANTIC_DEFAULT_SCORE
+        self.semantic_batch_size = settings.SEMANTIC_BATCH_SIZE
+        self.dependency_scheduling = settings.DEPENDENCY_SCHEDULING
 
         # Initialize LLM adapter for semantic evaluation
         self.llm_adapter = LLMAdapter()
@@ -36,15 +171,25 @@ class BackendProofEngine:
         # Initialize symbolic verifier for SymPy-based validation
         self.symbolic_verifier = BackendSymbolicVerifier()
 
+        # Step outcomes shared by every proof this engine evaluates
+        self.step_cache = StepResultCache(settings.STEP_CACHE_SIZE, settings.STEP_CACHE_TTL)
+        self.step_cache_version = scoring_config_version(self.llm_adapter.get_available_providers())
+
         if self.has_llm:
             providers = self.llm_adapter.get_available_providers()
             print(f"[+] LLM providers available: {', '.join(providers)}")
         else:
             print("[W] No LLM providers available - semantic evaluation will be skipped")
 
-        print(f"[+] Symbolic verifier initialized (SymPy-based)")
+        print(f"[+] Symbolic verifier initialized (SymPy process pool)")
 
-    async def evaluate(self, proof_data: Proof) -> dict:
+    async def evaluate(
+        self,
+        proof_data: Proof,
+        completed: Optional[Dict[int, StepOutcome]] = None,
+        on_step: Optional[Callable[[object, StepOutcome], Awaitable[None]]] = None,
+        deadline: Optional[Deadline] = None
+    ) -> dict:
         """
         Evaluate a proof and return verification results.
 
@@ -53,37 +198,154 @@ class BackendProofEngine:
         - Semantic evaluation (LLM reasoning assessment)
         - Multi-provider consensus for reliability
 
+        Steps are evaluated concurrently (at most settings.PROOF_STEP_CONCURRENCY
+        at a time, LLM calls further capped process-wide), and the results are
+        assembled in step order.
+
+        With a deadline, symbolic and LLM timeouts shrink to the time left;
+        steps not finished when it passes are reported as "not_evaluated"
+        and the proof is finalized from the steps that completed (and is
+        never valid).
+
+        In decide-fast mode (settings.DECIDE_FAST) LLM evaluation stops as
+        soon as the verdict can no longer change; the remaining steps get
+        semantic_status "skipped" and the LII score is the bound that
+        decided the verdict.
+
+        Which steps are sent to the LLM providers at all is set by the
+        semantic policy (see _needs_semantic); the others are scored
+        settings.SEMANTIC_DEFAULT_SCORE and get semantic_status "default".
+
+        With settings.SEMANTIC_BATCH_SIZE above 1, the steps sent to the
+        providers are evaluated in batches of that many steps per prompt.
+
+        Step dependencies form a justification graph (see
+        JustificationGraph): a step is evaluated once the steps it depends
+        on have their symbolic results, which its LLM prompt includes.
+        Independent branches run in parallel. Circular or dangling
+        dependencies make the proof invalid.
+
         Args:
             proof_data: Proof entity with steps
+            completed: Outcomes of steps evaluated by an earlier attempt, by
+                step index (these steps are not evaluated again)
+            on_step: Awaited with (step, outcome) as each remaining step
+                finishes, e.g. to checkpoint it
+            deadline: Wall-clock budget of the verification (None = unbounded)
 
         Returns:
             dict: Verification result with LII score, validity, step-by-step results
         """
+        completed = completed or {}
+        deadline = deadline or Deadline()
         print(f"[>] Evaluating proof {proof_data.id} with {len(proof_data.steps)} steps")
-
-        # Evaluate each step
+        if completed:
+            print(f"[*] Resuming proof {proof_data.id}: {len(completed)} steps already evaluated")
+
+        graph = JustificationGraph(proof_data.steps)
+        if graph.cycles or graph.invalid_references:
+            print(f"[W] Proof {proof_data.id} dependencies: {len(graph.cycles)} cycles, "
+                  f"{len(graph.invalid_references)} steps with invalid references")
+
+        step_semaphore = asyncio.Semaphore(self.step_concurrency)
+        if self.decide_fast or self.semantic_batch_size > 1:
+            outcomes = await self._evaluate_phased(
+                proof_data, completed, on_step, deadline, step_semaphore, graph
+            )
+        else:
+            # Run all steps concurrently (bounded per proof); a step with
+            # dependencies starts once their symbolic results are in
+            steps = proof_data.steps
+            loop = asyncio.get_running_loop()
+            symbolic_results = [loop.create_future() for _ in steps]
+
+            async def evaluate_step(position):
+                step = steps[position]
+                published = symbolic_results[position]
+                try:
+                    if step.step_index in completed:
+                        published.set_result(completed[step.step_index][0])
+                        return completed[step.step_index]
+                    context = None
+                    parents = graph.schedule_parents[position] if self.dependency_scheduling else []
+                    if parents:
+                        await asyncio.wait([symbolic_results[parent] for parent in parents])
+                        context = [(steps[parent], symbolic_results[parent].result()) for parent in parents]
+                    outcome = await self._run_step(
+                        step_semaphore, deadline,
+                        lambda: self._step_outcome(
+                            step, proof_data.domain, deadline, context, on_symbolic=published.set_result
+                        )
+                    )
+                finally:
+                    if not published.done():
+                        published.set_result(None)  # Children run without this result
+                if outcome is None:
+                    return None
+                if on_step is not None:
+                    await on_step(step, outcome)
+                return outcome
+
+            outcomes = await _gather_or_cancel(
+                [asyncio.ensure_future(evaluate_step(position)) for position in range(len(steps))]
+            )
+
+        # Assemble results in step order
         step_results = []
         semantic_scores = []
         symbolic_scores = []
-
-        for i, step in enumerate(proof_data.steps):
-            # Symbolic verification (placeholder - TODO: implement SymPy validation)
-            symbolic_pass = await self._verify_symbolic(step)
+        not_evaluated = []
+        skipped = []
+
+        for i, (step, outcome) in enumerate(zip(proof_data.steps, outcomes)):
+            if outcome is None:
+                # Deadline passed before the step finished
+                not_evaluated.append(step.step_index)
+                step_results.append({
+                    "step_id": step.id,
+                    "step_index": step.step_index,
+                    "symbolic_pass": None,
+                    "symbolic_status": "not_evaluated",
+                    "semantic_score": None,
+                    "semantic_status": "not_evaluated",
+                    "dependencies_valid": None,
+                    "hybrid_score": None
+                })
+                continue
+
+            (symbolic_pass, symbolic_status), semantic_score = outcome
             symbolic_score = 100.0 if symbolic_pass else 0.0
             symbolic_scores.append(symbolic_score)
 
-            # Semantic evaluation using LLM consensus
-            semantic_score = await self._evaluate_semantic(step, proof_data.domain)
+            dependencies_valid = graph.dependencies_valid(i)
+
+            if semantic_score is None:
+                # Decide-fast: verdict was fixed before this step's LLM evaluation
+                skipped.append(step.step_index)
+                step_results.append({
+                    "step_id": step.id,
+                    "step_index": step.step_index,
+                    "symbolic_pass": symbolic_pass,
+                    "symbolic_status": symbolic_status,
+                    "semantic_score": None,
+                    "semantic_status": "skipped",
+                    "dependencies_valid": dependencies_valid,
+                    "hybrid_score": None
+                })
+                continue
             semantic_scores.append(semantic_score)
 
-            # Dependencies validation (placeholder - TODO: implement graph check)
-            dependencies_valid = True
-
             step_results.append({
                 "step_id": step.id,
                 "step_index": step.step_index,
                 "symbolic_pass": symbolic_pass,
+                "symbolic_status": symbolic_status,
                 "semantic_score": round(semantic_score, 2),
+                "semantic_status": (
+                    "evaluated" if self._needs_semantic(step, (symbolic_pass, symbolic_status))
+                    else "default"
+                ),
+                "provider_scores": provider_scores(semantic_score),
                 "dependencies_valid": dependencies_valid,
                 "hybrid_score": round(
                     symbolic_score * self.symbolic_weight + semantic_score * self.semantic_weight,
@@ -98,7 +360,18 @@ class BackendProofEngine:
         avg_semantic = sum(semantic_scores) / len(semantic_scores) if semantic_scores else 0
 
         lii_score = (avg_symbolic * self.symbolic_weight) + (avg_semantic * self.semantic_weight)
-        is_valid = lii_score >= self.pass_threshold
+        if skipped:
+            # Report the bound that fixed the verdict (unknown scores taken at
+            # their worst case for a pass, best case for a fail)
+            low, high = self._lii_bounds([o for o in outcomes if o is not None])
+            lii_score = low if low >= self.pass_threshold else high
+        # Circular or dangling justifications invalidate the proof
+        is_valid = (
+            lii_score >= self.pass_threshold
+            and not not_evaluated
+            and not graph.cycles
+            and not graph.invalid_references
+        )
 
         # Calculate confidence interval (based on semantic variance if available)
         if len(semantic_scores) > 1:
@@ -113,6 +386,35 @@ class BackendProofEngine:
 
         # Generate feedback
         feedback = self._generate_feedback(is_valid, lii_score, step_results, proof_data)
+        if skipped:
+            feedback.insert(1, {
+                "type": "info",
+                "summary": f"Verdict decided early: semantic evaluation skipped for {len(skipped)} step(s)",
+                "detail": f"Steps {skipped} could not change the outcome; the LII score is the "
+                          f"{'lower' if is_valid else 'upper'} bound over all possible scores"
+            })
+        dependency_graph = graph.summary(proof_data.steps)
+        if graph.invalid_references:
+            feedback.insert(1, {
+                "type": "warning",
+                "summary": f"{len(graph.invalid_references)} step(s) depend on unknown steps",
+                "detail": f"Dependencies naming no step of the proof: {dependency_graph['invalid_references']}"
+            })
+        if graph.cycles:
+            feedback.insert(1, {
+                "type": "warning",
+                "summary": f"Circular justification in {len(graph.cycles)} group(s) of steps",
+                "detail": f"Steps {dependency_graph['cycles']} depend on each other; "
+                          f"the proof cannot be accepted"
+            })
+        if not_evaluated:
+            print(f"[W] Proof {proof_data.id} deadline reached: {len(not_evaluated)} steps not evaluated")
+            feedback.insert(1, {
+                "type": "warning",
+                "summary": f"Verification deadline reached: {len(not_evaluated)} step(s) not evaluated",
+                "detail": f"Steps {not_evaluated} were not evaluated within {settings.WORKER_TIMEOUT}s; "
+                          f"the proof cannot be accepted"
+            })
 
         result = {
             "is_valid": is_valid,
@@ -121,21 +423,331 @@ class BackendProofEngine:
             "coherence_score": round(coherence_score, 2),
             "step_results": step_results,
             "feedback": feedback,
-            "semantic_provider_count": len(self.llm_adapter.get_available_providers()) if self.has_llm else 0
+            "not_evaluated_steps": len(not_evaluated),
+            "skipped_steps": len(skipped),
+            "dependency_graph": dependency_graph,
+            "semantic_provider_count": len(self.llm_adapter.get_available_providers()) if self.has_llm else 0,
+            "scoring_version": scoring_version(self.symbolic_weight, self.semantic_weight, self.pass_threshold)
         }
 
         print(f"[+] Proof {proof_data.id} evaluation complete: valid={is_valid}, lii={lii_score:.1f}, coherence={coherence_score:.1f}")
         return result
 
-    async def _verify_symbolic(self, step) -> bool:
+    async def _evaluate_phased(
+        self,
+        proof_data: Proof,
+        completed: Dict[int, StepOutcome],
+        on_step: Optional[Callable[[object, StepOutcome], Awaitable[None]]],
+        deadline: Deadline,
+        step_semaphore: asyncio.Semaphore,
+        graph: JustificationGraph
+    ) -> List[Optional[tuple]]:
+        """
+        Evaluate steps in two phases: all symbolic checks, then LLM evaluations.
+
+        Used for decide-fast mode and batched LLM evaluation, which both need
+        every symbolic result first. LLM evaluations get the symbolic results
+        of the steps each step depends on as context, and run per step or, with
+        settings.SEMANTIC_BATCH_SIZE above 1, per batch of steps. In
+        decide-fast mode, as soon as the achievable LII range (see
+        _lii_bounds) lies entirely above or below PASS_THRESHOLD, the
+        outstanding evaluations are cancelled.
+
+        Returns:
+            list: Per-step outcome in step order; (symbolic, None) for steps
+                whose semantic evaluation was skipped, None for steps not
+                evaluated before the deadline
+        """
+        steps = proof_data.steps
+        outcomes: List[Optional[tuple]] = [completed.get(step.step_index) for step in steps]
+        remaining = [i for i, outcome in enumerate(outcomes) if outcome is None]
+
+        # Phase 1: symbolic checks of the remaining steps
+        symbolic = await _gather_or_cancel([
+            asyncio.ensure_future(self._run_step(
+                step_semaphore, deadline,
+                lambda step=steps[i]: self._symbolic_outcome(step, proof_data.domain, deadline)
+            ))
+            for i in remaining
+        ])
+        for i, outcome in zip(remaining, symbolic):
+            outcomes[i] = None if outcome is None else (outcome, None)
+        remaining = [i for i in remaining if outcomes[i] is not None]
+        for i in list(remaining):
+            if not self._needs_semantic(steps[i], outcomes[i][0]):
+                outcomes[i] = (outcomes[i][0], self.semantic_default_score)
+                remaining.remove(i)
+                if on_step is not None:
+                    await on_step(steps[i], outcomes[i])
+
+        # Phase 2: LLM evaluations (decide-fast: until the verdict is fixed)
+        if self.decide_fast and self._verdict_decided(outcomes):
+            return outcomes
+        size = max(1, self.semantic_batch_size)
+        groups = [remaining[start:start + size] for start in range(0, len(remaining), size)]
+        tasks = {
+            asyncio.ensure_future(self._run_step(
+                step_semaphore, deadline,
+                lambda group=group: self._semantic_scores(
+                    [steps[i] for i in group], proof_data.domain, deadline,
+                    [self._dependency_context(steps, outcomes, graph, i) for i in group]
+                )
+            )): group
+            for group in groups
+        }
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    group = tasks[task]
+                    scores = task.result()
+                    for position, i in enumerate(group):
+                        if scores is None:
+                            outcomes[i] = None  # Deadline passed
+                            continue
+                        outcomes[i] = (outcomes[i][0], scores[position])
+                        if on_step is not None:
+                            await on_step(steps[i], outcomes[i])
+                if pending and self.decide_fast and self._verdict_decided(outcomes):
+                    skipped = sum(len(tasks[task]) for task in pending)
+                    print(f"[*] Proof {proof_data.id} verdict decided; skipping {skipped} LLM evaluations")
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return outcomes
+
+    async def _semantic_scores(
+        self,
+        steps: list,
+        domain: str,
+        deadline: Deadline,
+        contexts: list
+    ) -> List[float]:
+        """Semantic scores of a group of steps (one batched prompt if more than one)"""
+        if len(steps) == 1:
+            return [await self._evaluate_semantic(steps[0], domain, deadline, context=contexts[0])]
+        return await self._evaluate_semantic_batch(steps, domain, deadline, contexts)
+
+    def _dependency_context(
+        self,
+        steps: list,
+        outcomes: List[Optional[tuple]],
+        graph: JustificationGraph,
+        position: int
+    ) -> Optional[list]:
+        """(parent step, symbolic result or None) pairs for a step's LLM prompt"""
+        if not self.dependency_scheduling or not graph.schedule_parents[position]:
+            return None
+        return [
+            (steps[parent], outcomes[parent][0] if outcomes[parent] is not None else None)
+            for parent in graph.schedule_parents[position]
+        ]
+
+    def _lii_bounds(self, outcomes: List[Optional[tuple]]) -> Tuple[float, float]:
+        """
+        Range of LII scores still achievable.
+
+        Unknown symbolic results count as 0 or 100 and unknown semantic scores
+        as anywhere in 0-100.
+
+        Args:
+            outcomes: Per-step outcomes (None = nothing known, semantic score
+                None = not known yet)
+
+        Returns:
+            tuple: (lowest, highest) achievable LII score
+        """
+        if not outcomes:
+            return 0.0, 0.0
+        symbolic_low = symbolic_high = semantic_low = semantic_high = 0.0
+        for outcome in outcomes:
+            if outcome is None:
+                symbolic_high += 100.0
+                semantic_high += 100.0
+                continue
+            (symbolic_pass, _), semantic_score = outcome
+            symbolic_score = 100.0 if symbolic_pass else 0.0
+            symbolic_low += symbolic_score
+            symbolic_high += symbolic_score
+            if semantic_score is None:
+                semantic_high += 100.0
+            else:
+                semantic_low += semantic_score
+                semantic_high += semantic_score
+        n = len(outcomes)
+        low = (symbolic_low * self.symbolic_weight + semantic_low * self.semantic_weight) / n
+        high = (symbolic_high * self.symbolic_weight + semantic_high * self.semantic_weight) / n
+        return low, high
+
+    def _verdict_decided(self, outcomes: List[Optional[tuple]]) -> bool:
+        """Whether every achievable LII score gives the same pass/fail verdict"""
+        low, high = self._lii_bounds(outcomes)
+        return low >= self.pass_threshold or high < self.pass_threshold
+
+    async def _run_step(self, step_semaphore: asyncio.Semaphore, deadline: Deadline, call):
+        """
+        Run call() under the per-proof step limit, unless the deadline passes first.
+
+        Returns:
+            The result of call(), or None if the deadline passed
+        """
+        async with step_semaphore:
+            if deadline.expired():
+                return None
+            try:
+                return await asyncio.wait_for(call(), deadline.remaining())
+            except asyncio.TimeoutError:
+                return None
+
+    async def aclose(self) -> None:
+        """Close the LLM provider clients held by this engine"""
+        await self.llm_adapter.aclose()
+
+    async def _step_outcome(
+        self,
+        step,
+        domain: str,
+        deadline: Optional[Deadline] = None,
+        context: Optional[list] = None,
+        on_symbolic: Optional[Callable[[Tuple[bool, str]], None]] = None
+    ) -> StepOutcome:
+        """
+        Evaluate one step: symbolic check, then LLM evaluation if the policy asks for it.
+
+        Under the "always" policy both run concurrently.
+
+        Args:
+            step: ProofStep entity
+            domain: Mathematical domain
+            deadline: Verification deadline (None = unbounded)
+            context: Steps this step depends on, for the LLM prompt
+            on_symbolic: Called with the symbolic result as soon as it is known
+
+        Returns:
+            StepOutcome: ((symbolic_pass, symbolic_status), semantic_score)
+        """
+        async def symbolic_outcome():
+            result = await self._symbolic_outcome(step, domain, deadline)
+            if on_symbolic is not None:
+                on_symbolic(result)
+            return result
+
+        if self.semantic_policy == "always":
+            symbolic, semantic_score = await asyncio.gather(
+                symbolic_outcome(),
+                self._evaluate_semantic(step, domain, deadline, context=context),
+            )
+            return symbolic, semantic_score
+
+        symbolic = await symbolic_outcome()
+        if self._needs_semantic(step, symbolic):
+            return symbolic, await self._evaluate_semantic(step, domain, deadline, context=context)
+        return symbolic, self.semantic_default_score
+
+    def _needs_semantic(self, step, symbolic: Tuple[bool, str]) -> bool:
+        """
+        Whether a step is sent to the LLM providers under the semantic policy.
+
+        Policies (settings.SEMANTIC_POLICY):
+        - "always": every step
+        - "unproven": steps whose symbolic check did not pass or that have
+          no equation to check
+        - "sampled": unproven steps plus a SEMANTIC_SAMPLE_RATE fraction of
+          proven ones, chosen per step ID (the same steps on every attempt)
+
+        Args:
+            step: ProofStep entity
+            symbolic: (symbolic_pass, symbolic_status) of the step
+
+        Returns:
+            bool: False if the step gets settings.SEMANTIC_DEFAULT_SCORE instead
+        """
+        if self.semantic_policy == "always":
+            return True
+        symbolic_pass, symbolic_status = symbolic
+        if not symbolic_pass or symbolic_status == "no_equation":
+            return True
+        if self.semantic_policy == "sampled":
+            return random.Random(step.id).random() < self.semantic_sample_rate
+        return False
+
+    async def _symbolic_outcome(
+        self,
+        step,
+        domain: str,
+        deadline: Optional[Deadline] = None
+    ) -> Tuple[bool, str]:
+        """
+        Run the symbolic check of a step and classify the outcome.
+
+        The check's timeout is settings.SYMBOLIC_TIMEOUT, capped by the deadline.
+        Verdicts are served from and saved to the step cache.
+
+        Returns:
+            tuple: (symbolic_pass, symbolic_status) where status is "passed",
+                "failed", "timeout", "resource_limit", "error" (no verdict) or
+                "no_equation" (nothing to check; counts as passed)
+        """
+        sides = self._equation_sides(step)
+        if sides is None:
+            return True, "no_equation"
+        timeout = deadline.cap(settings.SYMBOLIC_TIMEOUT) if deadline else None
+        key = None
+        if self.step_cache.enabled:
+            equation_key = await self.symbolic_verifier.equation_key(*sides, domain, timeout=timeout)
+            key = symbolic_cache_key(equation_key) if equation_key is not None else None
+        cached = self.step_cache.get_symbolic(key) if key is not None else None
+        if cached is not None:
+            return cached
+        try:
+            symbolic_pass = await self._verify_symbolic(step, domain, timeout=timeout)
+        except SymbolicCheckError as e:
+            # Limit hits and errors are reported explicitly, never treated
+            # as a verdict on the equation (nor cached)
+            return False, e.outcome.value
+        outcome = (symbolic_pass, "passed" if symbolic_pass else "failed")
+        if key is not None:
+            self.step_cache.put_symbolic(key, outcome)
+        return outcome
+
+    @staticmethod
+    def _equation_sides(step) -> Optional[Tuple[str, str]]:
+        """(lhs, rhs) of a step's equation in a format _verify_symbolic checks, or None"""
+        equation = getattr(step, 'equation', None)
+        if isinstance(equation, dict):
+            lhs, rhs = equation.get('lhs'), equation.get('rhs')
+        elif isinstance(equation, str):
+            parts = equation.split('=')
+            if len(parts) != 2:
+                return None
+            lhs, rhs = parts[0].strip(), parts[1].strip()
+        else:
+            return None
+        return (lhs, rhs) if lhs and rhs else None
+
+    async def _verify_symbolic(
+        self,
+        step,
+        domain: str = "algebra",
+        timeout: Optional[float] = None
+    ) -> bool:
         """
         Verify symbolic correctness of a proof step using SymPy.
 
         Args:
             step: ProofStep entity
+            domain: Mathematical domain of the proof
+            timeout: Symbolic check limit in seconds (default: settings.SYMBOLIC_TIMEOUT)
 
         Returns:
             bool: True if symbolically valid
+
+        Raises:
+            SymbolicCheckError: If the check hit its time or memory limit
+                (SymbolicLimitExceeded) or failed without a verdict
         """
         try:
             # Check if step has an equation to verify
@@ -161,26 +773,39 @@ class BackendProofEngine:
 
             # Verify symbolic equivalence
             if lhs and rhs:
-                return await self.symbolic_verifier.verify_equation(lhs, rhs)
+                return await self.symbolic_verifier.verify_equation(lhs, rhs, domain, timeout=timeout)
             else:
                 # No equation content, consider valid
                 return True
 
+        except SymbolicCheckError:
+            raise
         except Exception as e:
             print(f"[W] Symbolic verification error for step {step.id if hasattr(step, 'id') else 'unknown'}: {e}")
             # On error, assume valid (graceful degradation)
             return True
 
-    async def _evaluate_semantic(self, step, domain: str) -> float:
+    async def _evaluate_semantic(
+        self,
+        step,
+        domain: str,
+        deadline: Optional[Deadline] = None,
+        context: Optional[list] = None
+    ) -> float:
         """
         Evaluate semantic quality of a proof step using LLM consensus.
 
         Uses multi-provider evaluation for reliability and calculates
-        consensus score from all available LLM providers.
+        consensus score from all available LLM providers. Each request is
+        limited to settings.LLM_TIMEOUT, capped by the deadline. Steps
+        evaluated without dependency context are served from and saved to
+        the step cache.
 
         Args:
             step: ProofStep entity
             domain: Mathematical domain (algebra, calculus, logic, etc.)
+            deadline: Verification deadline (None = unbounded)
+            context: (step, symbolic result) of the steps this step depends on
 
         Returns:
             float: Semantic score (0-100)
@@ -190,16 +815,42 @@ class BackendProofEngine:
             print("[W] No LLM providers - skipping semantic evaluation")
             return 50.0
 
+        # The prompt (and so the score) of a step with context is not shared
+        key = step_cache_key(step, domain, self.step_cache_version) if not context else None
+        if key is not None:
+            cached = self.step_cache.get_semantic(key)
+            if cached is not None:
+                return SemanticScore.from_providers(cached)
+
         # Build evaluation prompt
-        prompt = self._build_evaluation_prompt(step, domain)
+        prompt = self._build_evaluation_prompt(step, domain, context)
+
+        # Process-wide cap on in-flight LLM evaluations across all proofs
+        async with get_llm_semaphore():
+            # Configure LLM options (timeout taken once a slot is free)
+            options = EvaluationOptions(
+                temperature=0.3,  # Low temperature for consistent evaluation
+                max_tokens=300,   # Concise reasoning
+                json_mode=True,   # Structured response
+                timeout=deadline.cap(settings.LLM_TIMEOUT) if deadline else None
+            )
+            score = await self._request_semantic_score(prompt, options)
+        if key is not None and isinstance(score, SemanticScore):
+            self.step_cache.put_semantic(key, score.providers)
+        return score
+
+    async def _request_semantic_score(self, prompt: str, options: EvaluationOptions) -> float:
+        """
+        Query the LLM providers for a step score (parallel consensus, then fallback).
 
-        # Configure LLM options
-        options = EvaluationOptions(
-            temperature=0.3,  # Low temperature for consistent evaluation
-            max_tokens=300,   # Concise reasoning
-            json_mode=True    # Structured response
-        )
+        Args:
+            prompt: Evaluation prompt
+            options: LLM request options
 
+        Returns:
+            float: Semantic score (0-100), a SemanticScore with the provider
+                scores, or 50.0 if every provider failed
+        """
         try:
             # Try parallel evaluation first (best reliability)
             responses: List[LLMResponse] = await self.llm_adapter.evaluate_parallel(prompt, options)
@@ -212,11 +863,14 @@ class BackendProofEngine:
                       f"coherence={consensus.coherence_score:.1f}, "
                       f"providers={len(responses)}")
 
-                return consensus.average_score
+                return SemanticScore(
+                    consensus.average_score,
+                    {response.provider: float(response.score) for response in responses}
+                )
             elif len(responses) == 1:
                 # Single provider response
                 print(f"    [+] Semantic score (single provider): {responses[0].score}")
-                return float(responses[0].score)
+                return SemanticScore.from_providers({responses[0].provider: float(responses[0].score)})
             else:
                 # No responses (should not happen)
                 print("[W] No LLM responses received")
@@ -229,20 +883,162 @@ class BackendProofEngine:
             try:
                 response: LLMResponse = await self.llm_adapter.evaluate_with_fallback(prompt, options)
                 print(f"    [+] Semantic score (fallback): {response.score} from {response.provider}")
-                return float(response.score)
+                return SemanticScore.from_providers({response.provider: float(response.score)})
 
             except ConnectionError as fallback_error:
                 # All LLMs failed
                 print(f"[-] All LLM providers failed: {fallback_error}")
                 return 50.0  # Neutral score as fallback
 
-    def _build_evaluation_prompt(self, step, domain: str) -> str:
+    async def _evaluate_semantic_batch(
+        self,
+        steps: list,
+        domain: str,
+        deadline: Optional[Deadline] = None,
+        contexts: Optional[list] = None
+    ) -> List[float]:
+        """
+        Evaluate several steps of a proof with one prompt per provider.
+
+        The providers return a JSON array of per-step scores; each step's
+        score is the mean over the providers that returned a valid entry for
+        it. Steps without any valid entry are re-evaluated individually with
+        _evaluate_semantic. Steps without dependency context are served from
+        and saved to the step cache, so only cache misses are sent.
+
+        Args:
+            steps: ProofStep entities, in proof order
+            domain: Mathematical domain
+            deadline: Verification deadline (None = unbounded)
+            contexts: Per step, the steps it depends on (see _evaluate_semantic)
+
+        Returns:
+            List[float]: Semantic score (0-100) per step, in the order given
+        """
+        if not self.has_llm:
+            print("[W] No LLM providers - skipping semantic evaluation")
+            return [50.0] * len(steps)
+
+        contexts = contexts or [None] * len(steps)
+
+        # Steps without context are served from the step cache; the rest are batched
+        keys = [
+            step_cache_key(step, domain, self.step_cache_version) if not context else None
+            for step, context in zip(steps, contexts)
+        ]
+        scores: List[Optional[float]] = [None] * len(steps)
+        for position, key in enumerate(keys):
+            cached = self.step_cache.get_semantic(key) if key is not None else None
+            if cached is not None:
+                scores[position] = SemanticScore.from_providers(cached)
+        pending = [position for position, score in enumerate(scores) if score is None]
+        if not pending:
+            return scores
+
+        prompt = self._build_batch_prompt(
+            [steps[position] for position in pending],
+            domain,
+            [contexts[position] for position in pending]
+        )
+
+        async with get_llm_semaphore():
+            options = EvaluationOptions(
+                temperature=0.3,
+                max_tokens=min(4096, BATCH_TOKENS_PER_STEP * (len(pending) + 1)),
+                json_mode=True,
+                timeout=deadline.cap(settings.LLM_TIMEOUT) if deadline else None,
+                system_message=BATCH_SYSTEM_MESSAGE
+            )
+            try:
+                responses = await self.llm_adapter.evaluate_parallel(prompt, options)
+            except ConnectionError as e:
+                print(f"[W] Parallel batch evaluation failed: {e}. Trying fallback...")
+                try:
+                    responses = [await self.llm_adapter.evaluate_with_fallback(prompt, options)]
+                except ConnectionError as fallback_error:
+                    # Same neutral score as a failed single-step evaluation
+                    print(f"[-] All LLM providers failed: {fallback_error}")
+                    return [50.0 if score is None else score for score in scores]
+
+        provider_scores: List[Dict[str, float]] = [{} for _ in pending]
+        for response in responses:
+            for index, score in _parse_batch_scores(response.raw_response, len(pending)).items():
+                provider_scores[index][response.provider] = score
+        for position, found in zip(pending, provider_scores):
+            if found:
+                scores[position] = SemanticScore.from_providers(found)
+                if keys[position] is not None:
+                    self.step_cache.put_semantic(keys[position], found)
+        print(f"    [+] Batched semantic scores for {len(pending)} steps from {len(responses)} providers")
+
+        # Retried outside the LLM slot held above (_evaluate_semantic takes its own)
+        missing = [position for position, score in enumerate(scores) if score is None]
+        if missing:
+            print(f"[W] {len(missing)} of {len(pending)} batched step scores malformed; retrying individually")
+            retried = await asyncio.gather(
+                *(
+                    self._evaluate_semantic(steps[position], domain, deadline, context=contexts[position])
+                    for position in missing
+                )
+            )
+            for position, score in zip(missing, retried):
+                scores[position] = score
+        return scores
+
+    def _build_batch_prompt(self, steps: list, domain: str, contexts: Optional[list] = None) -> str:
+        """
+        Build a prompt evaluating several proof steps at once.
+
+        Steps are numbered from 1 in the prompt; the response must carry one
+        entry per step number.
+
+        Args:
+            steps: ProofStep entities, in proof order
+            domain: Mathematical domain
+            contexts: Per step, the steps it depends on (see _evaluate_semantic)
+
+        Returns:
+            str: Formatted evaluation prompt
+        """
+        contexts = contexts or [None] * len(steps)
+        listed = "\n\n".join(
+            f"""### Step {number}
+**Claim**: {step.claim}
+**Equation**: {step.equation}
+**Reasoning**: {step.reasoning}{self._format_dependencies(context)}"""
+            for number, (step, context) in enumerate(zip(steps, contexts), start=1)
+        )
+        prompt = f"""Evaluate each of the following {len(steps)} consecutive proof steps from the domain of {domain}:
+
+{listed}
+
+Assess the logical soundness and correctness of each step, given the steps before it. Consider:
+1. Does the reasoning justify the claim?
+2. Is the equation correctly derived?
+3. Are there any logical gaps or errors?
+4. Is the step appropriate for the {domain} domain?
+
+Score each step from 0-100 where:
+- 0-30: Major logical errors or incorrect reasoning
+- 31-60: Some issues but partially correct
+- 61-85: Mostly correct with minor issues
+- 86-100: Logically sound and correct
+
+Respond in JSON format with a "steps" array holding exactly one object per step, each with:
+- "step": the step number (1-{len(steps)})
+- "score": integer from 0-100
+- "reasoning": brief explanation of your evaluation
+"""
+        return prompt
+
+    def _build_evaluation_prompt(self, step, domain: str, context: Optional[list] = None) -> str:
         """
         Build evaluation prompt for LLM semantic analysis.
 
         Args:
             step: ProofStep entity
             domain: Mathematical domain
+            context: (step, symbolic result) of the steps this step depends on
 
         Returns:
             str: Formatted evaluation prompt
@@ -251,7 +1047,7 @@ class BackendProofEngine:
 
 **Claim**: {step.claim}
 **Equation**: {step.equation}
-**Reasoning**: {step.reasoning}
+**Reasoning**: {step.reasoning}{self._format_dependencies(context)}
 
 Assess the logical soundness and correctness of this step. Consider:
 1. Does the reasoning justify the claim?
@@ -271,6 +1067,19 @@ Respond in JSON format with:
 """
         return prompt
 
+    @staticmethod
+    def _format_dependencies(context: Optional[list]) -> str:
+        """Prompt lines listing the steps a step depends on and their symbolic results"""
+        if not context:
+            return ""
+        lines = []
+        for parent, symbolic in context[:MAX_CONTEXT_STEPS]:
+            status = symbolic[1] if symbolic is not None else "not_evaluated"
+            lines.append(f"- {parent.claim} (equation: {parent.equation}; symbolic check: {status})")
+        if len(context) > MAX_CONTEXT_STEPS:
+            lines.append(f"- ... and {len(context) - MAX_CONTEXT_STEPS} more")
+        return "\n**Depends on**:\n" + "\n".join(lines)
+
     def _calculate_coherence(self, semantic_scores: List[float]) -> float:
         """
         Calculate coherence score based on consistency of semantic scores.
@@ -310,24 +1119,14 @@ Respond in JSON format with:
         Returns:
             List[dict]: Feedback messages
         """
-        feedback = []
-
         # Overall assessment
-        if is_valid:
-            feedback.append({
-                "type": "success",
-                "summary": "Proof is logically sound",
-                "detail": f"LII score of {lii_score:.1f} exceeds threshold of {self.pass_threshold}"
-            })
-        else:
-            feedback.append({
-                "type": "warning",
-                "summary": "Proof has potential issues",
-                "detail": f"LII score of {lii_score:.1f} is below threshold of {self.pass_threshold}"
-            })
+        feedback = [overall_assessment(is_valid, lii_score, self.pass_threshold)]
 
         # Step-specific feedback
-        weak_steps = [sr for sr in step_results if sr.get("semantic_score", 100) < 60]
+        weak_steps = [
+            sr for sr in step_results
+            if sr.get("semantic_score") is not None and sr["semantic_score"] < 60
+        ]
         if weak_steps:
             step_indices = [sr["step_index"] for sr in weak_steps]
             feedback.append({
@@ -336,6 +1135,18 @@ Respond in JSON format with:
                 "detail": f"Steps {step_indices} have low semantic scores"
             })
 
+        # Symbolic checks stopped by time/memory limits
+        limited_steps = [
+            sr["step_index"] for sr in step_results
+            if sr.get("symbolic_status") in ("timeout", "resource_limit")
+        ]
+        if limited_steps:
+            feedback.append({
+                "type": "warning",
+                "summary": f"{len(limited_steps)} step(s) exceeded symbolic verification limits",
+                "detail": f"Steps {limited_steps} could not be checked within the time/memory budget"
+            })
+
         # Domain-specific feedback
         feedback.append({
             "type": "info",
@@ -346,74 +1157,165 @@ Respond in JSON format with:
         return feedback
 
 
-async def run_proof_verification(proof_id: int, db_url: str) -> None:
+# Engine shared by all verifications in this process (see get_proof_engine)
+_proof_engine: Optional[BackendProofEngine] = None
+
+
+def get_proof_engine() -> BackendProofEngine:
     """
-    Background task to verify a proof.
+    Get the process-wide proof engine.
 
-    This function runs in a background task and needs its own database session.
+    The engine owns the LLM provider clients and their connection pools, so
+    it is created once (normally from the FastAPI lifespan) and reused for
+    every proof.
+
+    Returns:
+        BackendProofEngine: Shared engine instance
+    """
+    global _proof_engine
+    if _proof_engine is None:
+        _proof_engine = BackendProofEngine()
+    return _proof_engine
+
+
+def get_step_cache_stats() -> dict:
+    """Step result cache statistics of the shared engine (empty before it exists)"""
+    if _proof_engine is None:
+        return StepResultCache(settings.STEP_CACHE_SIZE, settings.STEP_CACHE_TTL).get_stats()
+    return _proof_engine.step_cache.get_stats()
+
+
+async def close_proof_engine() -> None:
+    """Close the shared engine's clients (called on application shutdown)"""
+    global _proof_engine
+    if _proof_engine is not None:
+        engine, _proof_engine = _proof_engine, None
+        await engine.aclose()
+
+
+async def run_proof_verification(
+    proof_id: int,
+    db_url: Optional[str] = None,
+    owner: Optional[str] = None
+) -> None:
+    """
+    Verify one proof and store its result.
+
+    Run by the job queue workers (app.services.job_queue) for claimed
+    proofs. Sessions come from the application's shared engine (initialized
+    on demand when run outside the API process). A session is only held
+    around database work, never while the proof is being evaluated, and at
+    most settings.MAX_CONCURRENT_VERIFICATIONS verifications run at once.
 
     Args:
         proof_id: ID of proof to verify
-        db_url: Database connection URL for creating new session
+        db_url: Database URL used if the shared engine is not initialized yet
+            (default: settings.DATABASE_URL)
+        owner: Queue worker holding the proof's lease (None = not claimed
+            through the queue; the proof is marked 'processing' here)
 
     Flow:
-        1. Update status to 'processing'
-        2. Load proof data with steps
-        3. Execute verification engine
+        1. Update status to 'processing' (unless claimed by a worker)
+        2. Load proof data with steps (and step checkpoints of earlier attempts)
+        3. Execute verification engine on the remaining steps, checkpointing
+           them, within settings.WORKER_TIMEOUT (unfinished steps are
+           recorded as not evaluated)
         4. Store results in database
-        5. Update status to 'completed' or 'failed'
+        5. Update status to 'completed' or 'failed' (releasing the lease)
     """
-    # Create independent database session for background task
-    engine = create_async_engine(str(db_url), echo=False)
-    session_maker = async_sessionmaker(engine, expire_on_commit=False)
-
-    async with session_maker() as db:
+    if db_base.async_session_maker is None:
+        await db_base.init_db(str(db_url or settings.DATABASE_URL))
+    session_maker = db_base.async_session_maker
+
+    _verification_stats["waiting"] += 1
+    async with get_verification_semaphore():
+        _verification_stats["waiting"] -= 1
+        _verification_stats["active"] += 1
         try:
-            # Step 1: Update status to processing
-            await crud.proof.update_status(db, proof_id=proof_id, status="processing")
+            await _verify_proof(proof_id, session_maker, owner)
+        finally:
+            _verification_stats["active"] -= 1
+
+
+async def _verify_proof(proof_id: int, session_maker, owner: Optional[str]) -> None:
+    """Verification body of run_proof_verification()"""
+    # Wall-clock budget; steps still running when it passes are not evaluated
+    deadline = Deadline(settings.WORKER_TIMEOUT)
+    try:
+        # Steps 1-2: Mark as processing and load proof data (with checkpoints
+        # left by an interrupted earlier attempt)
+        async with session_maker() as db:
+            if owner is None:
+                await crud.proof.update_status(db, proof_id=proof_id, status="processing")
             print(f"[>] Started verification for proof {proof_id}")
 
-            # Step 2: Load proof data
             proof_data = await crud.proof.get(db=db, id=proof_id)
             if not proof_data:
                 print(f"[-] Proof {proof_id} not found")
                 return
+            checkpoints = await crud.proof.get_step_checkpoints(db, proof_id=proof_id)
 
-            # Step 3: Run verification engine
-            engine = BackendProofEngine()
-            result_data = await engine.evaluate(proof_data)
+        # Step 3: Run verification engine (shared, long-lived clients; no connection
+        # held), checkpointing step outcomes in batches as they complete
+        writer = StepCheckpointWriter(session_maker, proof_id)
+        try:
+            result_data = await get_proof_engine().evaluate(
+                proof_data,
+                completed=completed_outcomes(proof_data.steps, checkpoints),
+                on_step=writer.add,
+                deadline=deadline,
+            )
+        finally:
+            await writer.flush()
 
-            # Step 4: Store result in database
+        # Steps 4-5: Store result and mark as completed
+        async with session_maker() as db:
             await crud.proof.create_result(db=db, proof_id=proof_id, obj_in=result_data)
+            await crud.proof.clear_step_checkpoints(db, proof_id=proof_id)
+            await set_final_status(db, proof_id, owner, "completed")
+        _verification_stats["completed"] += 1
+        print(f"[+] Proof {proof_id} verification completed")
+
+    except Exception as e:
+        # Handle errors: update status to failed
+        _verification_stats["failed"] += 1
+        print(f"[-] Proof {proof_id} verification failed: {e}")
+        try:
+            async with session_maker() as db:
+                await set_final_status(db, proof_id, owner, "failed", failure_reason=f"{type(e).__name__}: {e}")
+        except Exception as update_error:
+            print(f"[-] Failed to update status: {update_error}")
+
+
+async def set_final_status(
+    db: AsyncSession,
+    proof_id: int,
+    owner: Optional[str],
+    status: str,
+    failure_reason: Optional[str] = None
+) -> None:
+    """
+    Set a proof's final status, releasing the owner's lease if it was claimed.
 
-            # Step 5: Update status to completed
-            await crud.proof.update_status(db, proof_id=proof_id, status="completed")
-            print(f"[+] Proof {proof_id} verification completed")
-
-        except Exception as e:
-            # Handle errors: update status to failed
-            print(f"[-] Proof {proof_id} verification failed: {e}")
-            try:
-                await crud.proof.update_status(db, proof_id=proof_id, status="failed")
-            except Exception as update_error:
-                print(f"[-] Failed to update status: {update_error}")
-
-        finally:
-            # Clean up database connection
-            await engine.dispose()
+    Duplicate submissions waiting on the proof are then completed with its
+    result (or re-queued if it failed).
+    """
+    if owner is None:
+        await crud.proof.update_status(
+            db, proof_id=proof_id, status=status, failure_reason=failure_reason
+        )
+    elif not await crud.proof.finish(
+        db, proof_id=proof_id, owner=owner, status=status, failure_reason=failure_reason
+    ):
+        print(f"[W] Proof {proof_id} is no longer leased by {owner}; status not updated")
+        return
+    completed, requeued = await crud.proof.resolve_duplicates(db, original_id=proof_id)
+    if completed or requeued:
+        print(f"[*] Proof {proof_id}: {completed} duplicates completed, {requeued} re-queued")
 
 
 # [T] Future enhancements
 
-# class VerificationQueue:
-#     """Queue manager for proof verification tasks"""
-#     def __init__(self, max_concurrent: int = 5):
-#         self.semaphore = asyncio.Semaphore(max_concurrent)
-#
-#     async def enqueue(self, proof_id: int):
-#         async with self.semaphore:
-#             await run_proof_verification(proof_id)
-
 # async def validate_proof_structure(proof: Proof) -> bool:
 #     """Pre-validation before expensive verification"""
 #     # Check for cycles in dependencies
@@ -5,10 +5,20 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 
 from app.core.config import settings
-from app.db.base import init_db, create_tables
+from app.db.base import init_db, create_tables, get_pool_stats
 from app.api.router import api_router
+from app.services import job_queue
+from app.services.symbolic.pool import symbolic_pool
+from app.services.symbolic.stats import symbolic_stats
+from app.services.verification import (
+    close_proof_engine,
+    get_proof_engine,
+    get_step_cache_stats,
+    get_verification_stats,
+)
 
 
 @asynccontextmanager
@@ -19,9 +29,15 @@ async def lifespan(app: FastAPI):
     Startup:
         - Initialize database connection
         - Create tables (development mode only)
+        - Start symbolic (SymPy) worker processes
+        - Create the shared proof engine (LLM clients)
+        - Start the embedded queue worker (if enabled)
         - Log configuration
 
     Shutdown:
+        - Stop the embedded queue worker (in-flight proofs finish)
+        - Close LLM provider clients
+        - Stop symbolic worker processes
         - Close database connections
         - Clean up resources
     """
@@ -38,10 +54,27 @@ async def lifespan(app: FastAPI):
         await create_tables()
         print("[+] Database tables created (development mode)")
 
+    # Warm symbolic workers so the first proofs do not pay for SymPy imports
+    await symbolic_pool.warm_up()
+
+    # One engine (and one connection pool per LLM provider) for all proofs
+    get_proof_engine()
+
+    worker_task = None
+    if settings.EMBEDDED_WORKER:
+        job_queue.embedded_worker = job_queue.VerificationWorker()
+        worker_task = asyncio.create_task(job_queue.embedded_worker.run())
+
     yield
 
     # [#] Shutdown
     print(f"[-] Shutting down {settings.APP_NAME}")
+    if worker_task is not None:
+        job_queue.embedded_worker.stop()
+        await worker_task
+        job_queue.embedded_worker = None
+    await close_proof_engine()
+    symbolic_pool.shutdown()
 
 
 # [=] FastAPI Application Instance
@@ -101,6 +134,25 @@ async def health_check():
     }
 
 
+# [o] Metrics Endpoint
+@app.get("/metrics", tags=["health"])
+async def metrics():
+    """
+    Runtime metrics for monitoring and tuning.
+
+    Returns:
+        dict: Symbolic verification statistics (deciding tier counts, timings),
+            database pool usage, background verification counters and step
+            result cache hit rates
+    """
+    return {
+        "symbolic": symbolic_stats.get_stats(),
+        "database": get_pool_stats(),
+        "verifications": get_verification_stats(),
+        "step_cache": get_step_cache_stats(),
+    }
+
+
 # [o] Root Endpoint
 @app.get("/", tags=["root"])
 async def root():
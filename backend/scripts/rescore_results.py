@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+ProofBench Backend - Bulk Rescoring Script
+
+Recompute the LII score, confidence interval, coherence and verdict of
+stored results after SYMBOLIC_WEIGHT, SEMANTIC_WEIGHT, PASS_THRESHOLD or
+the scoring formulas change. Uses the symbolic verdicts and per-provider
+semantic scores stored with each result; no LLM provider is called.
+
+Only results scored with a different configuration are rescored unless
+--force is given.
+
+Usage:
+    cd backend
+    python scripts/rescore_results.py [--batch-size 500] [--force] [--dry-run] [--limit N]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend to path (parent of scripts/)
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.config import settings  # noqa: E402
+from app.db import base as db_base  # noqa: E402
+from app.services.rescoring import RESCORE_BATCH_SIZE, rescore_results  # noqa: E402
+
+
+async def main(batch_size: int, force: bool, dry_run: bool, limit: int = None) -> int:
+    """Rescore stored results and print a summary"""
+    print("=" * 60)
+    print("ProofBench Backend - Bulk Rescoring")
+    print("=" * 60)
+    print(f"    Weights: symbolic={settings.SYMBOLIC_WEIGHT}, semantic={settings.SEMANTIC_WEIGHT}")
+    print(f"    Pass threshold: {settings.PASS_THRESHOLD}")
+    if dry_run:
+        print("    Dry run: nothing is written")
+    print()
+
+    await db_base.init_db(settings.DATABASE_URL)
+    try:
+        stats = await rescore_results(
+            db_base.async_session_maker,
+            batch_size=batch_size,
+            force=force,
+            dry_run=dry_run,
+            limit=limit
+        )
+    finally:
+        await db_base.async_engine.dispose()
+
+    print()
+    print(f"[+] Scoring version {stats['scoring_version']}: {stats['rescored']} results rescored, "
+          f"{stats['verdicts_changed']} verdicts changed")
+    if stats["skipped"]:
+        print(f"[W] {stats['skipped']} results have steps skipped by decide-fast; re-verify them instead")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rescore stored proof results without LLM calls")
+    parser.add_argument("--batch-size", type=int, default=RESCORE_BATCH_SIZE, help="Results per batch")
+    parser.add_argument("--force", action="store_true", help="Also rescore results at the current scoring version")
+    parser.add_argument("--dry-run", action="store_true", help="Compute without writing")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many results")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.batch_size, args.force, args.dry_run, args.limit)))
@@ -0,0 +1,446 @@
+# [T] ProofBench Backend - Job Queue Tests
+# Tests for lease-based claiming and the verification queue worker
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app import crud
+from app.core.config import settings
+from app.db import base as db_base
+from app.models.proof import Proof, ProofStatus, ProofStep
+from app.schemas.proof import ProofCreate
+from app.services import job_queue, verification
+from app.services.dedupe import deduplicate
+from app.services.fingerprint import proof_fingerprint
+from app.services.rescoring import rescore_results
+from app.services.revalidation import revalidate, reusable_outcomes
+from app.services.scoring import SemanticScore
+from app.services.verification import BackendProofEngine
+
+
+@pytest_asyncio.fixture
+async def session_maker(monkeypatch):
+    """Shared session maker on an in-memory SQLite database"""
+    db_engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with db_engine.begin() as conn:
+        await conn.run_sync(db_base.Base.metadata.create_all)
+    maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(db_base, "async_session_maker", maker)
+    yield maker
+    await db_engine.dispose()
+
+
+async def _submit(maker, count: int = 1, steps: int = 1):
+    """Create pending proofs and return their IDs"""
+    ids = []
+    async with maker() as db:
+        for _ in range(count):
+            db_proof = await crud.proof.create_with_steps(db=db, obj_in=ProofCreate(
+                domain="algebra",
+                steps=[
+                    {"claim": f"c{i}", "equation": {"lhs": "x", "rhs": "x"}, "reasoning": "r"}
+                    for i in range(steps)
+                ],
+            ))
+            ids.append(db_proof.id)
+    return ids
+
+
+@pytest.mark.asyncio
+class TestJobQueue:
+    """Test suite for the database-backed verification queue"""
+
+    async def test_claim_next_in_submission_order(self, session_maker):
+        """Test that pending proofs are claimed oldest first, each exactly once"""
+        # Arrange
+        ids = await _submit(session_maker, 2)
+
+        # Act
+        async with session_maker() as db:
+            first = await crud.proof.claim_next(db, owner="w1", lease_seconds=60)
+            second = await crud.proof.claim_next(db, owner="w2", lease_seconds=60)
+            third = await crud.proof.claim_next(db, owner="w1", lease_seconds=60)
+            claimed = await crud.proof.get(db=db, id=first)
+
+        # Assert
+        assert [first, second] == ids
+        assert third is None
+        assert claimed.status == ProofStatus.PROCESSING
+        assert claimed.lease_owner == "w1"
+        assert claimed.lease_expires_at is not None
+
+    async def test_worker_completes_claimed_proof(self, session_maker, monkeypatch):
+        """Test that a worker verifies a claimed proof and releases its lease"""
+        # Arrange
+        [proof_id] = await _submit(session_maker)
+        shared = MagicMock()
+        shared.evaluate = AsyncMock(return_value={
+            "is_valid": True,
+            "lii_score": 90.0,
+            "confidence_interval": [85.0, 95.0],
+            "coherence_score": 100.0,
+            "step_results": [],
+            "feedback": [],
+        })
+        monkeypatch.setattr(verification, "get_proof_engine", lambda: shared)
+        worker = job_queue.VerificationWorker(worker_id="w1")
+
+        # Act
+        processed = await worker.run_once()
+        idle = await worker.run_once()
+
+        # Assert
+        assert processed == proof_id
+        assert idle is None
+        async with session_maker() as db:
+            stored = await crud.proof.get(db=db, id=proof_id)
+        assert stored.status == ProofStatus.COMPLETED
+        assert stored.lease_owner is None
+        assert stored.result.lii_score == 90.0
+
+    async def test_worker_timeout_fails_proof(self, session_maker, monkeypatch):
+        """Test that verifications overrunning WORKER_TIMEOUT (plus grace) are cancelled and failed"""
+        # Arrange
+        [proof_id] = await _submit(session_maker)
+
+        async def slow_evaluate(proof, **kwargs):
+            await asyncio.sleep(10)
+
+        shared = MagicMock()
+        shared.evaluate = slow_evaluate
+        monkeypatch.setattr(verification, "get_proof_engine", lambda: shared)
+        monkeypatch.setattr(settings, "WORKER_TIMEOUT", 0.1)
+        monkeypatch.setattr(job_queue, "FINALIZE_GRACE", 0.1)
+        worker = job_queue.VerificationWorker(worker_id="w1")
+
+        # Act
+        await worker.run_once()
+
+        # Assert
+        async with session_maker() as db:
+            stored = await crud.proof.get(db=db, id=proof_id)
+        assert stored.status == ProofStatus.FAILED
+        assert stored.lease_owner is None
+        assert "WORKER_TIMEOUT" in stored.failure_reason
+
+    async def test_sweeper_requeues_then_fails_expired_leases(self, session_maker, monkeypatch):
+        """Test that expired leases are re-queued until WORKER_MAX_ATTEMPTS, then failed"""
+        # Arrange
+        [proof_id] = await _submit(session_maker)
+        monkeypatch.setattr(settings, "WORKER_MAX_ATTEMPTS", 2)
+        worker = job_queue.VerificationWorker(worker_id="w1")
+
+        async def claim_and_expire():
+            assert await worker.claim() == proof_id
+            async with session_maker() as db:
+                await db.execute(
+                    update(Proof)
+                    .where(Proof.id == proof_id)
+                    .values(lease_expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+                )
+                await db.commit()
+
+        # Act
+        await claim_and_expire()
+        await worker.sweep()
+        async with session_maker() as db:
+            after_first = await crud.proof.get(db=db, id=proof_id)
+        await claim_and_expire()
+        await worker.sweep()
+        async with session_maker() as db:
+            after_second = await crud.proof.get(db=db, id=proof_id)
+
+        # Assert
+        assert after_first.status == ProofStatus.PENDING
+        assert after_first.lease_owner is None
+        assert after_second.status == ProofStatus.FAILED
+        assert after_second.attempts == 2
+        assert "lease expired" in after_second.failure_reason
+
+    async def test_heartbeat_keeps_lease_and_detects_loss(self, session_maker):
+        """Test that heartbeats renew the owner's lease and fail for other workers"""
+        # Arrange
+        [proof_id] = await _submit(session_maker)
+        async with session_maker() as db:
+            await crud.proof.claim_next(db, owner="w1", lease_seconds=1)
+            before = (await crud.proof.get(db=db, id=proof_id)).lease_expires_at
+
+        # Act
+        async with session_maker() as db:
+            renewed = await crud.proof.heartbeat(db, proof_id=proof_id, owner="w1", lease_seconds=60)
+            stolen = await crud.proof.heartbeat(db, proof_id=proof_id, owner="w2", lease_seconds=60)
+            db.expire_all()
+            after = (await crud.proof.get(db=db, id=proof_id)).lease_expires_at
+
+        # Assert
+        assert renewed is True
+        assert stolen is False
+        assert after > before
+
+    async def test_retry_resumes_from_step_checkpoints(self, session_maker, monkeypatch):
+        """Test that an interrupted verification keeps finished steps and a retry skips them"""
+        # Arrange
+        [proof_id] = await _submit(session_maker, steps=4)
+        monkeypatch.setattr(settings, "CHECKPOINT_BATCH_SIZE", 2)
+        engine = BackendProofEngine()
+        engine.step_concurrency = 1
+        engine._symbolic_outcome = AsyncMock(return_value=(True, "passed"))
+        evaluated = []
+
+        async def semantic(step, domain, deadline=None, context=None):
+            if step.step_index == 3 and 3 not in evaluated:
+                evaluated.append(3)
+                raise RuntimeError("provider outage")
+            evaluated.append(step.step_index)
+            return 80.0
+
+        engine._evaluate_semantic = semantic
+        monkeypatch.setattr(verification, "get_proof_engine", lambda: engine)
+
+        # Act
+        await verification.run_proof_verification(proof_id)
+        async with session_maker() as db:
+            saved = await crud.proof.get_step_checkpoints(db, proof_id=proof_id)
+            failed = await crud.proof.get(db=db, id=proof_id)
+        first_attempt = list(evaluated)
+        await verification.run_proof_verification(proof_id)
+
+        # Assert
+        assert failed.status == ProofStatus.FAILED
+        assert [c.step_index for c in saved] == [0, 1, 2]
+        assert first_attempt == [0, 1, 2, 3]
+        assert evaluated[len(first_attempt):] == [3]
+        async with session_maker() as db:
+            stored = await crud.proof.get(db=db, id=proof_id)
+            remaining = await crud.proof.get_step_checkpoints(db, proof_id=proof_id)
+        assert stored.status == ProofStatus.COMPLETED
+        assert len(stored.result.step_results) == 4
+        assert remaining == []
+
+
+@pytest.mark.asyncio
+class TestDeduplication:
+    """Test suite for fingerprint-based reuse of identical submissions"""
+
+    async def _complete(self, maker, proof_id: int) -> None:
+        """Store a result for a proof and mark it completed"""
+        async with maker() as db:
+            steps = (await crud.proof.get(db=db, id=proof_id)).steps
+            await crud.proof.create_result(db=db, proof_id=proof_id, obj_in={
+                "is_valid": True,
+                "lii_score": 88.0,
+                "confidence_interval": [83.0, 93.0],
+                "coherence_score": 100.0,
+                "step_results": [{"step_id": step.id, "step_index": step.step_index} for step in steps],
+                "feedback": [],
+            })
+            await verification.set_final_status(db, proof_id, None, "completed")
+
+    async def test_fingerprint_ignores_formatting_only(self):
+        """Test that whitespace changes keep the fingerprint and content changes do not"""
+        # Arrange
+        base = {"domain": "algebra", "steps": [{"claim": "x  = 1", "equation": {"lhs": "x", "rhs": "1"}}]}
+        spaced = {"domain": "algebra", "steps": [{"claim": " x = 1 ", "equation": {"rhs": "1", "lhs": " x"}}]}
+        changed = {"domain": "algebra", "steps": [{"claim": "x = 1", "equation": {"lhs": "x", "rhs": "2"}}]}
+
+        # Act
+        fingerprints = [proof_fingerprint(ProofCreate(**data)) for data in (base, spaced, changed)]
+
+        # Assert
+        assert fingerprints[0] == fingerprints[1]
+        assert fingerprints[0] != fingerprints[2]
+
+    async def test_duplicate_reuses_completed_result(self, session_maker):
+        """Test that an identical submission is completed at once with a copy of the result"""
+        # Arrange
+        [original_id, duplicate_id] = await _submit(session_maker, 2, steps=2)
+        await self._complete(session_maker, original_id)
+
+        # Act
+        async with session_maker() as db:
+            duplicate = await crud.proof.get(db=db, id=duplicate_id)
+            outcome = await deduplicate(db, duplicate)
+            db.expire_all()
+            stored = await crud.proof.get(db=db, id=duplicate_id)
+
+        # Assert
+        assert outcome == "reused"
+        assert stored.status == ProofStatus.COMPLETED
+        assert stored.duplicate_of == original_id
+        assert stored.result.lii_score == 88.0
+        assert [sr["step_id"] for sr in stored.result.step_results] == [step.id for step in stored.steps]
+
+    async def test_duplicate_links_to_in_flight_proof(self, session_maker, monkeypatch):
+        """Test that a duplicate waits for the original and is completed or re-queued with it"""
+        # Arrange
+        monkeypatch.setattr(settings, "DEDUPE_POLICY", "reuse_or_link")
+        [original_id, completed_id] = await _submit(session_maker, 2)
+        async with session_maker() as db:
+            await crud.proof.claim_next(db, owner="w1", lease_seconds=60)
+
+        # Act
+        async with session_maker() as db:
+            outcome = await deduplicate(db, await crud.proof.get(db=db, id=completed_id))
+            claimable = await crud.proof.claim_next(db, owner="w2", lease_seconds=60)
+        await self._complete(session_maker, original_id)
+        [failed_id, requeued_id] = await _submit(session_maker, 2, steps=3)
+        async with session_maker() as db:
+            await deduplicate(db, await crud.proof.get(db=db, id=requeued_id))
+            await verification.set_final_status(db, failed_id, None, "failed")
+            db.expire_all()
+            completed = await crud.proof.get(db=db, id=completed_id)
+            requeued = await crud.proof.get(db=db, id=requeued_id)
+
+        # Assert
+        assert outcome == "linked"
+        assert claimable is None
+        assert completed.status == ProofStatus.COMPLETED
+        assert completed.result.lii_score == 88.0
+        assert requeued.status == ProofStatus.PENDING
+        assert requeued.duplicate_of is None
+
+    async def test_dedupe_off_leaves_proof_pending(self, session_maker, monkeypatch):
+        """Test that the off policy verifies every submission"""
+        # Arrange
+        monkeypatch.setattr(settings, "DEDUPE_POLICY", "off")
+        [original_id, duplicate_id] = await _submit(session_maker, 2)
+        await self._complete(session_maker, original_id)
+
+        # Act
+        async with session_maker() as db:
+            outcome = await deduplicate(db, await crud.proof.get(db=db, id=duplicate_id))
+
+        # Assert
+        assert outcome is None
+
+
+@pytest.mark.asyncio
+class TestRevalidation:
+    """Test suite for incremental re-verification of edited proofs"""
+
+    def _steps(self, *steps):
+        """Unsaved steps from (claim, dependencies) pairs"""
+        return [
+            ProofStep(step_index=index, claim=claim, equation={"lhs": "x", "rhs": "x"}, dependencies=deps)
+            for index, (claim, deps) in enumerate(steps)
+        ]
+
+    async def test_changed_step_invalidates_dependents(self):
+        """Test that a changed step and everything depending on it are re-run, moved steps are reused"""
+        # Arrange
+        old = self._steps(("a", []), ("b", ["0"]), ("c", ["1"]), ("d", []))
+        results = [
+            {"step_index": i, "symbolic_pass": True, "symbolic_status": "passed",
+             "semantic_score": 80.0 + i, "semantic_status": "evaluated"}
+            for i in range(4)
+        ]
+        edited = self._steps(("a", []), ("b changed", ["0"]), ("c", ["1"]), ("d", []))
+        inserted = self._steps(("new", []), ("a", []), ("b", ["1"]), ("c", ["2"]), ("d", []))
+
+        # Act
+        after_edit = reusable_outcomes(old, results, edited)
+        after_insert = reusable_outcomes(old, results, inserted)
+
+        # Assert
+        assert sorted(after_edit) == [0, 3]
+        assert after_edit[3] == ((True, "passed"), 83.0)
+        assert sorted(after_insert) == [1, 2, 3, 4]
+        assert after_insert[3] == ((True, "passed"), 82.0)
+
+    async def test_revalidate_only_evaluates_changed_steps(self, session_maker, monkeypatch):
+        """Test that re-verifying a 1-step edit evaluates one step and rescores the whole proof"""
+        # Arrange
+        [proof_id] = await _submit(session_maker, steps=4)
+        engine = BackendProofEngine()
+        engine._symbolic_outcome = AsyncMock(return_value=(True, "passed"))
+        evaluated = []
+
+        async def semantic(step, domain, deadline=None, context=None):
+            evaluated.append(step.claim)
+            return 40.0 if step.claim == "edited" else 80.0
+
+        engine._evaluate_semantic = semantic
+        monkeypatch.setattr(verification, "get_proof_engine", lambda: engine)
+        await verification.run_proof_verification(proof_id)
+        edited_steps = [
+            {"claim": "edited" if i == 2 else f"c{i}", "equation": {"lhs": "x", "rhs": "x"}}
+            for i in range(4)
+        ]
+
+        # Act
+        async with session_maker() as db:
+            proof = await crud.proof.get(db=db, id=proof_id)
+            reused = await revalidate(db, proof, ProofCreate(domain="algebra", steps=edited_steps).steps)
+        await verification.run_proof_verification(proof_id)
+
+        # Assert
+        assert reused == 3
+        assert evaluated == ["c0", "c1", "c2", "c3", "edited"]
+        async with session_maker() as db:
+            stored = await crud.proof.get(db=db, id=proof_id)
+        assert stored.status == ProofStatus.COMPLETED
+        assert [sr["semantic_score"] for sr in stored.result.step_results] == [80.0, 80.0, 40.0, 80.0]
+        assert [sr["step_id"] for sr in stored.result.step_results] == [step.id for step in stored.steps]
+        assert stored.result.lii_score == 91.0  # 0.7 * 100 + 0.3 * mean(80, 80, 40, 80)
+
+    async def test_revalidate_rejects_proof_in_verification(self, session_maker):
+        """Test that a pending proof keeps its steps"""
+        # Arrange
+        [proof_id] = await _submit(session_maker, steps=2)
+
+        # Act
+        async with session_maker() as db:
+            proof = await crud.proof.get(db=db, id=proof_id)
+            outcome = await revalidate(db, proof, ProofCreate(domain="algebra", steps=[{"claim": "other"}]).steps)
+            db.expire_all()
+            stored = await crud.proof.get(db=db, id=proof_id)
+
+        # Assert
+        assert outcome is None
+        assert [step.claim for step in stored.steps] == ["c0", "c1"]
+
+
+@pytest.mark.asyncio
+class TestRescoring:
+    """Test suite for bulk rescoring of stored results"""
+
+    async def test_rescore_results_after_threshold_change(self, session_maker, monkeypatch):
+        """Test that stored results are rescored from provider scores without any LLM call"""
+        # Arrange
+        proof_ids = await _submit(session_maker, 3, steps=2)
+        engine = BackendProofEngine()
+        engine._symbolic_outcome = AsyncMock(return_value=(True, "passed"))
+        engine._evaluate_semantic = AsyncMock(
+            return_value=SemanticScore.from_providers({"openai": 40.0, "anthropic": 60.0})
+        )
+        monkeypatch.setattr(verification, "get_proof_engine", lambda: engine)
+        for proof_id in proof_ids:
+            await verification.run_proof_verification(proof_id)
+        monkeypatch.setattr(settings, "PASS_THRESHOLD", 90.0)
+
+        # Act
+        stats = await rescore_results(session_maker, batch_size=2)
+        again = await rescore_results(session_maker, batch_size=2)
+
+        # Assert
+        assert engine._evaluate_semantic.await_count == 6
+        assert stats["rescored"] == 3
+        assert stats["verdicts_changed"] == 3
+        assert again["scanned"] == 0
+        async with session_maker() as db:
+            stored = await crud.proof.get(db=db, id=proof_ids[0])
+        assert stored.result.is_valid is False
+        assert stored.result.scoring_version == stats["scoring_version"]
+        assert stored.result.feedback[0]["detail"].endswith("threshold of 90.0")
+        assert stored.result.step_results[0]["provider_scores"] == {"openai": 40.0, "anthropic": 60.0}
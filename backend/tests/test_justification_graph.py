@@ -0,0 +1,77 @@
+# [T] ProofBench Backend - Justification Graph Tests
+# Tests for dependency validation, cycle detection and depth
+
+from types import SimpleNamespace
+
+from app.services.justification_graph import JustificationGraph, strongly_connected_components
+
+
+def _steps(*dependencies):
+    """Steps with the given dependency lists, indexed from 0"""
+    return [
+        SimpleNamespace(step_index=index, dependencies=list(deps))
+        for index, deps in enumerate(dependencies)
+    ]
+
+
+class TestJustificationGraph:
+    """Test suite for the step dependency graph"""
+
+    def test_resolves_references_and_depth(self):
+        """Test that numeric and step_N references resolve and depth follows the longest chain"""
+        # Arrange
+        steps = _steps([], ["0"], [0, "step_1"], [])
+
+        # Act
+        graph = JustificationGraph(steps)
+
+        # Assert
+        assert graph.parents == [[], [0], [0, 1], []]
+        assert graph.depth == [0, 1, 2, 0]
+        assert graph.max_depth == 2
+        assert graph.cycles == []
+        assert all(graph.dependencies_valid(position) for position in range(4))
+
+    def test_detects_cycles_and_invalid_references(self):
+        """Test that circular and dangling references are reported by step index"""
+        # Arrange
+        steps = _steps(["2"], ["0"], ["1"], ["3"], ["7", "lemma"], ["0"])
+
+        # Act
+        graph = JustificationGraph(steps)
+
+        # Assert
+        assert graph.cycles == [[0, 1, 2], [3]]
+        assert graph.invalid_references == {4: ["7", "lemma"]}
+        assert graph.depth[5] is None
+        assert graph.max_depth is None
+        assert not graph.dependencies_valid(0)
+        assert not graph.dependencies_valid(4)
+        assert graph.dependencies_valid(5)
+        assert graph.summary(steps)["cycles"] == [[0, 1, 2], [3]]
+
+    def test_schedule_parents_drop_cycle_edges(self):
+        """Test that scheduling edges inside a cycle are removed, keeping the rest"""
+        # Arrange
+        steps = _steps([], ["0", "2"], ["1"], ["2"])
+
+        # Act
+        graph = JustificationGraph(steps)
+
+        # Assert
+        assert graph.schedule_parents == [[], [0], [], [2]]
+        components = strongly_connected_components(graph.schedule_parents)
+        assert all(len(component) == 1 for component in components)
+
+    def test_long_chain_stays_iterative(self):
+        """Test that a 20k-step dependency chain does not hit the recursion limit"""
+        # Arrange
+        count = 20000
+        steps = _steps([], *([str(index)] for index in range(count - 1)))
+
+        # Act
+        graph = JustificationGraph(steps)
+
+        # Assert
+        assert graph.max_depth == count - 1
+        assert graph.cycles == []
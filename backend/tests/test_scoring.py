@@ -0,0 +1,95 @@
+# [T] ProofBench Backend - Result Scoring Tests
+# Tests for vectorized rescoring from stored step results
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.proof import Proof, ProofStep
+from app.services.scoring import SemanticScore, rescorable, rescore, scoring_version
+from app.services.verification import BackendProofEngine
+
+
+def _proof(count: int):
+    """Mock proof with `count` independent steps"""
+    proof = MagicMock(spec=Proof)
+    proof.id = 1
+    proof.domain = "algebra"
+    proof.steps = []
+    for index in range(count):
+        step = MagicMock(spec=ProofStep)
+        step.id = index + 1
+        step.step_index = index
+        step.claim = f"claim {index}"
+        step.equation = {"lhs": "x", "rhs": "x"}
+        step.dependencies = []
+        proof.steps.append(step)
+    return proof
+
+
+@pytest.mark.asyncio
+class TestRescore:
+    """Test suite for rescoring stored results"""
+
+    async def test_rescore_matches_engine(self):
+        """Test that rescoring with unchanged settings reproduces the engine's scores"""
+        # Arrange
+        engine = BackendProofEngine()
+        proof = _proof(3)
+        verdicts = {0: (True, "passed"), 1: (False, "failed"), 2: (True, "passed")}
+        scores = {
+            0: {"openai": 90.0, "anthropic": 70.0},
+            1: {"openai": 40.0},
+            2: {"openai": 85.0, "anthropic": 95.0},
+        }
+        engine._symbolic_outcome = AsyncMock(side_effect=lambda step, domain, deadline=None: verdicts[step.step_index])
+        engine._evaluate_semantic = AsyncMock(
+            side_effect=lambda step, domain, deadline=None, context=None: SemanticScore.from_providers(scores[step.step_index])
+        )
+        result = await engine.evaluate(proof)
+
+        # Act
+        [rescored] = rescore([result["step_results"]], engine.symbolic_weight, engine.semantic_weight, engine.pass_threshold)
+
+        # Assert
+        assert result["step_results"][0]["provider_scores"] == scores[0]
+        for field in ("is_valid", "lii_score", "confidence_interval", "coherence_score", "step_results"):
+            assert rescored[field] == result[field]
+        assert result["scoring_version"] == scoring_version(
+            engine.symbolic_weight, engine.semantic_weight, engine.pass_threshold
+        )
+
+    async def test_rescore_applies_new_weights_per_result(self):
+        """Test that each result in a batch is rescored from its own steps"""
+        # Arrange
+        passing = [
+            {"step_index": 0, "symbolic_pass": True, "symbolic_status": "passed", "semantic_score": 60.0,
+             "semantic_status": "evaluated", "provider_scores": {"openai": 50.0, "anthropic": 70.0},
+             "dependencies_valid": True, "hybrid_score": 88.0},
+        ]
+        unfinished = [
+            {"step_index": 0, "symbolic_pass": True, "symbolic_status": "passed", "semantic_score": 100.0,
+             "semantic_status": "default", "provider_scores": None, "dependencies_valid": True, "hybrid_score": 100.0},
+            {"step_index": 1, "symbolic_pass": None, "symbolic_status": "not_evaluated", "semantic_score": None,
+             "semantic_status": "not_evaluated", "dependencies_valid": None, "hybrid_score": None},
+        ]
+
+        # Act
+        first, second = rescore([passing, unfinished], 0.5, 0.5, 80.0)
+
+        # Assert
+        assert first["lii_score"] == 80.0
+        assert first["is_valid"] is True
+        assert first["step_results"][0]["hybrid_score"] == 80.0
+        assert first["confidence_interval"] == [75.0, 85.0]
+        assert second["lii_score"] == 100.0
+        assert second["is_valid"] is False
+        assert second["step_results"][1] == unfinished[1]
+
+    async def test_skipped_steps_are_not_rescorable(self):
+        """Test that decide-fast results (LII bounds) are left for re-verification"""
+        # Arrange
+        step_results = [{"step_index": 0, "semantic_score": None, "semantic_status": "skipped"}]
+
+        # Act / Assert
+        assert rescorable(step_results) is False
+        assert rescore([], 0.7, 0.3, 70.0) == []
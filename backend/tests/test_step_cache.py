@@ -0,0 +1,136 @@
+# [T] ProofBench Backend - Step Result Cache Tests
+# Tests for step cache keys, eviction, expiry and hit-rate statistics
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.services.step_cache import (
+    StepResultCache, scoring_config_version, step_cache_key, symbolic_cache_key
+)
+from app.services.symbolic.hashing import equation_hash
+
+
+def _step(claim="Distributive property", equation=None, reasoning="Expand"):
+    """Step with the fields the cache key reads"""
+    return SimpleNamespace(
+        claim=claim,
+        equation=equation if equation is not None else {"lhs": "2*(x+3)", "rhs": "2*x+6"},
+        reasoning=reasoning,
+    )
+
+
+class TestStepCacheKey:
+    """Test suite for step cache keys"""
+
+    def test_formatting_does_not_change_key(self):
+        """Test that whitespace and case differences map to the same key"""
+        # Arrange
+        version = scoring_config_version(["openai"])
+        a = _step()
+        b = _step(claim="  distributive   PROPERTY ", equation={"lhs": "2 * ( x + 3 )", "rhs": "2*x + 6"})
+
+        # Act / Assert
+        assert step_cache_key(a, "algebra", version) == step_cache_key(b, "Algebra", version)
+
+    def test_domain_equation_and_config_change_key(self):
+        """Test that the domain, equation and scoring configuration are part of the key"""
+        # Arrange
+        version = scoring_config_version(["openai"])
+        key = step_cache_key(_step(), "algebra", version)
+
+        # Act / Assert
+        assert step_cache_key(_step(), "calculus", version) != key
+        assert step_cache_key(_step(equation={"lhs": "2*(x+3)", "rhs": "2*x+5"}), "algebra", version) != key
+        assert step_cache_key(_step(), "algebra", scoring_config_version(["openai", "anthropic"])) != key
+
+
+    def test_symbolic_key_depends_on_equation_only(self):
+        """Test that the symbolic key ignores the claim and the order of sides and terms"""
+        # Arrange
+        key = symbolic_cache_key(equation_hash("x + 5", "2*x", "algebra"))
+
+        # Act / Assert
+        assert symbolic_cache_key(equation_hash("2*x", "5 + x", "Algebra")) == key
+        assert symbolic_cache_key(equation_hash("x + 5", "2*x", "calculus")) != key
+        assert step_cache_key(_step(), "algebra", scoring_config_version(["openai"])) != key
+
+
+class TestStepResultCache:
+    """Test suite for the step result cache"""
+
+    def test_hit_rates_per_tier(self):
+        """Test that symbolic and semantic lookups are counted separately"""
+        # Arrange
+        cache = StepResultCache(maxsize=10, ttl=60)
+        cache.put_symbolic("a", (True, "passed"))
+
+        # Act
+        symbolic = cache.get_symbolic("a")
+        semantic = cache.get_semantic("a")
+        cache.put_semantic("a", {"openai": 80.0})
+
+        # Assert
+        assert symbolic == (True, "passed")
+        assert semantic is None
+        assert cache.get_semantic("a") == {"openai": 80.0}
+        stats = cache.get_stats()
+        assert stats["symbolic_hit_rate"] == 1.0
+        assert stats["semantic_hits"] == 1
+        assert stats["semantic_misses"] == 1
+
+    def test_limit_outcomes_are_not_cached(self):
+        """Test that timeouts and other limit hits are recomputed next time"""
+        # Arrange
+        cache = StepResultCache(maxsize=10, ttl=60)
+
+        # Act
+        cache.put_symbolic("a", (False, "timeout"))
+        cache.put_semantic("b", {})
+
+        # Assert
+        assert cache.get_symbolic("a") is None
+        assert cache.get_semantic("b") is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test that the entry used longest ago is evicted first"""
+        # Arrange
+        cache = StepResultCache(maxsize=2, ttl=60)
+        cache.put_symbolic("a", (True, "passed"))
+        cache.put_symbolic("b", (True, "passed"))
+        cache.get_symbolic("a")
+
+        # Act
+        cache.put_symbolic("c", (False, "failed"))
+
+        # Assert
+        assert cache.get_symbolic("b") is None
+        assert cache.get_symbolic("a") == (True, "passed")
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_entries_expire(self):
+        """Test that entries older than the TTL are dropped on lookup"""
+        # Arrange
+        cache = StepResultCache(maxsize=10, ttl=60)
+        with patch("app.services.step_cache.time.monotonic", return_value=1000.0):
+            cache.put_symbolic("a", (True, "passed"))
+
+        # Act
+        with patch("app.services.step_cache.time.monotonic", return_value=1061.0):
+            value = cache.get_symbolic("a")
+
+        # Assert
+        assert value is None
+        assert cache.get_stats()["expirations"] == 1
+
+    def test_zero_size_disables_cache(self):
+        """Test that a size of 0 keeps nothing"""
+        # Arrange
+        cache = StepResultCache(maxsize=0, ttl=60)
+
+        # Act
+        cache.put_symbolic("a", (True, "passed"))
+
+        # Assert
+        assert cache.get_symbolic("a") is None
+        assert cache.get_stats()["enabled"] is False
@@ -1,9 +1,25 @@
 # [B] ProofBench Backend - Symbolic Verifier Tests
 # Unit tests for SymPy-based symbolic verification
 
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
 import pytest
+import sympy
 
 from app.services.symbolic_verifier import BackendSymbolicVerifier
+from app.services.symbolic.hashing import equation_hash, parse_unevaluated, structural_hash
+from app.services.symbolic.ladder import DEFAULT_LADDER, run_ladder
+from app.services.symbolic.logic import logic_equivalence_check, parse_formula
+from app.services.symbolic.numeric import numeric_identity_check
+from app.services.symbolic.polynomial import modular_identity_check, rational_degree_bound
+from app.services.symbolic.parse_cache import ExpressionCache, normalize_source
+from app.services.symbolic.pool import SymbolicExecutionPool
+from app.services.symbolic.results import SymbolicOutcome, SymbolicCheckError, SymbolicLimitExceeded
+from app.services.symbolic import store as store_module
+from app.services.symbolic import worker
+from app.services.symbolic.store import EquivalenceStore, store_key
 
 
 @pytest.mark.asyncio
@@ -136,3 +152,534 @@ class TestSymbolicVerifier:
 
         # Assert
         assert result is True
+
+    async def test_check_equation_structured_result(self, verifier):
+        """Test that pool jobs return a structured result"""
+        # Act
+        result = await verifier.check_equation("x + 5", "5 + x", "algebra")
+
+        # Assert
+        assert result["status"] == SymbolicOutcome.EQUAL
+        assert result["method"]
+        assert result["duration_ms"] >= 0
+
+    async def test_check_equation_invalid_syntax(self, verifier):
+        """Test that unparseable input is reported as invalid"""
+        # Act
+        result = await verifier.check_equation("x +* (", "1", "algebra")
+
+        # Assert
+        assert result["status"] == SymbolicOutcome.INVALID
+
+    async def test_check_errors_are_not_verdicts(self, verifier):
+        """Test that SymPy and pool errors raise instead of reporting the equation as wrong"""
+        # Arrange
+        error = {"status": SymbolicOutcome.ERROR, "method": "ladder", "duration_ms": 1.0, "detail": "boom"}
+
+        # Act / Assert
+        with patch.object(verifier, "check_equation", AsyncMock(return_value=error)):
+            with pytest.raises(SymbolicCheckError) as raised:
+                await verifier.verify_equation("x", "x")
+        assert raised.value.outcome == SymbolicOutcome.ERROR
+        with patch.object(verifier, "check_equation", AsyncMock(side_effect=RuntimeError("pool restarting"))):
+            with pytest.raises(SymbolicCheckError):
+                await verifier.verify_equation("x", "x")
+
+    async def test_event_loop_not_blocked(self, verifier):
+        """Test that symbolic checks run off the event loop"""
+        # Arrange
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker_task = asyncio.create_task(ticker())
+
+        # Act
+        result = await verifier.verify_equation("(x + 1)**12", "expand((x + 1)**12)")
+        ticker_task.cancel()
+
+        # Assert
+        assert result is True
+        assert ticks > 0
+
+    async def test_simplify_expression(self, verifier):
+        """Test simplification through the symbolic pool"""
+        # Act
+        result = await verifier.simplify_expression("x + x")
+
+        # Assert
+        assert result == "2*x"
+
+    async def test_parse_and_validate_runs_in_pool(self, verifier):
+        """Test that parsing is dispatched to the symbolic pool"""
+        # Arrange
+        x = sympy.Symbol("x")
+
+        # Act
+        with patch.object(verifier.pool, "parse", wraps=verifier.pool.parse) as pool_parse:
+            parsed = await verifier.parse_and_validate("2x + 1")
+            invalid = await verifier.parse_and_validate("x +* (")
+
+        # Assert
+        assert parsed == 2 * x + 1
+        assert invalid is None
+        assert pool_parse.await_count == 2
+
+    async def test_verify_steps_dedupes_and_keeps_order(self, verifier):
+        """Test that identical equations are checked once and results stay in step order"""
+        # Arrange
+        equations = [
+            "x + x = 2*x",
+            {"lhs": "x*2", "rhs": "x + x"},  # Same equation, reordered
+            "x + 1 = x + 2",
+            None,
+            "2*x = x + x",
+        ]
+        steps = [
+            SimpleNamespace(id=i, step_index=i, equation=equation)
+            for i, equation in enumerate(equations)
+        ]
+
+        # Act
+        with patch.object(verifier, "verify_equation", wraps=verifier.verify_equation) as spy:
+            result = await verifier.verify_steps(steps, concurrency=2)
+
+        # Assert
+        assert spy.await_count == 2
+        assert [d["step_index"] for d in result["details"]] == [0, 1, 2, 3, 4]
+        assert [d["symbolically_valid"] for d in result["details"]] == [True, True, False, True, True]
+        assert result["valid_count"] == 4
+        assert result["score"] == 80.0
+
+    async def test_timeout_outcome(self):
+        """Test that a slow check is stopped and reported as a timeout"""
+        # Arrange
+        pool = SymbolicExecutionPool(max_workers=1, timeout=0.5)
+        pool.options["polynomial_fastpath"] = False  # Would decide this instantly
+        verifier = BackendSymbolicVerifier(pool=pool)
+
+        try:
+            # Act
+            result = await verifier.check_equation(
+                "(x + 1)**5000 - (x - 1)**5000", "(x + 2)**4999", "algebra"
+            )
+
+            # Assert
+            assert result["status"] == SymbolicOutcome.TIMEOUT
+            with pytest.raises(SymbolicLimitExceeded):
+                await verifier.verify_equation("(x + 1)**5000 - (x - 1)**5000", "(x + 2)**4999")
+
+            # Pool keeps serving jobs after a limit violation
+            assert await verifier.verify_equation("x + 5", "5 + x") is True
+        finally:
+            pool.shutdown()
+
+    async def test_numeric_tier_rejects_mismatch(self, verifier):
+        """Test that obvious mismatches are decided by the numeric pre-check"""
+        # Act
+        result = await verifier.check_equation("sin(x)", "cos(x)", "algebra")
+
+        # Assert
+        assert result["status"] == SymbolicOutcome.NOT_EQUAL
+        assert result["method"] == "numeric"
+
+    async def test_numeric_policy_accept(self):
+        """Test that the 'accept' policy returns probably-equal on agreement"""
+        # Arrange
+        pool = SymbolicExecutionPool(max_workers=1)
+        pool.options["numeric_policy"] = "accept"
+        verifier = BackendSymbolicVerifier(pool=pool)
+
+        try:
+            # Act
+            result = await verifier.check_equation("sin(2*x)", "2*sin(x)*cos(x)", "algebra")
+
+            # Assert
+            assert result["status"] == SymbolicOutcome.PROBABLY_EQUAL
+            assert result["method"] == "numeric"
+            assert await verifier.verify_equation("sin(x)**2 + cos(x)**2", "1") is True
+        finally:
+            pool.shutdown()
+
+
+class TestPolynomialFastPath:
+    """Test suite for the modular polynomial identity fast path"""
+
+    @pytest.mark.parametrize("backend", ["python", "flint"])
+    def test_rational_identities(self, backend):
+        """Test exact decisions on polynomial and rational identities"""
+        if backend == "flint":
+            pytest.importorskip("flint")
+        x, y = sympy.symbols("x y")
+
+        assert modular_identity_check((x + y)**7, sympy.expand((x + y)**7), backend=backend) is True
+        assert modular_identity_check((x**2 - 1) / (x - 1), x + 1, backend=backend) is True
+        assert modular_identity_check(1 / x + 1 / y, (x + y) / (x * y), backend=backend) is True
+        assert modular_identity_check((x + 1)**2, x**2 + 1, backend=backend) is False
+        assert modular_identity_check((x + 1)**100000, (x + 1)**100000 + 1, backend=backend) is False
+
+    def test_detector_rejects_non_rational(self):
+        """Test that non-rational expressions fall back to the general path"""
+        x = sympy.Symbol("x")
+
+        assert rational_degree_bound(x**3 / (x + 1)) == (3, 1)
+        assert rational_degree_bound(sympy.sin(x)) is None
+        assert rational_degree_bound(sympy.sqrt(x)) is None
+        assert rational_degree_bound(sympy.Float(0.5) * x) is None
+        assert modular_identity_check(sympy.sin(x)**2 + sympy.cos(x)**2, sympy.Integer(1)) is None
+
+    def test_degree_bound_too_high(self):
+        """Test that identities beyond the safe degree are left undecided"""
+        x = sympy.Symbol("x")
+        assert modular_identity_check(x**(2**40), x**(2**40) + 1) is None
+
+    @pytest.mark.asyncio
+    async def test_verifier_uses_fast_path(self):
+        """Test that polynomial equations are decided by the fast path"""
+        # Arrange
+        verifier = BackendSymbolicVerifier()
+
+        # Act
+        result = await verifier.check_equation("(a + b)**12", "expand((a + b)**12)", "algebra")
+
+        # Assert
+        assert result["status"] == SymbolicOutcome.EQUAL
+        assert result["method"] == "polynomial"
+
+
+class TestLogicEquivalence:
+    """Test suite for the propositional logic engine"""
+
+    @pytest.mark.parametrize("max_vars", [24, 0])
+    @pytest.mark.parametrize("lhs,rhs,expected", [
+        ("P >> Q", "~Q >> ~P", True),
+        ("~(a & b)", "~a | ~b", True),
+        ("a ^ b ^ c", "Xor(c, b, a)", True),
+        ("ITE(a, b, c)", "(a & b) | (~a & c)", True),
+        ("Equivalent(a, b)", "a ^ b", False),
+        ("a & (b | c)", "(a & b) | (a | c)", False),
+    ])
+    def test_truth_table_and_sat_agree(self, lhs, rhs, expected, max_vars):
+        """Test equivalence decisions by truth table (24) and SAT fallback (0)"""
+        equivalent, method, counterexample = logic_equivalence_check(
+            parse_formula(lhs), parse_formula(rhs), max_vars=max_vars
+        )
+
+        assert equivalent is expected
+        assert method == ("truth_table" if max_vars else "sat")
+        assert (counterexample is None) is expected
+
+    def test_counterexample_distinguishes_sides(self):
+        """Test that the reported assignment really separates the formulas"""
+        # Arrange
+        lhs, rhs = parse_formula("a & (b | c)"), parse_formula("(a & b) | (a | c)")
+
+        # Act
+        _, _, counterexample = logic_equivalence_check(lhs, rhs)
+
+        # Assert
+        values = {sympy.Symbol(name): value for name, value in counterexample.items()}
+        assert bool(lhs.subs(values)) != bool(rhs.subs(values))
+
+    def test_wide_formula_uses_sat(self):
+        """Test that formulas beyond the truth-table limit are decided by SAT"""
+        # Arrange
+        chain = " & ".join(f"(x{i} | ~x{i + 1})" for i in range(30))
+        reordered = " & ".join(f"(~x{i + 1} | x{i})" for i in reversed(range(30)))
+
+        # Act
+        equivalent, method, _ = logic_equivalence_check(parse_formula(chain), parse_formula(reordered))
+
+        # Assert
+        assert equivalent is True
+        assert method == "sat"
+
+    @pytest.mark.asyncio
+    async def test_verifier_routes_logic_domain(self):
+        """Test domain routing: formulas use the logic engine, algebra falls through"""
+        # Arrange
+        verifier = BackendSymbolicVerifier()
+
+        # Act
+        formula = await verifier.check_equation("P >> Q", "~P | Q", "logic")
+        algebra = await verifier.check_equation("x + x", "2*x", "logic")
+
+        # Assert
+        assert formula["status"] == SymbolicOutcome.EQUAL
+        assert formula["method"] == "truth_table"
+        assert algebra["status"] == SymbolicOutcome.EQUAL
+
+
+class TestNumericIdentityCheck:
+    """Test suite for the randomized numeric pre-check"""
+
+    def test_identity_agrees(self):
+        """Test agreement for a true identity"""
+        x = sympy.Symbol("x")
+        assert numeric_identity_check(sympy.sin(x)**2 + sympy.cos(x)**2, sympy.Integer(1)) is True
+
+    def test_mismatch_detected(self):
+        """Test clear mismatch for a false identity"""
+        x = sympy.Symbol("x")
+        assert numeric_identity_check(sympy.sin(x)**2, sympy.cos(x)**2) is False
+        assert numeric_identity_check(x**2, x**3) is False
+
+    def test_unsupported_function_is_inconclusive(self):
+        """Test that expressions NumPy cannot evaluate do not produce a verdict"""
+        x = sympy.Symbol("x")
+        f = sympy.Function("f")
+        assert numeric_identity_check(f(x) + x, x + f(x)) is None
+
+
+class TestSimplificationLadder:
+    """Test suite for the staged simplification ladder"""
+
+    def test_polynomial_settled_by_expand(self):
+        """Test that polynomial identities stop at the expand stage"""
+        x, y = sympy.symbols("x y")
+        outcome = run_ladder((x + y)**2 - (x**2 + 2*x*y + y**2), DEFAULT_LADDER, {})
+        assert outcome.is_zero is True
+        assert outcome.stage == "expand"
+
+    def test_trig_identity_reaches_trigsimp(self):
+        """Test that trigonometric identities are settled by trigsimp"""
+        x = sympy.Symbol("x")
+        outcome = run_ladder(sympy.sin(x)**2 + sympy.cos(x)**2 - 1, DEFAULT_LADDER, {})
+        assert outcome.is_zero is True
+        assert outcome.stage == "trigsimp"
+
+    def test_non_identity_runs_full_ladder(self):
+        """Test that non-identities are only rejected after the last stage"""
+        x = sympy.Symbol("x")
+        outcome = run_ladder(x + 1 - x**2, DEFAULT_LADDER, {})
+        assert outcome.is_zero is False
+        assert outcome.stage == "simplify"
+
+    def test_stage_budget_exceeded(self):
+        """Test that a stage over budget is skipped and recorded"""
+        x, y, z = sympy.symbols("x y z")
+        outcome = run_ladder((x + y + z)**80 - x, ["expand"], {"expand": 0.05})
+        assert outcome.is_zero is None
+        assert outcome.timed_out == ["expand"]
+
+
+class TestExpressionCache:
+    """Test suite for the parsed-expression LRU cache"""
+
+    def test_normalize_source_whitespace(self):
+        """Test that whitespace variants share one key"""
+        assert normalize_source("x+5") == normalize_source("  x  +   5 ")
+        assert normalize_source("x y") != normalize_source("xy")
+
+    def test_hits_and_misses(self):
+        """Test hit/miss counters"""
+        # Arrange
+        cache = ExpressionCache(maxsize=10)
+
+        # Act
+        first = cache.get_or_parse("x + 1", sympy.sympify)
+        second = cache.get_or_parse("x+1", sympy.sympify)
+
+        # Assert
+        assert first is second
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted"""
+        # Arrange
+        cache = ExpressionCache(maxsize=2)
+        cache.get_or_parse("a", sympy.sympify)
+        cache.get_or_parse("b", sympy.sympify)
+        cache.get_or_parse("a", sympy.sympify)
+
+        # Act
+        cache.get_or_parse("c", sympy.sympify)
+        cache.get_or_parse("a", sympy.sympify)
+        cache.get_or_parse("b", sympy.sympify)
+
+        # Assert
+        assert cache.evictions == 2
+        assert cache.get_stats()["hits"] == 2
+
+    def test_parse_errors_not_cached(self):
+        """Test that failed parses are not stored"""
+        # Arrange
+        cache = ExpressionCache(maxsize=10)
+
+        # Act / Assert
+        with pytest.raises(Exception):
+            cache.get_or_parse("x +* (", sympy.sympify)
+        assert cache.get_stats()["size"] == 0
+
+
+    def test_factorial_notation_parses(self):
+        """Test that postfix factorials survive normalization (the key is not what gets parsed)"""
+        # Arrange
+        n = sympy.Symbol("n")
+
+        # Act
+        single = worker.parse("n!")
+        double = worker.parse("n!!")
+        binomial = worker.parse("10!/(5!*5!)")
+
+        # Assert
+        assert single == sympy.factorial(n)
+        assert double == sympy.factorial2(n)
+        assert binomial == 252
+        assert worker.parse("n!") is single
+
+class TestStructuralHash:
+    """Test suite for commutativity-invariant structural hashing"""
+
+    def test_commutative_operands_hash_equally(self):
+        """Test that operand order of + and * does not change the hash"""
+        assert structural_hash(parse_unevaluated("x + 5")) == structural_hash(parse_unevaluated("5 + x"))
+        assert structural_hash(parse_unevaluated("2*x")) == structural_hash(parse_unevaluated("x*2"))
+        assert structural_hash(parse_unevaluated("(a + b) + c")) == \
+            structural_hash(parse_unevaluated("a + (c + b)"))
+
+    def test_structure_is_preserved(self):
+        """Test that non-commutative structure and values are distinguished"""
+        assert structural_hash(parse_unevaluated("x**2")) != structural_hash(parse_unevaluated("2**x"))
+        assert structural_hash(parse_unevaluated("x - y")) != structural_hash(parse_unevaluated("y - x"))
+        assert structural_hash(parse_unevaluated("x - x")) != structural_hash(parse_unevaluated("0"))
+
+    def test_deep_tree_does_not_recurse(self):
+        """Test that very deep trees are hashed iteratively"""
+        # Arrange
+        f = sympy.Function("f")
+        expr = sympy.Symbol("x")
+        for _ in range(5000):
+            expr = f(expr, evaluate=False)
+
+        # Act / Assert
+        assert len(structural_hash(expr)) == 32
+
+    def test_equation_hash(self):
+        """Test that equivalent spellings of an equation share a key"""
+        assert equation_hash("x+5", "2*x", "algebra") == equation_hash("x*2", "5 + x", "Algebra")
+        assert equation_hash("x+5", "2*x", "algebra") != equation_hash("x+5", "2*x", "calculus")
+        assert equation_hash("x +* 1", "1", "algebra") == equation_hash("x+*1", "1", "algebra")
+
+    @pytest.mark.asyncio
+    async def test_pool_computes_keys_under_limits(self):
+        """Test that keys are computed in the pool and hashing work is bounded by its deadline"""
+        # Arrange
+        pool = SymbolicExecutionPool(max_workers=1)
+        equations = [("x+5", "2*x"), ("expand((x + y + z + 1)**60)", "1")]
+
+        try:
+            # Act
+            keys = await pool.equation_keys(equations, "algebra", timeout=0.5)
+
+            # Assert
+            assert keys == [equation_hash("x+5", "2*x", "algebra"), None]
+            assert await pool.equation_keys([("x*2", "5 + x")], "algebra") == keys[:1]
+        finally:
+            pool.shutdown()
+
+
+class TestEquivalenceStore:
+    """Test suite for the persistent equivalence store"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create a store backed by a temporary file"""
+        store = EquivalenceStore(str(tmp_path / "verdicts.sqlite3"), max_entries=100)
+        yield store
+        store.close()
+
+    def test_round_trip_survives_reopen(self, store):
+        """Test that verdicts persist across store instances"""
+        # Arrange
+        key = equation_hash("x + x", "2*x", "algebra")
+        store.put(key, {"status": SymbolicOutcome.EQUAL, "method": "expand", "duration_ms": 4.2})
+        store.close()
+
+        # Act
+        reopened = EquivalenceStore(store.path)
+        stored = reopened.get(key)
+        reopened.close()
+
+        # Assert
+        assert stored == {"status": SymbolicOutcome.EQUAL, "method": "expand", "duration_ms": 4.2}
+
+    def test_limit_outcomes_not_stored(self, store):
+        """Test that load-dependent outcomes and errors are never persisted"""
+        # Arrange
+        key = equation_hash("a", "b", "algebra")
+
+        # Act
+        store.put(key, {"status": SymbolicOutcome.TIMEOUT, "method": "deadline", "duration_ms": 1.0})
+        store.put(key, {"status": SymbolicOutcome.ERROR, "method": "ladder", "duration_ms": 1.0})
+
+        # Assert
+        assert store.get(key) is None
+        assert store.writes == 0
+
+    def test_lru_eviction(self, store, monkeypatch):
+        """Test that the least recently used verdicts are evicted past max_entries"""
+        # Arrange
+        monkeypatch.setattr(store_module, "EVICTION_CHECK_INTERVAL", 1)
+        store.max_entries = 2
+        verdict = {"status": SymbolicOutcome.EQUAL, "method": "identity", "duration_ms": 0.1}
+        store.put("a", verdict)
+        store.put("b", verdict)
+        store.get("a")
+
+        # Act
+        store.put("c", verdict)
+
+        # Assert
+        assert store.evictions == 1
+        assert store.get("b") is None
+        assert store.get("a") is not None
+
+    @pytest.mark.asyncio
+    async def test_verifier_answers_from_store(self, store):
+        """Test that repeat checks are served from the store"""
+        # Arrange
+        verifier = BackendSymbolicVerifier(store=store)
+
+        # Act
+        first = await verifier.check_equation("(x + 1)**2", "x**2 + 2*x + 1", "algebra")
+        second = await verifier.check_equation("x**2 + 2*x + 1", "(x+1)**2", "algebra")
+
+        # Assert
+        assert first["status"] == SymbolicOutcome.EQUAL
+        assert second["status"] == SymbolicOutcome.EQUAL
+        assert second["method"] == "store"
+        assert second["stored_method"] == first["method"]
+
+    def test_key_includes_configuration(self):
+        """Test that verdicts reached under other tier options get other store keys"""
+        # Arrange
+        key = equation_hash("x + x", "2*x", "algebra")
+        options = {"numeric_policy": "escalate", "polynomial_trials": 3, "ladder": ["expand", "simplify"]}
+
+        # Act / Assert
+        assert store_key(key, dict(options)) == store_key(key, options)
+        assert store_key(key, {**options, "numeric_policy": "accept"}) != store_key(key, options)
+        assert store_key(key, {**options, "polynomial_trials": 5}) != store_key(key, options)
+        assert store_key(key, {**options, "ladder": ["simplify"]}) != store_key(key, options)
+
+    @pytest.mark.asyncio
+    async def test_probably_equal_ignored_under_escalate(self, store):
+        """Test that a numeric-only verdict stored under the accept policy is not served under escalate"""
+        # Arrange
+        verifier = BackendSymbolicVerifier(store=store)
+        accept = {**verifier.pool.options, "numeric_policy": "accept"}
+        key = store_key(equation_hash("sin(x)**2 + cos(x)**2", "1", "algebra"), accept)
+        store.put(key, {"status": SymbolicOutcome.PROBABLY_EQUAL, "method": "numeric", "duration_ms": 1.0})
+
+        # Act
+        result = await verifier.check_equation("sin(x)**2 + cos(x)**2", "1", "algebra")
+
+        # Assert
+        assert result["status"] == SymbolicOutcome.EQUAL
+        assert result["method"] != "store"
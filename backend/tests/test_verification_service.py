@@ -1,11 +1,19 @@
 # [B] ProofBench Backend - Verification Service Tests
 # Unit tests for proof verification engine
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.services.verification import BackendProofEngine
+from app.core.config import settings
+from app.services.deadline import Deadline
+from app.services.verification import (
+    BackendProofEngine, _parse_batch_scores, close_proof_engine, get_proof_engine
+)
 from app.services.llm.base import LLMResponse
+from app.services.symbolic.results import SymbolicOutcome, SymbolicCheckError, SymbolicLimitExceeded
 from app.models.proof import Proof, ProofStep
 
 
@@ -149,6 +157,476 @@ class TestBackendProofEngine:
         assert "coherence_score" in result
         assert "confidence_interval" in result
 
+    @patch('app.services.verification.BackendSymbolicVerifier.verify_equation')
+    @patch('app.services.verification.LLMAdapter.evaluate_parallel')
+    async def test_evaluate_symbolic_timeout_not_treated_as_valid(
+        self,
+        mock_llm_eval,
+        mock_symbolic_verify,
+        engine,
+        mock_proof_single_step
+    ):
+        """Test that a symbolic timeout gets a distinct step outcome"""
+        # Arrange
+        mock_symbolic_verify.side_effect = SymbolicLimitExceeded(SymbolicOutcome.TIMEOUT, "too slow")
+
+        mock_llm_response = MagicMock(spec=LLMResponse)
+        mock_llm_response.score = 90
+        mock_llm_response.provider = "openai"
+        mock_llm_eval.return_value = [mock_llm_response]
+
+        # Act
+        result = await engine.evaluate(mock_proof_single_step)
+
+        # Assert
+        step_result = result["step_results"][0]
+        assert step_result["symbolic_pass"] is False
+        assert step_result["symbolic_status"] == "timeout"
+        assert any("limits" in f["summary"] for f in result["feedback"])
+
+    @patch('app.services.verification.BackendSymbolicVerifier.verify_equation')
+    async def test_evaluate_steps_run_concurrently(self, mock_symbolic_verify, engine, monkeypatch):
+        """Test that steps overlap, stay in order and respect the global LLM limit"""
+        # Arrange
+        monkeypatch.setattr(settings, "LLM_GLOBAL_CONCURRENCY", 4)
+        mock_symbolic_verify.return_value = True
+        in_flight = 0
+        peak = 0
+
+        async def slow_llm(prompt, options):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.1)
+            in_flight -= 1
+            response = MagicMock(spec=LLMResponse)
+            response.score = 80
+            response.provider = "openai"
+            return [response]
+
+        engine.has_llm = True
+        engine.llm_adapter.evaluate_parallel = slow_llm
+
+        proof = MagicMock(spec=Proof)
+        proof.id = 3
+        proof.domain = "algebra"
+        proof.steps = []
+        for i in range(12):
+            step = MagicMock(spec=ProofStep)
+            step.id = i
+            step.step_index = i
+            step.claim = f"Step {i}"
+            step.equation = {"lhs": "x", "rhs": "x"}
+            step.reasoning = "Identity"
+            proof.steps.append(step)
+
+        # Act
+        started = time.perf_counter()
+        result = await engine.evaluate(proof)
+        elapsed = time.perf_counter() - started
+
+        # Assert
+        assert [sr["step_index"] for sr in result["step_results"]] == list(range(12))
+        assert peak == 4
+        assert elapsed < 0.1 * 12 / 2
+
+    async def test_evaluate_resumes_from_completed_steps(self, engine, mock_proof_multi_step):
+        """Test that checkpointed steps are reused and only new steps are reported"""
+        # Arrange
+        engine._symbolic_outcome = AsyncMock(return_value=(True, "passed"))
+        engine._evaluate_semantic = AsyncMock(return_value=90.0)
+        saved = {0: ((False, "failed"), 40.0)}
+        reported = []
+
+        async def on_step(step, outcome):
+            reported.append((step.step_index, outcome))
+
+        # Act
+        result = await engine.evaluate(mock_proof_multi_step, completed=saved, on_step=on_step)
+
+        # Assert
+        remaining = len(mock_proof_multi_step.steps) - 1
+        assert engine._symbolic_outcome.await_count == remaining
+        assert [index for index, _ in reported] == list(range(1, remaining + 1))
+        assert result["step_results"][0]["symbolic_pass"] is False
+        assert result["step_results"][0]["semantic_score"] == 40.0
+        assert all(sr["symbolic_pass"] for sr in result["step_results"][1:])
+
+    async def test_evaluate_deadline_marks_unfinished_steps(self, engine, mock_proof_multi_step):
+        """Test that steps unfinished at the deadline are not evaluated and the proof is not valid"""
+        # Arrange
+        engine.step_concurrency = 1
+        engine._symbolic_outcome = AsyncMock(return_value=(True, "passed"))
+        timeouts = []
+
+        async def semantic(step, domain, deadline, context=None):
+            timeouts.append(deadline.cap(settings.LLM_TIMEOUT))
+            if step.step_index > 0:
+                await asyncio.sleep(10)
+            return 95.0
+
+        engine._evaluate_semantic = semantic
+
+        # Act
+        started = time.perf_counter()
+        result = await engine.evaluate(mock_proof_multi_step, deadline=Deadline(0.2))
+        elapsed = time.perf_counter() - started
+
+        # Assert
+        statuses = [sr["symbolic_status"] for sr in result["step_results"]]
+        assert statuses[0] == "passed"
+        assert set(statuses[1:]) == {"not_evaluated"}
+        assert result["not_evaluated_steps"] == len(statuses) - 1
+        assert result["is_valid"] is False
+        assert elapsed < 1.0
+        assert timeouts[0] <= 0.2
+        assert any("deadline" in item["summary"] for item in result["feedback"])
+
+    async def test_decide_fast_skips_llm_after_symbolic_failures(self, engine, mock_proof_multi_step):
+        """Test that decide-fast mode makes no LLM calls once symbolic failures fix the verdict"""
+        # Arrange
+        engine.decide_fast = True
+        engine._symbolic_outcome = AsyncMock(return_value=(False, "failed"))
+        engine._evaluate_semantic = AsyncMock(return_value=100.0)
+
+        # Act
+        result = await engine.evaluate(mock_proof_multi_step)
+
+        # Assert
+        engine._evaluate_semantic.assert_not_awaited()
+        assert result["is_valid"] is False
+        assert result["skipped_steps"] == 2
+        assert result["lii_score"] == 30.0
+        assert {sr["semantic_status"] for sr in result["step_results"]} == {"skipped"}
+
+    async def test_decide_fast_cancels_remaining_llm_calls(self, engine, mock_proof_multi_step):
+        """Test that decide-fast mode cancels outstanding LLM calls once a pass is certain"""
+        # Arrange
+        engine.decide_fast = True
+        engine.pass_threshold = 80.0
+        engine._symbolic_outcome = AsyncMock(return_value=(True, "passed"))
+        cancelled = []
+
+        async def semantic(step, domain, deadline=None, context=None):
+            if step.step_index > 0:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(step.step_index)
+                    raise
+            return 100.0
+
+        engine._evaluate_semantic = semantic
+
+        # Act
+        result = await engine.evaluate(mock_proof_multi_step)
+
+        # Assert
+        assert cancelled == [1]
+        assert result["is_valid"] is True
+        assert result["lii_score"] == 85.0
+        assert [sr["semantic_status"] for sr in result["step_results"]] == ["evaluated", "skipped"]
+        assert result["step_results"][1]["semantic_score"] is None
+
+    async def test_unproven_policy_skips_llm_for_proven_steps(self, engine, mock_proof_multi_step):
+        """Test that the unproven policy evaluates only steps SymPy did not prove"""
+        # Arrange
+        engine.semantic_policy = "unproven"
+
+        async def symbolic(step, domain, deadline=None):
+            return (True, "passed") if step.step_index == 0 else (False, "failed")
+
+        engine._symbolic_outcome = symbolic
+        engine._evaluate_semantic = AsyncMock(return_value=50.0)
+
+        # Act
+        result = await engine.evaluate(mock_proof_multi_step)
+
+        # Assert
+        engine._evaluate_semantic.assert_awaited_once()
+        assert engine._evaluate_semantic.await_args.args[0].step_index == 1
+        proven, unproven = result["step_results"]
+        assert proven["semantic_status"] == "default"
+        assert proven["semantic_score"] == settings.SEMANTIC_DEFAULT_SCORE
+        assert unproven["semantic_status"] == "evaluated"
+        assert unproven["semantic_score"] == 50.0
+
+    async def test_sampled_policy_uses_sample_rate(self, engine, mock_proof_multi_step):
+        """Test that the sampled policy sends all or none of the proven steps at the rate bounds"""
+        # Arrange
+        engine.semantic_policy = "sampled"
+        engine._symbolic_outcome = AsyncMock(return_value=(True, "passed"))
+        engine._evaluate_semantic = AsyncMock(return_value=90.0)
+
+        # Act
+        engine.semantic_sample_rate = 0.0
+        await engine.evaluate(mock_proof_multi_step)
+        none_sampled = engine._evaluate_semantic.await_count
+        engine.semantic_sample_rate = 1.0
+        await engine.evaluate(mock_proof_multi_step)
+
+        # Assert
+        assert none_sampled == 0
+        assert engine._evaluate_semantic.await_count == len(mock_proof_multi_step.steps)
+
+    async def test_repeated_step_served_from_step_cache(self, engine, mock_proof_single_step):
+        """Test that a step seen before reuses its symbolic verdict and provider scores"""
+        # Arrange
+        engine.has_llm = True
+        engine._verify_symbolic = AsyncMock(return_value=True)
+        response = MagicMock(spec=LLMResponse)
+        response.score = 90
+        response.provider = "openai"
+        engine.llm_adapter.evaluate_parallel = AsyncMock(return_value=[response])
+
+        # Act
+        first = await engine.evaluate(mock_proof_single_step)
+        second = await engine.evaluate(mock_proof_single_step)
+
+        # Assert
+        engine._verify_symbolic.assert_awaited_once()
+        engine.llm_adapter.evaluate_parallel.assert_awaited_once()
+        assert second["step_results"] == first["step_results"]
+        stats = engine.step_cache.get_stats()
+        assert stats["symbolic_hits"] == 1
+        assert stats["semantic_hits"] == 1
+
+    async def test_commutative_variant_shares_symbolic_verdict(self, engine):
+        """Test that a reordered equation with a different claim reuses the cached verdict"""
+        # Arrange
+        engine._verify_symbolic = AsyncMock(return_value=True)
+        first = MagicMock(spec=ProofStep)
+        first.claim = "Addition is commutative"
+        first.equation = {"lhs": "x + 5", "rhs": "5 + x"}
+        second = MagicMock(spec=ProofStep)
+        second.claim = "Swap the terms"
+        second.equation = "5 + x = x + 5"
+
+        # Act
+        outcomes = [await engine._symbolic_outcome(step, "algebra") for step in (first, second)]
+
+        # Assert
+        assert outcomes == [(True, "passed"), (True, "passed")]
+        engine._verify_symbolic.assert_awaited_once()
+        assert engine.step_cache.get_stats()["symbolic_hits"] == 1
+
+    async def test_symbolic_errors_not_cached(self, engine):
+        """Test that a check that failed without a verdict is reported as an error and retried"""
+        # Arrange
+        engine._verify_symbolic = AsyncMock(side_effect=[SymbolicCheckError(SymbolicOutcome.ERROR, "pool broke"), True])
+        step = MagicMock(spec=ProofStep)
+        step.claim = "Addition is commutative"
+        step.equation = {"lhs": "x + 5", "rhs": "5 + x"}
+
+        # Act
+        first = await engine._symbolic_outcome(step, "algebra")
+        second = await engine._symbolic_outcome(step, "algebra")
+
+        # Assert
+        assert first == (False, "error")
+        assert second == (True, "passed")
+        assert engine._verify_symbolic.await_count == 2
+
+    async def test_symbolic_outcome_without_equation(self, engine):
+        """Test that steps without an equation are reported as no_equation, not checked"""
+        # Arrange
+        step = MagicMock(spec=ProofStep)
+        step.id = 1
+        step.equation = None
+        engine._verify_symbolic = AsyncMock()
+
+        # Act
+        outcome = await engine._symbolic_outcome(step, "algebra")
+
+        # Assert
+        assert outcome == (True, "no_equation")
+        engine._verify_symbolic.assert_not_awaited()
+        engine.semantic_policy = "unproven"
+        assert engine._needs_semantic(step, outcome) is True
+
+    async def test_batched_semantic_evaluation(self, engine, mock_proof_multi_step):
+        """Test that batched mode sends one prompt per provider and retries malformed entries"""
+        # Arrange
+        engine.semantic_batch_size = 8
+        engine.has_llm = True
+        engine._symbolic_outcome = AsyncMock(return_value=(True, "passed"))
+        responses = []
+        for provider, raw in (
+            ("openai", '{"steps": [{"step": 1, "score": 90, "reasoning": "ok"}, {"step": 2, "score": "high"}]}'),
+            ("anthropic", '```json\n{"steps": [{"step": 1, "score": 70, "reasoning": "ok"}]}\n```'),
+        ):
+            response = MagicMock(spec=LLMResponse)
+            response.provider = provider
+            response.raw_response = raw
+            responses.append(response)
+        engine.llm_adapter.evaluate_parallel = AsyncMock(return_value=responses)
+        engine._evaluate_semantic = AsyncMock(return_value=60.0)
+
+        # Act
+        result = await engine.evaluate(mock_proof_multi_step)
+
+        # Assert
+        engine.llm_adapter.evaluate_parallel.assert_awaited_once()
+        prompt, options = engine.llm_adapter.evaluate_parallel.await_args.args
+        assert "### Step 2" in prompt
+        assert options.system_message is not None
+        engine._evaluate_semantic.assert_awaited_once()
+        assert engine._evaluate_semantic.await_args.args[0].step_index == 1
+        assert [sr["semantic_score"] for sr in result["step_results"]] == [80.0, 60.0]
+
+    async def test_dependent_step_gets_parent_result_as_context(self, engine, mock_proof_multi_step):
+        """Test that a dependent step starts after its parent's symbolic check and sees its result"""
+        # Arrange
+        step1, step2 = mock_proof_multi_step.steps
+        step1.dependencies = []
+        step2.dependencies = ["0"]
+        order = []
+
+        async def symbolic(step, domain, deadline=None):
+            if step.step_index == 0:
+                await asyncio.sleep(0.05)
+            order.append(step.step_index)
+            return True, "passed"
+
+        engine._symbolic_outcome = symbolic
+        engine._evaluate_semantic = AsyncMock(return_value=90.0)
+
+        # Act
+        result = await engine.evaluate(mock_proof_multi_step)
+
+        # Assert
+        assert order == [0, 1]
+        contexts = {
+            call.args[0].step_index: call.kwargs["context"]
+            for call in engine._evaluate_semantic.await_args_list
+        }
+        assert contexts[0] is None
+        assert contexts[1] == [(step1, (True, "passed"))]
+        assert result["is_valid"] is True
+        assert result["dependency_graph"]["max_depth"] == 1
+
+    async def test_circular_dependencies_invalidate_proof(self, engine, mock_proof_multi_step):
+        """Test that steps justifying each other are flagged and the proof is not valid"""
+        # Arrange
+        step1, step2 = mock_proof_multi_step.steps
+        step1.dependencies = ["1"]
+        step2.dependencies = ["0"]
+        engine._symbolic_outcome = AsyncMock(return_value=(True, "passed"))
+        engine._evaluate_semantic = AsyncMock(return_value=95.0)
+
+        # Act
+        result = await engine.evaluate(mock_proof_multi_step)
+
+        # Assert
+        assert engine._evaluate_semantic.await_count == 2
+        assert result["is_valid"] is False
+        assert result["dependency_graph"]["cycles"] == [[0, 1]]
+        assert [sr["dependencies_valid"] for sr in result["step_results"]] == [False, False]
+        assert any("Circular" in item["summary"] for item in result["feedback"])
+
+    async def test_build_evaluation_prompt_lists_dependencies(self, engine):
+        """Test that parent steps and their symbolic results appear in the prompt"""
+        # Arrange
+        step = MagicMock(spec=ProofStep)
+        step.claim = "Therefore x = 5"
+        step.equation = {"lhs": "x", "rhs": "5"}
+        step.reasoning = "Subtract 5"
+        parent = MagicMock(spec=ProofStep)
+        parent.claim = "x + 5 = 10"
+        parent.equation = {"lhs": "x + 5", "rhs": "10"}
+
+        # Act
+        prompt = engine._build_evaluation_prompt(step, "algebra", [(parent, (False, "failed"))])
+
+        # Assert
+        assert "**Depends on**" in prompt
+        assert "x + 5 = 10" in prompt
+        assert "symbolic check: failed" in prompt
+
+    async def test_parse_batch_scores_drops_malformed_entries(self):
+        """Test that unknown step numbers, bad scores and duplicates are dropped"""
+        # Arrange
+        raw = (
+            '{"steps": [{"step": 1, "score": 95}, {"step": 1, "score": 10}, {"step": 3, "score": 50},'
+            ' {"step": 2, "score": 101}, {"step": true, "score": 40}, "junk"]}'
+        )
+
+        # Act
+        scores = _parse_batch_scores(raw, 3)
+
+        # Assert
+        assert scores == {0: 95.0, 2: 50.0}
+        assert _parse_batch_scores("not json", 3) == {}
+
+    async def test_shared_engine_lifecycle(self):
+        """Test that the shared engine is reused and closes its provider clients"""
+        # Arrange
+        shared = get_proof_engine()
+        provider = MagicMock()
+        provider.aclose = AsyncMock()
+        shared.llm_adapter.services["openai"] = provider
+
+        # Act
+        same = get_proof_engine()
+        await close_proof_engine()
+
+        # Assert
+        assert same is shared
+        provider.aclose.assert_awaited_once()
+        assert get_proof_engine() is not shared
+        await close_proof_engine()
+
+    async def test_background_verification_uses_shared_sessions(self, monkeypatch):
+        """Test that background verification draws short sessions from the shared pool"""
+        # Arrange
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+        from sqlalchemy.pool import StaticPool
+        from app import crud
+        from app.db import base as db_base
+        from app.schemas.proof import ProofCreate
+        from app.services import verification
+
+        db_engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        async with db_engine.begin() as conn:
+            await conn.run_sync(db_base.Base.metadata.create_all)
+        session_maker = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+        monkeypatch.setattr(db_base, "async_session_maker", session_maker)
+
+        async with session_maker() as db:
+            db_proof = await crud.proof.create_with_steps(db=db, obj_in=ProofCreate(
+                domain="algebra",
+                steps=[{"claim": "c", "equation": {"lhs": "x", "rhs": "x"}, "reasoning": "r"}],
+            ))
+
+        shared = MagicMock()
+        shared.evaluate = AsyncMock(return_value={
+            "is_valid": True,
+            "lii_score": 90.0,
+            "confidence_interval": [85.0, 95.0],
+            "coherence_score": 100.0,
+            "step_results": [],
+            "feedback": [],
+        })
+        monkeypatch.setattr(verification, "get_proof_engine", lambda: shared)
+        completed = verification.get_verification_stats()["completed"]
+
+        # Act
+        await verification.run_proof_verification(db_proof.id)
+
+        # Assert
+        async with session_maker() as db:
+            stored = await crud.proof.get(db=db, id=db_proof.id)
+        assert stored.status == "completed"
+        assert stored.result.lii_score == 90.0
+        stats = verification.get_verification_stats()
+        assert stats["completed"] == completed + 1
+        assert stats["active"] == 0 and stats["waiting"] == 0
+        await db_engine.dispose()
+
     async def test_calculate_coherence_single_step(self, engine):
         """Test coherence calculation for single step"""
         # Act
@@ -257,7 +735,7 @@ class TestBackendProofEngine:
 
         # Assert
         assert result is True
-        mock_verify.assert_called_once_with("x+1", "1+x")
+        mock_verify.assert_called_once_with("x+1", "1+x", "algebra", timeout=None)
 
     @patch('app.services.verification.BackendSymbolicVerifier.verify_equation')
     async def test_verify_symbolic_string_equation(self, mock_verify, engine):
@@ -0,0 +1,49 @@
+# [*] ProofBench Backend - Verification Worker Entry Point
+# Standalone queue worker process (run any number, on any node)
+
+import argparse
+import asyncio
+import signal
+
+from app.core.config import settings
+from app.db import base as db_base
+from app.services.job_queue import VerificationWorker
+from app.services.symbolic.pool import symbolic_pool
+from app.services.verification import close_proof_engine, get_proof_engine
+
+
+async def main(worker_id: str = None, concurrency: int = None) -> None:
+    """
+    Run a verification queue worker until SIGINT/SIGTERM.
+
+    Pending proofs are claimed from settings.DATABASE_URL; on shutdown the
+    worker stops claiming and lets in-flight verifications finish.
+
+    Args:
+        worker_id: Lease owner ID (default: settings.WORKER_ID or host:pid:random)
+        concurrency: Verifications in flight (default: settings.MAX_CONCURRENT_VERIFICATIONS)
+    """
+    await db_base.init_db(settings.DATABASE_URL)
+    await symbolic_pool.warm_up()
+    get_proof_engine()
+
+    worker = VerificationWorker(worker_id=worker_id, concurrency=concurrency)
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await close_proof_engine()
+        symbolic_pool.shutdown()
+        await db_base.async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ProofBench verification queue worker")
+    parser.add_argument("--worker-id", default=None, help="Lease owner ID")
+    parser.add_argument("--concurrency", type=int, default=None, help="Verifications in flight")
+    args = parser.parse_args()
+
+    asyncio.run(main(worker_id=args.worker_id, concurrency=args.concurrency))